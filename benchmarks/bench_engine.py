@@ -0,0 +1,56 @@
+"""
+Benchmark the scaling of the uORF feature engine with the number of worker processes.
+
+Run with:
+
+```shell
+python benchmarks/bench_engine.py
+```
+
+The engine runs with `workers=1` first, then with the workers doubled up to the number of CPUs of the machine
+(at least 2), and reports the speedup of each run over `workers=1`.
+"""
+import os
+import random
+import time
+
+import pandas as pd
+
+from utrfx.uorf_engine import UORFFeatureEngine
+
+N_UTRS = 200_000
+CHUNK_SIZE = 5_000
+
+
+def worker_counts():
+    n_workers = max(os.cpu_count() or 1, 2)
+    workers = 1
+    while workers < n_workers:
+        yield workers
+        workers *= 2
+    yield n_workers
+
+
+def main():
+    rng = random.Random(0)
+    # 5'UTR lengths with a median of ~200 nucleotides.
+    utrs = {f"TX{i}": "".join(rng.choices("ACGT", k=int(rng.lognormvariate(5.3, 0.8)))) for i in range(N_UTRS)}
+
+    print(f"{os.cpu_count()} CPU(s), {N_UTRS:,} 5'UTRs, chunk_size={CHUNK_SIZE:,}")
+    expected = None
+    serial = None
+    for workers in worker_counts():
+        engine = UORFFeatureEngine(workers=workers, chunk_size=CHUNK_SIZE)
+        start = time.perf_counter()
+        df = engine.compute(utrs)
+        elapsed = time.perf_counter() - start
+        if workers == 1:
+            expected, serial = df, elapsed
+        else:
+            pd.testing.assert_frame_equal(df, expected)
+        print(f"workers={workers:3d} n_rows={len(df)} {elapsed:7.2f} s "
+              f"{N_UTRS / elapsed:10.0f} transcripts/s speedup over workers=1: {serial / elapsed:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
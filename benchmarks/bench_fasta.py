@@ -0,0 +1,60 @@
+"""
+Benchmark the throughput of the FASTA reader against Biopython's `SeqIO`, if installed,
+on a generated file with 200k transcript-like records.
+
+Run with:
+
+```shell
+python benchmarks/bench_fasta.py
+```
+"""
+import os
+import random
+import tempfile
+import time
+
+from utrfx.fasta_io import read_fasta, read_fasta_bytes
+
+N_RECORDS = 200_000
+LINE_WIDTH = 60
+
+
+def write_fasta(fpath: str, rng: random.Random):
+    with open(fpath, "w") as fh:
+        for i in range(N_RECORDS):
+            sequence = "".join(rng.choices("ACGT", k=int(rng.lognormvariate(7.0, 0.7))))
+            fh.write(f">ENST{i:011d}.1 TX-{i} cdna:protein_coding\n")
+            for j in range(0, len(sequence), LINE_WIDTH):
+                fh.write(sequence[j:j + LINE_WIDTH])
+                fh.write("\n")
+
+
+def read_with_seqio(fpath: str):
+    from Bio import SeqIO
+    for record in SeqIO.parse(fpath, "fasta"):
+        yield record.description, str(record.seq)
+
+
+def main():
+    readers = [("read_fasta", read_fasta), ("read_fasta_bytes", read_fasta_bytes)]
+    try:
+        import Bio  # noqa: F401
+        readers.append(("SeqIO.parse", read_with_seqio))
+    except ImportError:
+        print("Biopython is not installed, skipping SeqIO")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fpath = os.path.join(tmpdir, "transcripts.fa")
+        write_fasta(fpath, random.Random(0))
+        size_mb = os.path.getsize(fpath) / 1e6
+
+        for name, reader in readers:
+            start = time.perf_counter()
+            n_bases = sum(len(sequence) for _, sequence in reader(fpath))
+            elapsed = time.perf_counter() - start
+            print(f"{name:18s} {N_RECORDS / elapsed:10.0f} records/s {size_mb / elapsed:8.1f} MB/s "
+                  f"n_bases={n_bases}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmark the time to import the `utrfx` modules and to load a built-in genome build in a fresh interpreter.
+
+Run with:
+
+```shell
+python benchmarks/bench_import.py
+```
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+N_RUNS = 10
+
+STATEMENTS = (
+    "pass",
+    "import utrfx.genome",
+    "import utrfx.genome; utrfx.genome.GRCh38",
+    "import utrfx.model",
+    "import utrfx.gtf_io",
+)
+
+
+def time_statement(statement: str, n_runs: int) -> float:
+    times = []
+    for _ in range(n_runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    for statement in STATEMENTS:
+        seconds = time_statement(statement, N_RUNS)
+        print(f"{statement:45s} {seconds * 1000:8.1f} ms (median of {N_RUNS} runs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark the batch Kozak scoring of all 5'UTR `ATG`s and CDS starts against a per-`ATG` loop
+on a genome-wide number of transcripts.
+
+Run with:
+
+```shell
+python benchmarks/bench_kozak.py
+```
+"""
+import random
+import time
+
+from utrfx.kozak import DEFAULT_KOZAK_PWM, KOZAK_OFFSETS, score_start_codons
+from utrfx.sequence import NUCLEOTIDES
+
+N_TRANSCRIPTS = 80_000
+CDS_LENGTH = 60
+
+
+def score_in_loop(transcripts):
+    scores = []
+    for _, seq, cds_start in transcripts:
+        positions = [i for i in range(cds_start) if seq.startswith("ATG", i)] + [cds_start]
+        for pos in positions:
+            score = 0.
+            for row, offset in enumerate(KOZAK_OFFSETS):
+                i = pos + offset
+                if 0 <= i < len(seq) and seq[i] in NUCLEOTIDES:
+                    score += DEFAULT_KOZAK_PWM[row, NUCLEOTIDES.index(seq[i])]
+            scores.append(score)
+    return scores
+
+
+def main():
+    rng = random.Random(0)
+    transcripts = []
+    for i in range(N_TRANSCRIPTS):
+        # 5'UTR lengths with a median of ~200 nucleotides.
+        utr = "".join(rng.choices("ACGT", k=int(rng.lognormvariate(5.3, 0.8))))
+        cds = "ATG" + "".join(rng.choices("ACGT", k=CDS_LENGTH))
+        transcripts.append((str(i), utr + cds, len(utr)))
+
+    start = time.perf_counter()
+    df = score_start_codons(transcripts)
+    elapsed = time.perf_counter() - start
+    print(f"{'score_start_codons':18s} n_transcripts={N_TRANSCRIPTS} n_starts={len(df)} {elapsed:6.2f} s")
+
+    start = time.perf_counter()
+    scores = score_in_loop(transcripts)
+    elapsed = time.perf_counter() - start
+    print(f"{'loop':18s} n_transcripts={N_TRANSCRIPTS} n_starts={len(scores)} {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark the memory footprint and the construction throughput of ~1M genomic regions.
+
+Run with:
+
+```shell
+python benchmarks/bench_regions.py
+```
+"""
+import time
+import tracemalloc
+
+from utrfx.genome import GRCh38, GenomicRegion, Strand
+
+N_REGIONS = 1_000_000
+
+
+def build_checked(contig, n: int):
+    return [GenomicRegion(contig, i, i + 100, Strand.POSITIVE) for i in range(n)]
+
+
+def build_trusted(contig, n: int):
+    unchecked = GenomicRegion._unchecked
+    return [unchecked(contig, i, i + 100, Strand.POSITIVE) for i in range(n)]
+
+
+def build_negative(contig, n: int):
+    return [GenomicRegion(contig, i, i + 100, Strand.POSITIVE).with_strand(Strand.NEGATIVE) for i in range(n)]
+
+
+def main():
+    contig = GRCh38.contig_by_name("chr1")
+    builders = [("checked", build_checked), ("with_strand", build_negative), ("trusted", build_trusted)]
+
+    for name, builder in builders:
+        start = time.perf_counter()
+        regions = builder(contig, N_REGIONS)
+        elapsed = time.perf_counter() - start
+        del regions
+        print(f"{name:>12}: {N_REGIONS:,} regions in {elapsed:.2f}s ({N_REGIONS / elapsed:,.0f} regions/s)")
+
+    tracemalloc.start()
+    regions = build_checked(contig, N_REGIONS)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{'memory':>12}: {current / len(regions):.0f} bytes per region (including the list)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark the uORF scanner against the previous slice-and-rescan implementation on long, ATG-rich 5'UTRs,
+and the batch scanner and the feature table on a genome-wide number of 5'UTRs.
+
+Run with:
+
+```shell
+python benchmarks/bench_uorfs.py
+```
+"""
+import random
+import time
+
+from utrfx.uorf import UORFsProcessor, compute_uorf_features, find_uorfs, find_uorfs_batch
+
+UTR_LENGTHS = (500, 2_000, 8_000, 32_000)
+N_BATCH_UTRS = 80_000
+
+
+def rescan_uorfs(sequence: str):
+    # The scan used before `find_uorfs`: re-slice the UTR after every ATG and walk the codons.
+    uorfs = []
+    while "ATG" in sequence:
+        start = sequence.find("ATG")
+        codons = []
+        for i in range(start, len(sequence) - 2, 3):
+            codon = sequence[i:i + 3]
+            codons.append(codon)
+            if codon in ["TAA", "TAG", "TGA"]:
+                uorfs.append("".join(codons))
+                break
+        sequence = sequence[start + 3:]
+    return uorfs
+
+
+SENSE_CODONS = [a + b + c for a in "ACGT" for b in "ACGT" for c in "ACGT" if a + b + c not in ("TAA", "TAG", "TGA")]
+
+
+def random_utr(length: int, rng: random.Random) -> str:
+    # ATG-rich codons without a stop in the first frame make for long uORFs, the worst case of the rescan.
+    codons = rng.choices(SENSE_CODONS + ["ATG"] * 6, k=length // 3 - 1)
+    return "".join(codons) + "TAA"
+
+
+def main():
+    rng = random.Random(0)
+    for length in UTR_LENGTHS:
+        sequence = random_utr(length, rng)
+        for name, func in (("find_uorfs", find_uorfs), ("rescan", rescan_uorfs)):
+            start = time.perf_counter()
+            n_uorfs = len(func(sequence))
+            elapsed = time.perf_counter() - start
+            print(f"{name:12s} length={length:6d} n_uorfs={n_uorfs:5d} {elapsed * 1000:9.2f} ms")
+
+    # 5'UTR lengths with a median of ~200 nucleotides.
+    utrs = ["".join(rng.choices("ACGT", k=int(rng.lognormvariate(5.3, 0.8)))) for _ in range(N_BATCH_UTRS)]
+    n_bases = sum(len(utr) for utr in utrs)
+
+    start = time.perf_counter()
+    n_uorfs = sum(len(find_uorfs(utr)) for utr in utrs)
+    elapsed = time.perf_counter() - start
+    print(f"{'find_uorfs':18s} n_utrs={N_BATCH_UTRS} n_bases={n_bases} n_uorfs={n_uorfs} {elapsed:6.2f} s")
+
+    start = time.perf_counter()
+    offsets, records = find_uorfs_batch(utrs)
+    elapsed = time.perf_counter() - start
+    print(f"{'find_uorfs_batch':18s} n_utrs={N_BATCH_UTRS} n_bases={n_bases} n_uorfs={len(records)} {elapsed:6.2f} s")
+
+    start = time.perf_counter()
+    rows = []
+    for i, utr in enumerate(utrs):
+        processor = UORFsProcessor.from_sequences(str(i), utr, utr) if utr else None
+        if processor is not None:
+            rows.extend(zip(processor.uorfs_lengths(), processor.gc_content(), processor.intercistonic_distance(),
+                            processor.gc_content_10nt_after_uorf()))
+    elapsed = time.perf_counter() - start
+    print(f"{'UORFsProcessor':18s} n_utrs={N_BATCH_UTRS} n_rows={len(rows)} {elapsed:6.2f} s")
+
+    start = time.perf_counter()
+    df = compute_uorf_features({str(i): utr for i, utr in enumerate(utrs)})
+    elapsed = time.perf_counter() - start
+    print(f"{'compute_features':18s} n_utrs={N_BATCH_UTRS} n_rows={len(df)} {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,39 @@
 and (genomic) regions (:class:`Region`, :class:`GenomicRegion`).
 
 The classes can do basic region arithmetics such as finding intersections, overlaps, and distances between regions.
+:class:`GenomicRegionArray` and :class:`GenomicRegionIndex` answer the same questions for many regions at once.
 Genomic regions are transposable - they can flip the coordinates between DNA strands.
 
 The module provides *GRCh37.p13* and *GRCh38.p13*, the two most commonly used human genome builds.
+The builds are loaded on first access.
+:class:`ReferenceGenome` fetches the sequence of genomic regions from an indexed FASTA file.
 
 The classes are largely a port of `Svart <https://github.com/exomiser/svart>`_ library.
 """
 
-from ._builds import GRCh37, GRCh38
 from ._genome import Contig, GenomeBuild, GenomeBuildIdentifier, Strand, Stranded, Transposable, GenomicRegion, Region
 from ._genome import transpose_coordinate
+from ._reference import ReferenceGenome
 
 __all__ = [
     "GenomeBuild", "Contig", "GenomeBuildIdentifier", "Region", "GenomicRegion",
     "Strand", "Stranded", "Transposable",
     "transpose_coordinate",
+    "GenomicRegionArray", "GenomicRegionIndex",
+    "ReferenceGenome",
     "GRCh37", "GRCh38",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    # The builds and the NumPy-backed classes are loaded on first access to keep the import cheap.
+    if name in ("GRCh37", "GRCh38"):
+        from . import _builds
+        return getattr(_builds, name)
+    elif name == "GenomicRegionArray":
+        from ._array import GenomicRegionArray
+        return GenomicRegionArray
+    elif name == "GenomicRegionIndex":
+        from ._index import GenomicRegionIndex
+        return GenomicRegionIndex
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
\ No newline at end of file
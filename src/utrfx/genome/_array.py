@@ -0,0 +1,235 @@
+import typing
+
+import numpy as np
+
+from ._genome import Contig, GenomicRegion, Strand
+
+
+def _overlaps(a_start, a_end, b_start, b_end) -> np.ndarray:
+    """
+    Vectorized :func:`_a_overlaps_with_b`, the arguments are broadcast against each other.
+    """
+    both_empty = (a_start == a_end) & (b_start == b_end)
+    return np.where(both_empty, (a_start == b_end) & (b_start == a_end), (a_start < b_end) & (b_start < a_end))
+
+
+def _contains(a_start, a_end, b_start, b_end) -> np.ndarray:
+    """
+    Vectorized :func:`_a_contains_b`, the arguments are broadcast against each other.
+    """
+    return (a_start <= b_start) & (b_end <= a_end)
+
+
+def _distances(a_start, a_end, b_start, b_end) -> np.ndarray:
+    """
+    Vectorized :func:`_distance_a_to_b`, the arguments are broadcast against each other.
+    """
+    first = b_start - a_end
+    second = a_start - b_end
+    result = np.where(np.abs(first) < np.abs(second), first, second)
+    result = np.where(first > second, result, -result)
+    return np.where(_overlaps(a_start, a_end, b_start, b_end), 0, result)
+
+
+def _strand_code(strand: Strand) -> int:
+    return 1 if strand == Strand.POSITIVE else -1
+
+
+class GenomicRegionArray(typing.Sized):
+    """
+    `GenomicRegionArray` represents many genomic regions as NumPy arrays of contig codes, starts, ends, and strands.
+
+    A contig code is the index of the contig in :attr:`contigs`, and a strand is `1` for the positive
+    and `-1` for the negative strand. The coordinates are 0-based and located on the strand of the region,
+    as in :class:`GenomicRegion`.
+
+    The region arithmetics are done element-wise against another `GenomicRegionArray` of the same length,
+    or against a single :class:`GenomicRegion`, with the semantics of the :class:`GenomicRegion` methods.
+
+    :param contigs: the contigs of the regions.
+    :param contig_codes: the index of the contig of each region in `contigs`.
+    :param starts: 0-based (excluded) start coordinates.
+    :param ends: 0-based (included) end coordinates.
+    :param strands: strands as `1` or `-1`.
+    """
+
+    def __init__(
+        self,
+        contigs: typing.Sequence[Contig],
+        contig_codes: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        strands: np.ndarray,
+    ):
+        self._contigs = tuple(contigs)
+        self._contig_codes = np.asarray(contig_codes, dtype=np.int32)
+        self._starts = np.asarray(starts, dtype=np.int64)
+        self._ends = np.asarray(ends, dtype=np.int64)
+        self._strands = np.asarray(strands, dtype=np.int8)
+
+        n = len(self._contig_codes)
+        if not len(self._starts) == len(self._ends) == len(self._strands) == n:
+            raise ValueError('`contig_codes`, `starts`, `ends`, and `strands` must have the same length')
+        if n:
+            if self._contig_codes.min() < 0 or self._contig_codes.max() >= len(self._contigs):
+                raise ValueError('`contig_codes` must index `contigs`')
+            if np.any(self._starts < 0) or np.any(self._starts > self._ends):
+                raise ValueError('`starts` must be non-negative and at or before `ends`')
+            if np.any(self._ends > self.contig_lengths()):
+                raise ValueError('`ends` must not extend beyond the contig bounds')
+            if not np.all(np.abs(self._strands) == 1):
+                raise ValueError('`strands` must be `1` or `-1`')
+
+    @staticmethod
+    def from_regions(
+        regions: typing.Iterable[GenomicRegion],
+        contigs: typing.Optional[typing.Sequence[Contig]] = None,
+    ) -> "GenomicRegionArray":
+        """
+        Create an array from the `regions`.
+
+        :param regions: an iterable of genomic regions.
+        :param contigs: the contigs of the regions, e.g. from :attr:`GenomeBuild.contigs`,
+          or `None` to use the contigs in order of appearance.
+        """
+        contigs = [] if contigs is None else list(contigs)
+        codes = {contig: code for code, contig in enumerate(contigs)}
+        contig_codes, starts, ends, strands = [], [], [], []
+        for region in regions:
+            code = codes.get(region.contig)
+            if code is None:
+                code = len(contigs)
+                codes[region.contig] = code
+                contigs.append(region.contig)
+            contig_codes.append(code)
+            starts.append(region.start)
+            ends.append(region.end)
+            strands.append(_strand_code(region.strand))
+
+        return GenomicRegionArray(contigs, contig_codes, starts, ends, strands)
+
+    @property
+    def contigs(self) -> typing.Sequence[Contig]:
+        return self._contigs
+
+    @property
+    def contig_codes(self) -> np.ndarray:
+        return self._contig_codes
+
+    @property
+    def starts(self) -> np.ndarray:
+        return self._starts
+
+    @property
+    def ends(self) -> np.ndarray:
+        return self._ends
+
+    @property
+    def strands(self) -> np.ndarray:
+        return self._strands
+
+    def contig_lengths(self) -> np.ndarray:
+        """
+        Get the length of the contig of each region.
+        """
+        lengths = np.array([len(contig) for contig in self._contigs], dtype=np.int64)
+        return lengths[self._contig_codes]
+
+    def start_on_strand(self, other: Strand) -> np.ndarray:
+        code = _strand_code(other)
+        return np.where(self._strands == code, self._starts, self.contig_lengths() - self._ends)
+
+    def end_on_strand(self, other: Strand) -> np.ndarray:
+        code = _strand_code(other)
+        return np.where(self._strands == code, self._ends, self.contig_lengths() - self._starts)
+
+    def with_strand(self, other: Strand) -> "GenomicRegionArray":
+        """
+        Transpose all regions to the `other` strand.
+        """
+        return GenomicRegionArray(
+            contigs=self._contigs,
+            contig_codes=self._contig_codes,
+            starts=self.start_on_strand(other),
+            ends=self.end_on_strand(other),
+            strands=np.full(len(self), _strand_code(other), dtype=np.int8),
+        )
+
+    def _aligned(self, other) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the `other` regions transposed to the strands of this array,
+        and a mask of the pairs located on the same contig.
+        """
+        lengths = self.contig_lengths()
+        if isinstance(other, GenomicRegion):
+            same_contig = np.array([contig == other.contig for contig in self._contigs], dtype=bool)[self._contig_codes]
+            o_starts, o_ends, o_strands = other.start, other.end, _strand_code(other.strand)
+        elif isinstance(other, GenomicRegionArray):
+            if len(other) != len(self):
+                raise ValueError(f'Cannot compare arrays of different lengths: {len(self)} <-> {len(other)}')
+            codes = {contig: code for code, contig in enumerate(self._contigs)}
+            remap = np.array([codes.get(contig, -1) for contig in other._contigs], dtype=np.int32)
+            same_contig = remap[other._contig_codes] == self._contig_codes if len(other) else np.zeros(0, dtype=bool)
+            o_starts, o_ends, o_strands = other._starts, other._ends, other._strands
+        else:
+            raise ValueError(f'`other` is not instance of `GenomicRegion` or `GenomicRegionArray`: {type(other)}')
+
+        flip = self._strands != o_strands
+        starts = np.where(flip, lengths - o_ends, o_starts)
+        ends = np.where(flip, lengths - o_starts, o_ends)
+        return starts, ends, same_contig
+
+    def overlaps_with(self, other) -> np.ndarray:
+        """
+        Test if the regions overlap with the `other` regions, see :meth:`GenomicRegion.overlaps_with`.
+
+        :param other: a :class:`GenomicRegion` or a :class:`GenomicRegionArray` of the same length.
+        :returns: a `bool` array.
+        """
+        starts, ends, same_contig = self._aligned(other)
+        return same_contig & _overlaps(self._starts, self._ends, starts, ends)
+
+    def contains(self, other) -> np.ndarray:
+        """
+        Test if the regions contain the `other` regions, see :meth:`GenomicRegion.contains`.
+
+        :param other: a :class:`GenomicRegion` or a :class:`GenomicRegionArray` of the same length.
+        :returns: a `bool` array.
+        """
+        starts, ends, same_contig = self._aligned(other)
+        return same_contig & _contains(self._starts, self._ends, starts, ends)
+
+    def distance_to(self, other) -> np.ndarray:
+        """
+        Calculate the distances to the `other` regions, see :meth:`GenomicRegion.distance_to`.
+
+        :param other: a :class:`GenomicRegion` or a :class:`GenomicRegionArray` of the same length.
+        :returns: an `int64` array.
+        :raises ValueError: if any pair of regions is located on different contigs.
+        """
+        starts, ends, same_contig = self._aligned(other)
+        if not np.all(same_contig):
+            raise ValueError(f'Cannot calculate distance between regions on different contigs: '
+                             f'{np.count_nonzero(~same_contig)} pair(s)')
+        return _distances(self._starts, self._ends, starts, ends)
+
+    def __getitem__(self, index: int) -> GenomicRegion:
+        return GenomicRegion(
+            contig=self._contigs[self._contig_codes[index]],
+            start=int(self._starts[index]),
+            end=int(self._ends[index]),
+            strand=Strand.POSITIVE if self._strands[index] == 1 else Strand.NEGATIVE,
+        )
+
+    def __iter__(self) -> typing.Iterator[GenomicRegion]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __str__(self):
+        return f'GenomicRegionArray(n_regions={len(self)}, n_contigs={len(self._contigs)})'
+
+    def __repr__(self):
+        return str(self)
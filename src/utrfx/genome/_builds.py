@@ -1,4 +1,10 @@
+"""
+The built-in genome builds, `GRCh37` (the `GRCh37.p13` genomic build) and `GRCh38` (the `GRCh38.p13` genomic build).
+
+The builds are parsed from the bundled assembly reports on first access and cached for the lifetime of the process.
+"""
 import platform
+import threading
 import warnings
 
 from ._genome import Contig, GenomeBuild, GenomeBuildIdentifier
@@ -6,14 +12,15 @@ from ._genome import Contig, GenomeBuild, GenomeBuildIdentifier
 major, minor, patch = platform.python_version_tuple()
 
 if major == '3':
-    import importlib.resources
     minor = int(minor)
     if minor < 9:
         # Versions 3.7, 3.8
         def resource_loader(path: str):
+            import importlib.resources
             return importlib.resources.open_text('utrfx.genome', path)
     else:
         def resource_loader(path: str):
+            import importlib.resources
             return importlib.resources.files('utrfx.genome').joinpath(path).open()
 
 else:
@@ -38,12 +45,26 @@ def read_assembly_report(identifier: GenomeBuildIdentifier, path: str) -> Genome
     return GenomeBuild(identifier, contigs)
 
 
-GRCh37 = read_assembly_report(GenomeBuildIdentifier('GRCh37', 'p13'), 'GCF_000001405.25_GRCh37.p13_assembly_report.tsv')
-"""
-The `GRCh37.p13` genomic build.
-"""
+_BUILTIN_BUILDS = {
+    'GRCh37': (GenomeBuildIdentifier('GRCh37', 'p13'), 'GCF_000001405.25_GRCh37.p13_assembly_report.tsv'),
+    'GRCh38': (GenomeBuildIdentifier('GRCh38', 'p13'), 'GCF_000001405.39_GRCh38.p13_assembly_report.tsv'),
+}
 
-GRCh38 = read_assembly_report(GenomeBuildIdentifier('GRCh38', 'p13'), 'GCF_000001405.39_GRCh38.p13_assembly_report.tsv')
-"""
-The `GRCh38.p13` genomic build.
-"""
\ No newline at end of file
+_loaded_builds = {}
+_loaded_builds_lock = threading.Lock()
+
+
+def _load_builtin_build(name: str) -> GenomeBuild:
+    with _loaded_builds_lock:
+        build = _loaded_builds.get(name)
+        if build is None:
+            identifier, path = _BUILTIN_BUILDS[name]
+            build = read_assembly_report(identifier, path)
+            _loaded_builds[name] = build
+        return build
+
+
+def __getattr__(name: str):
+    if name in _BUILTIN_BUILDS:
+        return _load_builtin_build(name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -18,6 +18,8 @@ class Contig(typing.Sized):
     You should not try to create a `Contig` on your own, but always get it from a :class:`GenomeBuild`.
     """
 
+    __slots__ = ("_name", "_gb_acc", "_refseq", "_ucsc", "_len")
+
     def __init__(self, name: str, gb_acc: str, refseq_name: str, ucsc_name: str, length: int):
         self._name = name
 
@@ -214,6 +216,8 @@ class Region(typing.Sized):
     :param end: 0-based (included) end coordinate of the region.
     """
 
+    __slots__ = ("_start", "_end")
+
     def __init__(self, start: int, end: int):
         if not isinstance(start, int) or not isinstance(end, int):
             raise ValueError(f'`start` and `end` must be ints but were `{type(start)}`, `{type(end)}`')
@@ -388,6 +392,8 @@ class Stranded(metaclass=abc.ABCMeta):
     Mixin for classes that are on double-stranded sequences.
     """
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def strand(self) -> Strand:
@@ -399,6 +405,8 @@ class Transposable(Stranded, metaclass=abc.ABCMeta):
     `Transposable` elements know how to flip themselves to arbitrary :class:`Strand` of a sequence.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def with_strand(self, other: Strand):
         pass
@@ -423,6 +431,8 @@ class GenomicRegion(Transposable, Region):
     :param strand: the strand of the genomic region, `True` for forward strand or `False` for reverse.
     """
 
+    __slots__ = ("_contig", "_strand")
+
     def __init__(self, contig: Contig, start: int, end: int, strand: Strand):
         super().__init__(start, end)
         self._contig = contig
@@ -431,6 +441,21 @@ class GenomicRegion(Transposable, Region):
             raise ValueError(f'Genomic region end {end} must not extend '
                              f'beyond contig {self._contig.name} bounds [0,{len(self._contig)}]')
 
+    @classmethod
+    def _unchecked(cls, contig: Contig, start: int, end: int, strand: Strand) -> "GenomicRegion":
+        """
+        Create a region without validating the arguments.
+
+        Only for the coordinates that are known to be valid, e.g. computed from another region.
+        The `start` and `end` must be `int`s with `0 <= start <= end <= len(contig)`.
+        """
+        region = object.__new__(cls)
+        region._start = start
+        region._end = end
+        region._contig = contig
+        region._strand = strand
+        return region
+
     @property
     def contig(self) -> Contig:
         return self._contig
@@ -452,11 +477,12 @@ class GenomicRegion(Transposable, Region):
         return self._strand
 
     def with_strand(self, other: Strand) -> "GenomicRegion":
-        if self.strand == other:
+        if self._strand == other:
             return self
         else:
-            return GenomicRegion(
-                contig=self.contig, start=self.start_on_strand(other), end= self.end_on_strand(other), strand= other)
+            contig_length = len(self._contig)
+            return GenomicRegion._unchecked(
+                contig=self._contig, start=contig_length - self._end, end=contig_length - self._start, strand=other)
 
     def overlaps_with(self, other) -> bool:
         """
@@ -0,0 +1,202 @@
+import typing
+
+import numpy as np
+
+from ._array import _overlaps, _distances
+from ._genome import Contig, GenomicRegion, Strand
+
+
+class _SortedRegions:
+    """
+    Regions of one contig sorted by the start on the positive strand, and nested in a containment list (NCList)
+    to bound the overlap searches.
+
+    Each region contained in a preceding region is a member of the sublist of such a region, the other regions
+    are members of the top-level sublist. The starts and the ends grow together within a sublist,
+    hence the members that reach into a window are found by two binary searches.
+    """
+
+    def __init__(self, regions: typing.Sequence[GenomicRegion]):
+        starts = np.array([region.start_on_strand(Strand.POSITIVE) for region in regions], dtype=np.int64)
+        ends = np.array([region.end_on_strand(Strand.POSITIVE) for region in regions], dtype=np.int64)
+        # The longest region first among the regions with the same start, so that it precedes the regions it contains.
+        order = np.lexsort((-ends, starts))
+
+        self._regions = tuple(regions[i] for i in order)
+        self._starts = starts[order]
+        self._ends = ends[order]
+        max_ends = np.maximum.accumulate(self._ends)
+        positions = np.arange(len(self._ends))
+        self._argmax_ends = np.maximum.accumulate(np.where(self._ends == max_ends, positions, 0))
+
+        # The sublist of region `i` is `members[bounds[i]:bounds[i + 1]]`, the top-level sublist comes last.
+        n = len(self._regions)
+        parents = _nclist_parents(self._ends)
+        parents[parents < 0] = n
+        self._members = np.argsort(parents, kind="stable")
+        self._member_starts = self._starts[self._members]
+        self._member_ends = self._ends[self._members]
+        bounds = np.searchsorted(parents[self._members], np.arange(n + 2), side="left")
+        self._has_sublist = bounds[1:n + 1] > bounds[:n]
+        self._bounds = bounds.tolist()
+
+    def _candidates(self, start: int, end: int) -> np.ndarray:
+        # The sorted positions of the regions with `region_end >= start` and `region_start <= end`.
+        # This includes the regions that touch the window, which may overlap with an empty query.
+        found = []
+        sublists = [len(self._regions)]
+        while sublists:
+            sublist = sublists.pop()
+            lo, hi = self._bounds[sublist], self._bounds[sublist + 1]
+            first = lo + int(np.searchsorted(self._member_ends[lo:hi], start, side="left"))
+            last = lo + int(np.searchsorted(self._member_starts[lo:hi], end, side="right"))
+            if first < last:
+                hits = self._members[first:last]
+                found.append(hits)
+                # A region contained in a region outside the window is outside the window too.
+                sublists.extend(hits[self._has_sublist[hits]].tolist())
+
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        return np.sort(np.concatenate(found))
+
+    def overlapping(self, start: int, end: int) -> typing.List[GenomicRegion]:
+        candidates = self._candidates(start, end)
+        hits = _overlaps(start, end, self._starts[candidates], self._ends[candidates])
+        return [self._regions[i] for i in candidates[hits]]
+
+    def within(self, start: int, end: int, distance: int) -> typing.List[GenomicRegion]:
+        candidates = self._candidates(start - distance, end + distance)
+        distances = _abs_distances(start, end, self._starts[candidates], self._ends[candidates])
+        return [self._regions[i] for i in candidates[distances <= distance]]
+
+    def nearest(self, start: int, end: int) -> typing.Optional[GenomicRegion]:
+        if not self._regions:
+            return None
+
+        candidates = [self._candidates(start, end)]
+        hi = int(np.searchsorted(self._starts, end, side="right"))
+        if hi > 0:
+            # The region with the greatest end among the regions that start at or before `end`.
+            candidates.append(self._argmax_ends[hi - 1:hi])
+        if hi < len(self._regions):
+            # The first region that starts after `end`.
+            candidates.append(np.array([hi], dtype=np.int64))
+
+        candidates = np.unique(np.concatenate(candidates))
+        distances = _abs_distances(start, end, self._starts[candidates], self._ends[candidates])
+        return self._regions[candidates[np.argmin(distances)]]
+
+
+def _nclist_parents(ends: np.ndarray) -> np.ndarray:
+    """
+    Get the position of the region whose sublist includes each region, or `-1` for the top-level regions.
+
+    The regions must be sorted by the start, and by the end in descending order for the same start.
+    """
+    parents = np.full(len(ends), -1, dtype=np.int64)
+    ends = ends.tolist()
+    # The chain of regions that contain each other and may contain the next region.
+    stack = []
+    for i, end in enumerate(ends):
+        while stack and ends[stack[-1]] < end:
+            stack.pop()
+        if stack:
+            parents[i] = stack[-1]
+        stack.append(i)
+    return parents
+
+
+def _abs_distances(start: int, end: int, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    return np.abs(_distances(start, end, starts, ends))
+
+
+class GenomicRegionIndex(typing.Sized):
+    """
+    `GenomicRegionIndex` answers overlap and proximity queries against a fixed collection of :class:`GenomicRegion`s.
+
+    The regions are kept in sorted arrays per contig, and per contig and strand.
+    The regions of each contig are nested in a containment list, hence a query takes `O(log n + k)` time
+    for `k` reported regions, also if long regions contain many short ones.
+
+    The queries follow the semantics of :meth:`GenomicRegion.overlaps_with` and :meth:`GenomicRegion.distance_to`:
+    regions are compared after transposing them to the same strand, and two empty regions overlap only
+    if they have the same coordinates. Regions on a different contig are never reported.
+
+    The regions are reported in the order of their start on the positive strand.
+
+    :param regions: the regions to index.
+    """
+
+    def __init__(self, regions: typing.Iterable[GenomicRegion]):
+        by_contig = {}
+        by_contig_and_strand = {}
+        n_regions = 0
+        for region in regions:
+            region = GenomicRegion._check_is_genomic_region(region)
+            by_contig.setdefault(region.contig, []).append(region)
+            by_contig_and_strand.setdefault((region.contig, region.strand), []).append(region)
+            n_regions += 1
+
+        self._len = n_regions
+        self._by_contig = {contig: _SortedRegions(rs) for contig, rs in by_contig.items()}
+        self._by_contig_and_strand = {key: _SortedRegions(rs) for key, rs in by_contig_and_strand.items()}
+
+    def _sorted_regions(self, region: GenomicRegion, same_strand: bool) -> typing.Optional[_SortedRegions]:
+        region = GenomicRegion._check_is_genomic_region(region)
+        if same_strand:
+            return self._by_contig_and_strand.get((region.contig, region.strand))
+        return self._by_contig.get(region.contig)
+
+    def overlapping(self, region: GenomicRegion, same_strand: bool = False) -> typing.List[GenomicRegion]:
+        """
+        Get the indexed regions that overlap with the `region`.
+
+        :param region: the query region.
+        :param same_strand: `True` if only the regions on the strand of the `region` should be reported.
+        """
+        regions = self._sorted_regions(region, same_strand)
+        if regions is None:
+            return []
+        return regions.overlapping(region.start_on_strand(Strand.POSITIVE), region.end_on_strand(Strand.POSITIVE))
+
+    def within(self, region: GenomicRegion, distance: int, same_strand: bool = False) -> typing.List[GenomicRegion]:
+        """
+        Get the indexed regions that are at most `distance` bases away from the `region`, including the overlapping regions.
+
+        :param region: the query region.
+        :param distance: a non-negative `int` with the maximum distance.
+        :param same_strand: `True` if only the regions on the strand of the `region` should be reported.
+        """
+        if distance < 0:
+            raise ValueError(f'`distance` must not be negative but was {distance}')
+        regions = self._sorted_regions(region, same_strand)
+        if regions is None:
+            return []
+        return regions.within(region.start_on_strand(Strand.POSITIVE), region.end_on_strand(Strand.POSITIVE), distance)
+
+    def nearest(self, region: GenomicRegion, same_strand: bool = False) -> typing.Optional[GenomicRegion]:
+        """
+        Get the indexed region with the smallest absolute distance to the `region`.
+
+        :param region: the query region.
+        :param same_strand: `True` if only the regions on the strand of the `region` should be considered.
+        :returns: the nearest region or `None` if there is no indexed region on the contig (and strand) of the `region`.
+        """
+        regions = self._sorted_regions(region, same_strand)
+        if regions is None:
+            return None
+        return regions.nearest(region.start_on_strand(Strand.POSITIVE), region.end_on_strand(Strand.POSITIVE))
+
+    @property
+    def contigs(self) -> typing.Collection[Contig]:
+        return self._by_contig.keys()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __str__(self):
+        return f'GenomicRegionIndex(n_regions={self._len}, n_contigs={len(self._by_contig)})'
+
+    def __repr__(self):
+        return str(self)
@@ -0,0 +1,151 @@
+import mmap
+import os
+import typing
+
+from ._genome import Contig, GenomeBuild, GenomicRegion, Strand
+
+if typing.TYPE_CHECKING:
+    from ..model import Transcript
+
+_COMPLEMENT = bytes.maketrans(
+    b"ACGTUNRYKMBVDHSWacgtunrykmbvdhsw",
+    b"TGCAANYRMKVBHDSWtgcaanyrmkvbhdsw",
+)
+
+
+class _FaiEntry:
+    """
+    A line of a FASTA index: the sequence length, the offset of the first base,
+    and the number of bases and bytes per line.
+    """
+
+    __slots__ = ("length", "offset", "line_bases", "line_width")
+
+    def __init__(self, length: int, offset: int, line_bases: int, line_width: int):
+        self.length = length
+        self.offset = offset
+        self.line_bases = line_bases
+        self.line_width = line_width
+
+    def byte_offset(self, pos: int) -> int:
+        line, col = divmod(pos, self.line_bases)
+        return self.offset + line * self.line_width + col
+
+
+class ReferenceGenome:
+    """
+    `ReferenceGenome` provides the sequence of the contigs of a :class:`GenomeBuild`
+    from a FASTA file indexed with `samtools faidx`.
+
+    The FASTA file is memory-mapped and a fetch reads only the bytes of the requested region.
+    The sequences are returned as stored in the FASTA file, e.g. soft-masked bases stay lower-case.
+
+    The FASTA sequences are matched to the contigs by any name supported by :meth:`GenomeBuild.contig_by_name`.
+    The sequences that do not correspond to a contig of the build are ignored.
+
+    The instance holds an open file and should be closed with :meth:`close` or used as a context manager.
+
+    :param fasta_path: path to an uncompressed FASTA file.
+    :param genome_build: the genome build of the FASTA file.
+    :param fai_path: path to the FASTA index or `None` to use `fasta_path` with the `.fai` suffix.
+    :raises ValueError: if the index is missing or does not agree with the contig lengths of the build.
+    """
+
+    def __init__(
+        self,
+        fasta_path: str,
+        genome_build: GenomeBuild,
+        fai_path: typing.Optional[str] = None,
+    ):
+        if fai_path is None:
+            fai_path = fasta_path + ".fai"
+        if not os.path.isfile(fai_path):
+            raise ValueError(f'FASTA index {fai_path} does not exist, run `samtools faidx {fasta_path}` to create it')
+
+        self._genome_build = genome_build
+        self._entries = ReferenceGenome._read_fai(fai_path, genome_build)
+
+        self._fh = open(fasta_path, "rb")
+        try:
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file cannot be memory-mapped.
+            self._mm = b""
+
+    @staticmethod
+    def _read_fai(fai_path: str, genome_build: GenomeBuild) -> typing.Mapping[Contig, _FaiEntry]:
+        entries = {}
+        with open(fai_path) as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                name, length, offset, line_bases, line_width = line.rstrip("\n").split("\t")[:5]
+                contig = genome_build.contig_by_name(name)
+                if contig is None:
+                    continue
+                length = int(length)
+                if length != len(contig):
+                    raise ValueError(f'Length {length} of {name} in {fai_path} does not match '
+                                     f'the length {len(contig)} of {contig.name} in {genome_build.identifier}')
+                entries[contig] = _FaiEntry(length, int(offset), int(line_bases), int(line_width))
+        return entries
+
+    @property
+    def genome_build(self) -> GenomeBuild:
+        return self._genome_build
+
+    @property
+    def contigs(self) -> typing.Collection[Contig]:
+        """
+        Get the contigs of the build present in the FASTA file.
+        """
+        return self._entries.keys()
+
+    def fetch(self, region: GenomicRegion) -> str:
+        """
+        Get the sequence of the `region`. The sequence of a region on the negative strand is reverse complemented.
+
+        :param region: the region to fetch.
+        :raises ValueError: if the contig of the `region` is not present in the FASTA file.
+        """
+        entry = self._entries.get(region.contig)
+        if entry is None:
+            raise ValueError(f'Contig {region.contig.name} is not present in the reference FASTA')
+
+        start = region.start_on_strand(Strand.POSITIVE)
+        end = region.end_on_strand(Strand.POSITIVE)
+        if start == end:
+            return ""
+
+        seq = self._mm[entry.byte_offset(start):entry.byte_offset(end - 1) + 1]
+        if entry.line_width != entry.line_bases:
+            seq = seq.translate(None, b"\r\n")
+        if region.strand == Strand.NEGATIVE:
+            seq = seq.translate(_COMPLEMENT)[::-1]
+        return seq.decode("ascii")
+
+    def fetch_five_utr(self, transcript: "Transcript") -> str:
+        """
+        Get the spliced 5'UTR sequence of the `transcript` in the 5' to 3' direction.
+
+        :param transcript: a transcript with the 5'UTR regions located on the transcript strand.
+        """
+        regions = sorted(transcript.five_utr.regions(), key=lambda region: region.start)
+        return "".join(self.fetch(region) for region in regions)
+
+    def close(self):
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._fh.close()
+
+    def __enter__(self) -> "ReferenceGenome":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __str__(self):
+        return f'ReferenceGenome(genome_build={self._genome_build.identifier}, n_contigs={len(self._entries)})'
+
+    def __repr__(self):
+        return str(self)
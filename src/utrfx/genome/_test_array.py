@@ -0,0 +1,91 @@
+import random
+
+import numpy as np
+import pytest
+
+from ._array import GenomicRegionArray
+from ._genome import Contig, GenomicRegion, Strand
+
+
+@pytest.fixture
+def contig() -> Contig:
+    return Contig('1', 'GB', 'NC', 'BLA', 10)
+
+
+@pytest.fixture
+def other_contig() -> Contig:
+    return Contig('2', 'GB2', 'NC2', 'BLA2', 10)
+
+
+def random_regions(contigs, n: int, rng: random.Random):
+    regions = []
+    for _ in range(n):
+        contig = rng.choice(contigs)
+        start = rng.randint(0, len(contig))
+        end = rng.randint(start, len(contig))
+        regions.append(GenomicRegion(contig, start, end, rng.choice([Strand.POSITIVE, Strand.NEGATIVE])))
+    return regions
+
+
+class TestGenomicRegionArray:
+
+    def test_from_regions(self, contig: Contig, other_contig: Contig):
+        regions = [
+            GenomicRegion(contig, 1, 3, Strand.POSITIVE),
+            GenomicRegion(other_contig, 2, 5, Strand.NEGATIVE),
+        ]
+
+        array = GenomicRegionArray.from_regions(regions)
+
+        assert len(array) == 2
+        assert array.contigs == (contig, other_contig)
+        assert array.contig_codes.tolist() == [0, 1]
+        assert array.strands.tolist() == [1, -1]
+        assert list(array) == regions
+
+    def test_against_scalar_methods(self, contig: Contig, other_contig: Contig):
+        rng = random.Random(7)
+        a = random_regions([contig], 500, rng)
+        b = random_regions([contig], 500, rng)
+        a_array = GenomicRegionArray.from_regions(a)
+        # Use a different contig order for `b` to exercise the contig remapping.
+        b_array = GenomicRegionArray.from_regions(b, contigs=[other_contig, contig])
+
+        assert a_array.overlaps_with(b_array).tolist() == [x.overlaps_with(y) for x, y in zip(a, b)]
+        assert a_array.contains(b_array).tolist() == [x.contains(y) for x, y in zip(a, b)]
+        assert a_array.distance_to(b_array).tolist() == [x.distance_to(y) for x, y in zip(a, b)]
+
+        query = b[0]
+        assert a_array.overlaps_with(query).tolist() == [x.overlaps_with(query) for x in a]
+        assert a_array.distance_to(query).tolist() == [x.distance_to(query) for x in a]
+
+    @pytest.mark.parametrize("strand", [Strand.POSITIVE, Strand.NEGATIVE])
+    def test_with_strand(self, contig: Contig, strand: Strand):
+        regions = random_regions([contig], 50, random.Random(3))
+
+        array = GenomicRegionArray.from_regions(regions).with_strand(strand)
+
+        assert list(array) == [region.with_strand(strand) for region in regions]
+
+    def test_other_contig(self, contig: Contig, other_contig: Contig):
+        a = GenomicRegionArray.from_regions([GenomicRegion(contig, 0, 5, Strand.POSITIVE)])
+        b = GenomicRegionArray.from_regions([GenomicRegion(other_contig, 1, 4, Strand.POSITIVE)])
+
+        assert a.overlaps_with(b).tolist() == [False]
+        assert a.contains(b).tolist() == [False]
+        with pytest.raises(ValueError):
+            a.distance_to(b)
+
+    def test_invalid_arrays(self, contig: Contig):
+        with pytest.raises(ValueError):
+            GenomicRegionArray([contig], [0], [5], [4], [1])
+        with pytest.raises(ValueError):
+            GenomicRegionArray([contig], [0], [0], [11], [1])
+        with pytest.raises(ValueError):
+            GenomicRegionArray([contig], [0, 0], [0], [1], [1])
+
+    def test_empty(self, contig: Contig):
+        array = GenomicRegionArray([contig], np.array([]), np.array([]), np.array([]), np.array([]))
+
+        assert len(array) == 0
+        assert array.overlaps_with(GenomicRegion(contig, 0, 1, Strand.POSITIVE)).tolist() == []
@@ -39,4 +39,19 @@ def test_hg38(name, genbank, refseq, ucsc, length):
     assert contig.genbank_acc == genbank
     assert contig.refseq_name == refseq
     assert contig.ucsc_name == ucsc
-    assert len(contig) == length
\ No newline at end of file
+    assert len(contig) == length
+
+def test_builds_are_loaded_once():
+    from . import _builds
+    import utrfx.genome
+
+    assert _builds.GRCh38 is _builds.GRCh38
+    assert utrfx.genome.GRCh38 is _builds.GRCh38
+    assert utrfx.genome.GRCh37 is not utrfx.genome.GRCh38
+
+
+def test_unknown_attribute():
+    from . import _builds
+
+    with pytest.raises(AttributeError):
+        _builds.GRCh36
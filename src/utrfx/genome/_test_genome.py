@@ -40,6 +40,13 @@ def test_with_strand(contig):
     assert neg_on_pos.strand == Strand.POSITIVE
 
 
+def test_unchecked(contig):
+    region = GenomicRegion._unchecked(contig, 30, 80, Strand.NEGATIVE)
+
+    assert region == GenomicRegion(contig, 30, 80, Strand.NEGATIVE)
+    assert not hasattr(region, "__dict__")
+
+
 class TestOverlaps:
 
     @pytest.mark.parametrize("a_start, a_end, b_start, b_end, expected",
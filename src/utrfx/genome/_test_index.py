@@ -0,0 +1,111 @@
+import random
+
+import pytest
+
+from ._genome import Contig, GenomicRegion, Strand
+from ._index import GenomicRegionIndex
+
+
+@pytest.fixture
+def contig() -> Contig:
+    return Contig('1', 'GB_BLA', 'NC_BLA', 'UCSC_BLA', 100)
+
+
+@pytest.fixture
+def other_contig() -> Contig:
+    return Contig('2', 'GB_BLA2', 'NC_BLA2', 'UCSC_BLA2', 100)
+
+
+def random_regions(contig: Contig, n: int, rng: random.Random):
+    regions = []
+    for _ in range(n):
+        start = rng.randint(0, len(contig))
+        end = min(len(contig), start + rng.choice([0, 0, 1, 3, 10, 40]))
+        strand = rng.choice([Strand.POSITIVE, Strand.NEGATIVE])
+        regions.append(GenomicRegion(contig, start, end, strand))
+    return regions
+
+
+class TestGenomicRegionIndex:
+
+    def test_against_pairwise_methods(self, contig: Contig, other_contig: Contig):
+        rng = random.Random(42)
+        regions = random_regions(contig, 200, rng) + random_regions(other_contig, 20, rng)
+        index = GenomicRegionIndex(regions)
+        assert len(index) == 220
+
+        for query in random_regions(contig, 200, rng):
+            expected = {id(r) for r in regions if query.overlaps_with(r)}
+            assert {id(r) for r in index.overlapping(query)} == expected
+
+            expected = {id(r) for r in regions if query.overlaps_with(r) and r.strand == query.strand}
+            assert {id(r) for r in index.overlapping(query, same_strand=True)} == expected
+
+            expected = {id(r) for r in regions if r.contig == contig and abs(query.distance_to(r)) <= 5}
+            assert {id(r) for r in index.within(query, 5)} == expected
+
+            nearest = index.nearest(query)
+            best = min(abs(query.distance_to(r)) for r in regions if r.contig == contig)
+            assert abs(query.distance_to(nearest)) == best
+
+    def test_long_region_with_many_short_regions(self):
+        contig = Contig('3', 'GB_BLA3', 'NC_BLA3', 'UCSC_BLA3', 100_000)
+        rng = random.Random(7)
+        regions = [GenomicRegion(contig, 0, len(contig), Strand.POSITIVE)]
+        regions += [GenomicRegion(contig, start, start + rng.choice([0, 1, 10, 50]), rng.choice(list(Strand)))
+                    for start in range(0, 99_900, 50)]
+        index = GenomicRegionIndex(regions)
+
+        for query in random_regions(contig, 200, rng):
+            expected = [r for r in regions if query.overlaps_with(r)]
+            assert {id(r) for r in index.overlapping(query)} == {id(r) for r in expected}
+
+            expected = {id(r) for r in regions if abs(query.distance_to(r)) <= 20}
+            assert {id(r) for r in index.within(query, 20)} == expected
+
+            assert query.distance_to(index.nearest(query)) == 0
+
+        # The long region does not widen the search to the short regions before the query.
+        query = GenomicRegion(contig, 90_000, 90_001, Strand.POSITIVE)
+        sorted_regions = index._by_contig[contig]
+        assert len(sorted_regions._candidates(query.start, query.end)) <= 5
+
+    @pytest.mark.parametrize("a_start, a_end, b_start, b_end, expected",
+                             [
+                                 (0, 0, 0, 0, True),  # Empty regions do overlap
+                                 (0, 0, 0, 1, False),  # But the empty intervals on immediate boundaries do not
+                                 (1, 1, 0, 1, False),
+                                 (1, 1, 0, 2, True),
+                             ])
+    def test_empty_regions(self, contig: Contig, a_start, a_end, b_start, b_end, expected):
+        a = GenomicRegion(contig, a_start, a_end, Strand.POSITIVE)
+        b = GenomicRegion(contig, b_start, b_end, Strand.POSITIVE)
+
+        assert (GenomicRegionIndex([b]).overlapping(a) == [b]) == expected
+        assert (GenomicRegionIndex([a]).overlapping(b) == [a]) == expected
+
+    def test_strand_transposition(self, contig: Contig):
+        #    POS -> 0 1 2 3 4 ...  98 99
+        #    NEG <- 100 99 ...     2  1
+        region = GenomicRegion(contig, 10, 20, Strand.NEGATIVE)  # [80, 90) on the positive strand
+        index = GenomicRegionIndex([region])
+
+        assert index.overlapping(GenomicRegion(contig, 85, 86, Strand.POSITIVE)) == [region]
+        assert index.overlapping(GenomicRegion(contig, 10, 20, Strand.POSITIVE)) == []
+        assert index.overlapping(GenomicRegion(contig, 85, 86, Strand.POSITIVE), same_strand=True) == []
+        assert index.within(GenomicRegion(contig, 92, 95, Strand.POSITIVE), 2) == [region]
+        assert index.nearest(GenomicRegion(contig, 0, 1, Strand.POSITIVE)) == region
+
+    def test_other_contig(self, contig: Contig, other_contig: Contig):
+        index = GenomicRegionIndex([GenomicRegion(contig, 10, 20, Strand.POSITIVE)])
+        query = GenomicRegion(other_contig, 10, 20, Strand.POSITIVE)
+
+        assert index.overlapping(query) == []
+        assert index.within(query, 100) == []
+        assert index.nearest(query) is None
+
+    def test_negative_distance(self, contig: Contig):
+        index = GenomicRegionIndex([])
+
+        with pytest.raises(ValueError):
+            index.within(GenomicRegion(contig, 10, 20, Strand.POSITIVE), -1)
@@ -0,0 +1,104 @@
+import pytest
+
+from ._genome import Contig, GenomeBuild, GenomeBuildIdentifier, GenomicRegion, Strand
+from ._reference import ReferenceGenome
+
+SEQ_1 = "ACGTTGCAAC" "GGATCCAAAT" "TTAGCCGTAc" "gtta"
+SEQ_2 = "NNNNACGTAC"
+
+
+class MockTranscript:
+
+    def __init__(self, regions):
+        self.five_utr = MockFiveUTR(regions)
+
+
+class MockFiveUTR:
+
+    def __init__(self, regions):
+        self._regions = regions
+
+    def regions(self):
+        return self._regions
+
+
+@pytest.fixture
+def genome_build() -> GenomeBuild:
+    return GenomeBuild(
+        GenomeBuildIdentifier('TEST', 'p1'),
+        (
+            Contig('1', 'GB_1', 'NC_1', 'chr1', len(SEQ_1)),
+            Contig('2', 'GB_2', 'NC_2', 'chr2', len(SEQ_2)),
+            Contig('3', 'GB_3', 'NC_3', 'chr3', 1000),
+        ),
+    )
+
+
+def write_fasta(tmp_path, line_bases: int, newline: str = "\n") -> str:
+    fasta_path = str(tmp_path / "ref.fa")
+    fai_lines = []
+    offset = 0
+    with open(fasta_path, "w", newline="") as fh:
+        for name, seq in (("chr1", SEQ_1), ("chrUn", "ACGT"), ("2", SEQ_2)):
+            header = f">{name} description{newline}"
+            fh.write(header)
+            offset += len(header)
+            fai_lines.append(f"{name}\t{len(seq)}\t{offset}\t{line_bases}\t{line_bases + len(newline)}\n")
+            for i in range(0, len(seq), line_bases):
+                line = seq[i:i + line_bases] + newline
+                fh.write(line)
+                offset += len(line)
+    with open(fasta_path + ".fai", "w") as fh:
+        fh.writelines(fai_lines)
+    return fasta_path
+
+
+class TestReferenceGenome:
+
+    @pytest.mark.parametrize("line_bases, newline", [(10, "\n"), (7, "\r\n"), (100, "\n")])
+    def test_fetch(self, tmp_path, genome_build, line_bases, newline):
+        chr1 = genome_build.contig_by_name('1')
+        with ReferenceGenome(write_fasta(tmp_path, line_bases, newline), genome_build) as reference:
+            for start, end in ((0, 0), (0, 1), (3, 17), (9, 11), (10, 20), (0, len(SEQ_1)), (30, 34)):
+                assert reference.fetch(GenomicRegion(chr1, start, end, Strand.POSITIVE)) == SEQ_1[start:end]
+
+    def test_fetch_negative_strand(self, tmp_path, genome_build):
+        chr1 = genome_build.contig_by_name('1')
+        with ReferenceGenome(write_fasta(tmp_path, 10), genome_build) as reference:
+            region = GenomicRegion(chr1, 3, 17, Strand.POSITIVE)
+            assert reference.fetch(region.with_strand(Strand.NEGATIVE)) == "TGGATCCGTTGCAA"
+
+            region = GenomicRegion(chr1, 26, 34, Strand.POSITIVE)
+            assert reference.fetch(region.with_strand(Strand.NEGATIVE)) == "taacgTAC"
+
+    def test_contigs(self, tmp_path, genome_build):
+        with ReferenceGenome(write_fasta(tmp_path, 10), genome_build) as reference:
+            assert {contig.name for contig in reference.contigs} == {'1', '2'}
+
+            chr3 = genome_build.contig_by_name('3')
+            with pytest.raises(ValueError):
+                reference.fetch(GenomicRegion(chr3, 0, 10, Strand.POSITIVE))
+
+    def test_fetch_five_utr(self, tmp_path, genome_build):
+        chr1 = genome_build.contig_by_name('1')
+        positive = [
+            GenomicRegion(chr1, 20, 24, Strand.POSITIVE),
+            GenomicRegion(chr1, 2, 6, Strand.POSITIVE),
+        ]
+        negative = [region.with_strand(Strand.NEGATIVE) for region in positive]
+
+        with ReferenceGenome(write_fasta(tmp_path, 10), genome_build) as reference:
+            assert reference.fetch_five_utr(MockTranscript(positive)) == "GTTG" + "TTAG"
+            assert reference.fetch_five_utr(MockTranscript(negative)) == "CTAA" + "CAAC"
+
+    def test_missing_index(self, tmp_path, genome_build):
+        fasta_path = write_fasta(tmp_path, 10)
+        with pytest.raises(ValueError):
+            ReferenceGenome(fasta_path, genome_build, fai_path=fasta_path + ".missing")
+
+    def test_length_mismatch(self, tmp_path, genome_build):
+        fasta_path = write_fasta(tmp_path, 10)
+        with open(fasta_path + ".fai", "a") as fh:
+            fh.write("chr3\t999\t0\t10\t11\n")
+        with pytest.raises(ValueError):
+            ReferenceGenome(fasta_path, genome_build)
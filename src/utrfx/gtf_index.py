@@ -0,0 +1,239 @@
+import os
+import tempfile
+import typing
+import zipfile
+
+import numpy as np
+
+
+class GtfIndex:
+    """
+    `GtfIndex` maps the positions of a sorted, uncompressed GTF file to byte offsets,
+    to read only the lines that overlap a region of interest.
+
+    The GTF lines must be grouped by `seqname` and sorted by `start` within each group,
+    e.g. by running `sort -k1,1 -k4,4n` on a GTF file without the header.
+
+    The index is a linear index: each contig is split into bins of `2 ** BIN_SHIFT` bases,
+    and the index stores the offset of the first line that overlaps each bin.
+
+    Use :meth:`build` to index a GTF file, and :meth:`save` and :meth:`load` to persist the index.
+    """
+
+    BIN_SHIFT = 14
+
+    def __init__(
+        self,
+        seqnames: typing.Sequence[str],
+        block_ends: typing.Sequence[int],
+        bin_offsets: typing.Sequence[int],
+        bins: typing.Sequence[int],
+        file_size: int,
+        file_mtime_ns: int,
+    ):
+        """
+        :param seqnames: the names of the indexed contigs.
+        :param block_ends: the offset right after the last line of each contig.
+        :param bin_offsets: `(n_contigs + 1)` offsets of the contig bins in `bins`.
+        :param bins: the offset of the first line overlapping each bin, or `-1` if no line overlaps the bin.
+        :param file_size: the size of the indexed file.
+        :param file_mtime_ns: the modification time of the indexed file.
+        """
+        self._seqnames = tuple(seqnames)
+        self._seqname_to_idx = {seqname: i for i, seqname in enumerate(self._seqnames)}
+        self._block_ends = np.asarray(block_ends, dtype=np.int64)
+        self._bin_offsets = np.asarray(bin_offsets, dtype=np.int64)
+        self._bins = np.asarray(bins, dtype=np.int64)
+        self._file_size = int(file_size)
+        self._file_mtime_ns = int(file_mtime_ns)
+
+    @staticmethod
+    def build(fpath: str) -> "GtfIndex":
+        """
+        Index a sorted, uncompressed GTF file.
+
+        :raises ValueError: if the file is compressed or not sorted.
+        """
+        if not fpath.endswith(".gtf"):
+            raise ValueError(f'Only uncompressed `.gtf` files can be indexed but got {fpath}')
+
+        seqnames = []
+        block_ends = []
+        bin_offsets = [0]
+        bins = []
+        current_bins = []
+        current_seqname = None
+        last_start = 0
+        offset = 0
+
+        with open(fpath, "rb") as fh:
+            for line in fh:
+                line_offset = offset
+                offset += len(line)
+                if line.startswith(b"#"):
+                    continue
+                fields = line.split(b"\t", 5)
+                if len(fields) < 6:
+                    continue
+
+                seqname = fields[0].decode()
+                start = int(fields[3]) - 1
+                end = int(fields[4])
+
+                if seqname != current_seqname:
+                    if current_seqname is not None:
+                        block_ends.append(line_offset)
+                        bins.extend(current_bins)
+                        bin_offsets.append(len(bins))
+                    if seqname in seqnames:
+                        raise ValueError(f'The lines of {seqname} are not contiguous, the GTF file must be sorted')
+                    seqnames.append(seqname)
+                    current_seqname = seqname
+                    current_bins = []
+                    last_start = 0
+                elif start < last_start:
+                    raise ValueError(f'The lines of {seqname} are not sorted by start at offset {line_offset}')
+                last_start = start
+
+                first_bin = start >> GtfIndex.BIN_SHIFT
+                last_bin = max(start, end - 1) >> GtfIndex.BIN_SHIFT
+                if len(current_bins) <= last_bin:
+                    current_bins.extend([-1] * (last_bin + 1 - len(current_bins)))
+                for b in range(first_bin, last_bin + 1):
+                    if current_bins[b] == -1:
+                        current_bins[b] = line_offset
+
+        if current_seqname is not None:
+            block_ends.append(offset)
+            bins.extend(current_bins)
+            bin_offsets.append(len(bins))
+
+        stat = os.stat(fpath)
+        return GtfIndex(seqnames, block_ends, bin_offsets, bins, stat.st_size, stat.st_mtime_ns)
+
+    @staticmethod
+    def index_path(fpath: str) -> str:
+        """
+        Get the path of the index of the GTF file at `fpath`.
+        """
+        return fpath + ".utrfx-idx.npz"
+
+    def save(self, fh: typing.Union[str, typing.BinaryIO]):
+        np.savez(
+            fh,
+            seqnames=np.array(self._seqnames, dtype=np.str_),
+            block_ends=self._block_ends,
+            bin_offsets=self._bin_offsets,
+            bins=self._bins,
+            file_stat=np.array([self._file_size, self._file_mtime_ns], dtype=np.int64),
+        )
+
+    @staticmethod
+    def load(fh: typing.Union[str, typing.BinaryIO]) -> "GtfIndex":
+        with np.load(fh, allow_pickle=False) as data:
+            file_size, file_mtime_ns = data["file_stat"].tolist()
+            return GtfIndex(
+                seqnames=data["seqnames"].tolist(),
+                block_ends=data["block_ends"],
+                bin_offsets=data["bin_offsets"],
+                bins=data["bins"],
+                file_size=file_size,
+                file_mtime_ns=file_mtime_ns,
+            )
+
+    @staticmethod
+    def load_or_build(fpath: str) -> "GtfIndex":
+        """
+        Load the index of the GTF file at `fpath`, if up to date, or build and try to save a new index.
+        """
+        index_path = GtfIndex.index_path(fpath)
+        if os.path.isfile(index_path):
+            try:
+                index = GtfIndex.load(index_path)
+                if index.is_current(fpath):
+                    return index
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+                # A corrupted or outdated index is rebuilt below.
+                pass
+
+        index = GtfIndex.build(fpath)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(index_path)), suffix=".tmp")
+        except OSError:
+            # E.g. a read-only folder. The index works from memory.
+            return index
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                index.save(fh)
+            os.replace(tmp_path, index_path)
+        except OSError:
+            os.remove(tmp_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return index
+
+    @property
+    def seqnames(self) -> typing.Sequence[str]:
+        return self._seqnames
+
+    def is_current(self, fpath: str) -> bool:
+        """
+        Test if the file at `fpath` has the size and modification time of the indexed file.
+        """
+        stat = os.stat(fpath)
+        return stat.st_size == self._file_size and stat.st_mtime_ns == self._file_mtime_ns
+
+    def query(self, seqname: str, start: int, end: int) -> typing.Optional[typing.Tuple[int, int]]:
+        """
+        Get the byte range that includes all lines overlapping the 0-based region `[start, end)` of `seqname`.
+
+        The range may also include lines that do not overlap the region.
+
+        :returns: a tuple with the start and end offsets or `None` if no line can overlap the region.
+        """
+        idx = self._seqname_to_idx.get(seqname)
+        if idx is None or start >= end:
+            return None
+
+        contig_bins = self._bins[self._bin_offsets[idx]:self._bin_offsets[idx + 1]]
+        first_bin = start >> GtfIndex.BIN_SHIFT
+        last_bin = min((end - 1) >> GtfIndex.BIN_SHIFT, len(contig_bins) - 1)
+        if first_bin > last_bin:
+            return None
+
+        offsets = contig_bins[first_bin:last_bin + 1]
+        offsets = offsets[offsets >= 0]
+        if len(offsets) == 0:
+            return None
+
+        return int(offsets.min()), int(self._block_ends[idx])
+
+    def fetch(self, fh: typing.BinaryIO, seqname: str, start: int, end: int) -> typing.Iterator[bytes]:
+        """
+        Read the lines of the GTF file opened in binary mode as `fh`
+        that overlap the 0-based region `[start, end)` of `seqname`.
+        """
+        byte_range = self.query(seqname, start, end)
+        if byte_range is None:
+            return
+
+        offset, block_end = byte_range
+        fh.seek(offset)
+        while offset < block_end:
+            line = fh.readline()
+            if not line:
+                break
+            offset += len(line)
+            if line.startswith(b"#"):
+                continue
+
+            fields = line.split(b"\t", 5)
+            line_start = int(fields[3]) - 1
+            if line_start >= end:
+                break
+            if start < int(fields[4]) and line_start < end:
+                yield line
+
+    def __repr__(self):
+        return f"GtfIndex(n_seqnames={len(self._seqnames)}, n_bins={len(self._bins)})"
@@ -1,83 +1,626 @@
-import typing
+import collections
+import contextlib
+import concurrent.futures
+import gzip
+import hashlib
+import io
+import os
+import queue
 import re
+import tempfile
+import threading
+import typing
+import zipfile
 
-import pandas as pd
 import numpy as np
+import pandas as pd
+
+from utrfx.genome import Contig, GenomeBuild, GenomicRegion, Strand
+from utrfx.gtf_index import GtfIndex
+from utrfx.model import FiveUTR, Transcript, TranscriptTable
+
+
+GTF_COLUMNS = (
+    "seqname",
+    "source",
+    "feature",
+    "start",
+    "end",
+    "score",
+    "strand",
+    "frame",
+    "attribute",
+)
+"""
+The nine tab-separated columns of a GTF file.
+"""
+
+DEFAULT_ATTRIBUTES = (
+    "transcript_id",
+)
+"""
+The attributes extracted by :func:`read_gtf` by default.
+"""
+
+_ATTRIBUTE_SCANNERS = {}
+
+
+def _attribute_scanner(fields: typing.Tuple[str, ...]):
+    scanner = _ATTRIBUTE_SCANNERS.get(fields)
+    if scanner is None:
+        # One alternation of all keys behind a literal space, which lets the regex engine skip straight
+        # to the candidate positions and prevents matching a suffix of another key
+        # (e.g. `level` in `transcript_support_level`). The attribute string is scanned with a leading space.
+        keys = "|".join(re.escape(field) for field in sorted(set(fields), key=len, reverse=True))
+        scanner = re.compile(rf' ({keys}) "?([^";]*)')
+        _ATTRIBUTE_SCANNERS[fields] = scanner
+    return scanner
+
+
+def parse_gtf_attributes(
+    attributes: typing.Sequence[str],
+    fields: typing.Sequence[str] = DEFAULT_ATTRIBUTES,
+) -> pd.DataFrame:
+    """
+    Extract the `fields` from the GTF `attribute` column.
+
+    All `fields` are extracted in a single pass over each row, with a scanner that is compiled once
+    per set of fields and reused across calls.
+    The values of fields that occur several times in a row (e.g. `tag`) are joined with a comma.
+    A field that is absent from a row is reported as `None`.
+
+    >>> from utrfx.gtf_io import parse_gtf_attributes
+    >>> df = parse_gtf_attributes(['gene_id "G1"; transcript_id "T1"; tag "basic"; tag "CCDS";'], ["transcript_id", "tag"])
+    >>> df.loc[0, "tag"]
+    'basic,CCDS'
+
+    :param attributes: a sequence with the attribute strings.
+    :param fields: the names of the attributes to extract.
+    :returns: a `DataFrame` with a column per field.
+    """
+    fields = tuple(fields)
+    if not isinstance(attributes, list):
+        attributes = list(attributes)
+
+    columns = {field: [None] * len(attributes) for field in fields}
+    if fields:
+        findall = _attribute_scanner(fields).findall
+        for i, attribute in enumerate(attributes):
+            for key, value in findall(" " + attribute):
+                column = columns[key]
+                previous = column[i]
+                column[i] = (value or None) if previous is None else previous + "," + value
+
+    return pd.DataFrame(columns, columns=list(fields), dtype=object)
+
+
+COMPRESSED_SUFFIXES = (".gz", ".bgz")
+"""
+The suffixes of gzip- and BGZF-compressed GTF files.
+"""
+
+
+def open_gtf(fpath: str) -> typing.TextIO:
+    """
+    Open a plain (`.gtf`) or a gzip/BGZF-compressed (`.gtf.gz`, `.gtf.bgz`) GTF file for reading text.
+
+    A compressed file is decompressed in a background thread, while the caller parses the lines
+    that have already been decompressed.
+    """
+    if fpath.endswith(".gtf"):
+        return open(fpath)
+
+    for suffix in COMPRESSED_SUFFIXES:
+        if fpath.endswith(".gtf" + suffix):
+            raw = _PrefetchingReader(gzip.open(fpath, "rb"))
+            return io.TextIOWrapper(io.BufferedReader(raw, buffer_size=_PREFETCH_CHUNK_SIZE))
+
+    raise AssertionError("Not a GTF file.")
+
+
+_PREFETCH_CHUNK_SIZE = 1 << 20
+_PREFETCH_CHUNKS = 8
+
+
+class _PrefetchingReader(io.RawIOBase):
+    """
+    A read-only stream that reads the `source` stream in chunks in a background thread.
+
+    At most `_PREFETCH_CHUNKS` chunks are held in memory. The decompression of a gzip `source`
+    releases the GIL, so it overlaps with the parsing done by the consumer.
+    """
+
+    def __init__(self, source: typing.BinaryIO):
+        self._source = source
+        self._chunks = queue.Queue(maxsize=_PREFETCH_CHUNKS)
+        self._stop = threading.Event()
+        self._buffer = memoryview(b"")
+        self._eof = False
+        self._thread = threading.Thread(target=self._fill, name="utrfx-gtf-prefetch", daemon=True)
+        self._thread.start()
+
+    def _fill(self):
+        try:
+            while not self._stop.is_set():
+                chunk = self._source.read(_PREFETCH_CHUNK_SIZE)
+                self._put(chunk)
+                if not chunk:
+                    break
+        except BaseException as e:
+            self._put(e)
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if not self._buffer:
+            if self._eof:
+                return 0
+            item = self._chunks.get()
+            if isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            if not item:
+                self._eof = True
+                return 0
+            self._buffer = memoryview(item)
+
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._source.close()
+        super().close()
+
+
+def read_gtf(
+    fpath: str,
+    attributes: typing.Sequence[str] = DEFAULT_ATTRIBUTES,
+    features: typing.Optional[typing.Collection[str]] = None,
+    workers: int = 1,
+) -> pd.DataFrame:
+    """
+    Read a GTF file into a `DataFrame` with the `seqname`, `feature`, `start`, `end`, and `strand` columns,
+    followed by a column for each of the requested `attributes`.
+
+    With `workers > 1`, the file is split into chunks at line boundaries and the chunks are parsed
+    in a pool of `workers` processes. The rows keep the file order.
+
+    :param fpath: path to the GTF file, optionally gzip/BGZF-compressed, see :func:`open_gtf`.
+    :param attributes: the names of the attributes to extract, see :func:`parse_gtf_attributes`.
+    :param features: the features (e.g. `UTR`) to keep or `None` to keep all rows.
+      The attributes are only parsed for the kept rows.
+    :param workers: the number of processes for parsing the file.
+    """
+    if workers < 1:
+        raise ValueError(f'`workers` must be positive but was {workers}')
+
+    with open_gtf(fpath) as fh:
+        if workers == 1:
+            gtf_df = _parse_gtf(fh, attributes, features)
+        else:
+            gtf_df = _parse_gtf_in_pool(fh, attributes, features, workers)
+
+    assert list(gtf_df.columns) == ["seqname", "feature", "start", "end", "strand", *attributes]
+
+    return gtf_df
+
+
+def _parse_gtf(
+    fh: typing.TextIO,
+    attributes: typing.Sequence[str],
+    features: typing.Optional[typing.Collection[str]],
+) -> pd.DataFrame:
+    gtf_df = pd.read_csv(
+        fh, sep = "\t", header = None, comment = "#", names = GTF_COLUMNS,
+        dtype = {"seqname": str, "start": np.int64, "end": np.int64},
+    )
+    if features is not None:
+        gtf_df = gtf_df[gtf_df["feature"].isin(features)].reset_index(drop=True)
+
+    attribute_df = parse_gtf_attributes(gtf_df["attribute"].tolist(), attributes)
+    attribute_df.index = gtf_df.index
+
+    return pd.concat([gtf_df[["seqname", "feature", "start", "end", "strand"]], attribute_df], axis=1)
+
+
+def _parse_gtf_text(
+    text: str,
+    attributes: typing.Sequence[str],
+    features: typing.Optional[typing.Collection[str]],
+) -> pd.DataFrame:
+    return _parse_gtf(io.StringIO(text), attributes, features)
+
+
+_PARALLEL_CHUNK_SIZE = 16 << 20
+
+
+def _iter_line_chunks(fh: typing.TextIO, size: int) -> typing.Iterator[str]:
+    """
+    Read `fh` in chunks of about `size` characters that end at a line boundary.
+    """
+    while True:
+        chunk = fh.read(size)
+        if not chunk:
+            return
+        if not chunk.endswith("\n"):
+            chunk += fh.readline()
+        yield chunk
+
+
+def _parse_gtf_in_pool(
+    fh: typing.TextIO,
+    attributes: typing.Sequence[str],
+    features: typing.Optional[typing.Collection[str]],
+    workers: int,
+) -> pd.DataFrame:
+    frames = []
+    pending = collections.deque()
+
+    # Keep a bounded number of chunks in flight to bound the memory of the main process.
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in _iter_line_chunks(fh, _PARALLEL_CHUNK_SIZE):
+            pending.append(executor.submit(_parse_gtf_text, chunk, attributes, features))
+            if len(pending) >= 2 * workers:
+                frames.append(pending.popleft().result())
+        while pending:
+            frames.append(pending.popleft().result())
+
+    if not frames:
+        return _parse_gtf_text("", attributes, features)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def read_gtf_into_txs(
+    fpath: str,
+    genome_build: GenomeBuild,
+    cache_dir: typing.Optional[str] = None,
+    workers: int = 1,
+    regions: typing.Optional[typing.Iterable[GenomicRegion]] = None,
+    index: typing.Optional[GtfIndex] = None,
+) -> typing.Collection[Transcript]:
+    """
+    Parse a GTF file and return the available transcripts, sorted by transcript ID.
+
+    If `regions` are given, only the transcripts whose `transcript` line overlaps any of the regions
+    (on either strand) are parsed. The GTF file must be sorted and uncompressed, see :class:`GtfIndex`.
+    The index is loaded from the file next to the GTF file, or built and saved there if missing or stale.
 
-from utrfx.genome import GenomeBuild, GRCh38, GenomicRegion, Strand
-from utrfx.model import FiveUTR, Transcript
-
-def read_gtf_into_txs(fpath: str, genome_build: GenomeBuild) -> typing.Collection[Transcript]:
-    """
-    Parse a GTF file and return the available transcripts.
-    """
-    assert fpath.endswith(".gtf"), "Not a GTF file."
-    gtf_df = pd.read_csv(fpath, sep = "\t", header = None, comment = "#")
-
-    gtf_df.columns = [
-            "seqname",
-            "source",
-            "feature",
-            "start",
-            "end",
-            "score",
-            "strand",
-            "frame",
-            "attribute",
-        ]
-
-    fields = [
-        "transcript_id",
-    ]
-    
-    for field in fields:
-        gtf_df[field] = gtf_df["attribute"].apply(lambda label: re.findall(rf'{field} "([^"]*)"', label)[0] if rf'{field} "' in label else '')
-    
-    pd.set_option("future.no_silent_downcasting", True)
-    gtf_df.replace('', np.nan, inplace=True)
-    gtf_df.drop(["source", "score", "frame", "attribute"], axis=1, inplace=True)
-    assert list(gtf_df.columns) == ["seqname", "feature", "start", "end", "strand", "transcript_id"]
-    
-    utr_df = gtf_df[gtf_df["feature"] == "UTR"]
-    start_codon_df = gtf_df[gtf_df["feature"] == "start_codon"]
+    :param fpath: path to the GTF file.
+    :param genome_build: the genome build of the GTF file.
+    :param cache_dir: path to a folder for caching the parsed transcripts, see :func:`read_gtf_into_table`.
+    :param workers: the number of processes for parsing the file, see :func:`read_gtf`.
+        Must be `1` with `regions`, as only the indexed lines of the regions are parsed.
+    :param regions: the regions of interest or `None` to parse the entire file.
+    :param index: the index of the GTF file to use with `regions` or `None` to use the index next to the GTF file.
+    """
+    if regions is not None:
+        if cache_dir is not None:
+            raise ValueError('`regions` cannot be combined with `cache_dir`')
+        if workers != 1:
+            raise ValueError(f'`regions` cannot be combined with `workers` but `workers` was {workers}')
+        if index is None:
+            index = GtfIndex.load_or_build(fpath)
+        gtf_df = _read_gtf_regions(fpath, genome_build, regions, index)
+        return _gtf_df_into_txs(gtf_df, genome_build)
+
+    if cache_dir is not None:
+        return list(read_gtf_into_table(fpath, genome_build, cache_dir=cache_dir, workers=workers))
+
+    gtf_df = read_gtf(fpath, attributes=("transcript_id",), features=("UTR", "start_codon"), workers=workers)
+
+    return _gtf_df_into_txs(gtf_df, genome_build)
+
+
+def _read_gtf_regions(
+    fpath: str,
+    genome_build: GenomeBuild,
+    regions: typing.Iterable[GenomicRegion],
+    index: GtfIndex,
+) -> pd.DataFrame:
+    """
+    Read the UTR and start codon rows of the transcripts that overlap the `regions`.
+
+    The transcripts are found from the `transcript` lines, and then all lines within the transcript spans
+    are read to collect the UTRs and start codons.
+    """
+    seqname_by_contig = {}
+    for seqname in index.seqnames:
+        contig = genome_build.contig_by_name(seqname)
+        if contig is not None:
+            seqname_by_contig.setdefault(contig, seqname)
+
+    tx_ids = set()
+    spans = {}
+    lines = []
+    with open(fpath, "rb") as fh:
+        for region in regions:
+            seqname = seqname_by_contig.get(region.contig)
+            if seqname is None:
+                continue
+            start = region.start_on_strand(Strand.POSITIVE)
+            end = region.end_on_strand(Strand.POSITIVE)
+            for line in index.fetch(fh, seqname, start, end):
+                fields = line.split(b"\t", 8)
+                if fields[2] == b"transcript":
+                    tx_id = _parse_attribute(fields[8].decode(), "transcript_id")
+                    if tx_id is not None:
+                        tx_ids.add(tx_id)
+                        spans.setdefault(seqname, []).append((int(fields[3]) - 1, int(fields[4])))
+
+        for seqname, seq_spans in spans.items():
+            for start, end in _merge_spans(seq_spans):
+                for line in index.fetch(fh, seqname, start, end):
+                    fields = line.split(b"\t", 8)
+                    if fields[2] == b"UTR" or fields[2] == b"start_codon":
+                        if _parse_attribute(fields[8].decode(), "transcript_id") in tx_ids:
+                            text = line.decode()
+                            lines.append(text if text.endswith("\n") else text + "\n")
+
+    return _parse_gtf_text("".join(lines), ("transcript_id",), None)
+
+
+def _merge_spans(spans: typing.Iterable[typing.Tuple[int, int]]) -> typing.List[typing.Tuple[int, int]]:
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def read_gtf_into_table(
+    fpath: str,
+    genome_build: GenomeBuild,
+    cache_dir: typing.Optional[str] = None,
+    workers: int = 1,
+) -> TranscriptTable:
+    """
+    Parse a GTF file and return the available transcripts as a :class:`TranscriptTable`.
+
+    If `cache_dir` is set, the table is stored in the folder as a binary `.npz` file and reused by later calls
+    as long as the path, size, and modification time of the GTF file and the genome build are the same.
+    A cache entry of a modified GTF file is replaced on the next call.
+
+    :param fpath: path to the GTF file.
+    :param genome_build: the genome build of the GTF file.
+    :param cache_dir: path to a folder for caching the parsed transcripts or `None` if no caching should be done.
+    :param workers: the number of processes for parsing the file, see :func:`read_gtf`.
+    """
+    if cache_dir is None:
+        return TranscriptTable.from_transcripts(read_gtf_into_txs(fpath, genome_build, workers=workers), genome_build)
+
+    path_key, state_key = _cache_keys(fpath, genome_build)
+    cache_path = os.path.join(cache_dir, f"{path_key}-{state_key}.npz")
+    if os.path.isfile(cache_path):
+        try:
+            return TranscriptTable.load(cache_path, genome_build)
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            # A corrupted or incompatible entry is rebuilt below.
+            pass
+
+    table = TranscriptTable.from_transcripts(read_gtf_into_txs(fpath, genome_build, workers=workers), genome_build)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    for entry in os.listdir(cache_dir):
+        if entry.startswith(path_key + "-") and entry.endswith(".npz"):
+            # Another process may be rebuilding the same entry and remove it first.
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(cache_dir, entry))
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            table.save(fh, genome_build)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    return table
+
+
+_CACHE_VERSION = "1"
+
+
+def _cache_keys(fpath: str, genome_build: GenomeBuild) -> typing.Tuple[str, str]:
+    """
+    Get the keys of the GTF file path and of the file state (size, modification time, genome build).
+    """
+    abspath = os.path.abspath(fpath)
+    stat = os.stat(abspath)
+    path_key = hashlib.sha256(abspath.encode()).hexdigest()[:16]
+    state = f"{stat.st_size}|{stat.st_mtime_ns}|{genome_build.identifier}|{_CACHE_VERSION}"
+    state_key = hashlib.sha256(state.encode()).hexdigest()[:16]
+    return path_key, state_key
+
+
+def _gtf_df_into_txs(gtf_df: pd.DataFrame, genome_build: GenomeBuild) -> typing.List[Transcript]:
+    """
+    Build the transcripts from the UTR and start codon rows of a GTF `DataFrame`, sorted by transcript ID.
+
+    The start codons are looked up by transcript ID and the UTR rows are grouped by a stable sort,
+    so the work grows linearly with the number of rows.
+    """
+    start_codon_df = gtf_df[gtf_df["feature"] == "start_codon"].dropna(subset=["transcript_id"])
+    start_codon_df = start_codon_df.drop_duplicates(subset="transcript_id", keep="first")
+    start_codons = dict(zip(
+        start_codon_df["transcript_id"].tolist(),
+        zip(start_codon_df["start"].tolist(), start_codon_df["end"].tolist(), start_codon_df["strand"].tolist()),
+    ))
+
+    utr_df = gtf_df[gtf_df["feature"] == "UTR"].dropna(subset=["transcript_id"])
+    if utr_df.empty:
+        return []
+
+    utr_df = utr_df.sort_values("transcript_id", kind="stable")
+    tx_ids = utr_df["transcript_id"].to_numpy()
+    seqnames = utr_df["seqname"].to_numpy()
+    utr_rows = list(zip(utr_df["start"].tolist(), utr_df["end"].tolist(), utr_df["strand"].tolist()))
+
+    bounds = np.concatenate(([0], np.flatnonzero(tx_ids[1:] != tx_ids[:-1]) + 1, [len(tx_ids)]))
+    contigs = {}
     transcripts = []
-    
-    for transcript_id, group in utr_df.groupby("transcript_id"):
-        contig = genome_build.contig_by_name(group["seqname"].iloc[0])
+
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        transcript_id = tx_ids[lo]
+        seqname = seqnames[lo]
+        if seqname not in contigs:
+            contigs[seqname] = genome_build.contig_by_name(seqname)
+        contig = contigs[seqname]
         if contig is None:
-            print("no contig found")
-        else:
-            start_codon = start_codon_df[start_codon_df["transcript_id"] == transcript_id]
-
-            temp_utr_5prime_list = []
-
-            if not start_codon.empty:
-                temp_start_codon = start_codon.iloc[0]
-                actual_start_codon_strand = parse_strand(temp_start_codon["strand"])
-                temp_start_codon = GenomicRegion(
-                    contig=contig,
-                    start=int(temp_start_codon["start"]) - 1,
-                    end=int(temp_start_codon["end"]),
-                    strand=Strand.POSITIVE,
-                ).with_strand(actual_start_codon_strand)
-
-                for _, row in group.iterrows():
-                    actual_feature_strand = parse_strand(row["strand"])
-                    utr_region = GenomicRegion(
-                        contig=contig,
-                        start=row["start"] - 1, 
-                        end=row["end"],
-                        strand=Strand.POSITIVE,
-                    ).with_strand(actual_feature_strand)
-
-                    if utr_region.distance_to(temp_start_codon) >= 0:
-                        temp_utr_5prime_list.append(utr_region)
-            
-            if temp_utr_5prime_list:
-                transcripts.append(Transcript(tx_id=transcript_id, five_utr=FiveUTR(regions=temp_utr_5prime_list)))
+            # E.g. a scaffold or a patch that is not part of the genome build.
+            continue
+
+        start_codon_row = start_codons.get(transcript_id)
+        if start_codon_row is not None:
+            tx = _build_transcript(
+                tx_id=transcript_id,
+                contig=contig,
+                utr_rows=utr_rows[lo:hi],
+                start_codon_row=start_codon_row,
+            )
+            if tx is not None:
+                transcripts.append(tx)
 
     return transcripts
 
+
+def iter_gtf_transcripts(fpath: str, genome_build: GenomeBuild) -> typing.Iterator[Transcript]:
+    """
+    Parse a GTF file line by line and yield the available transcripts.
+
+    Unlike :func:`read_gtf_into_txs`, the file is never loaded as a whole. A transcript is yielded
+    as soon as a line of another transcript shows up, hence the peak memory depends on the largest
+    transcript and not on the file size. The rows of a transcript must be contiguous,
+    as in the GTF files distributed by GENCODE and Ensembl, and the transcripts are yielded in the file order.
+    Transcripts on contigs that are not in the `genome_build` are skipped.
+
+    :raises ValueError: if the rows of a transcript are not contiguous.
+    """
+    completed = set()
+    current_tx_id = None
+    seqname = None
+    utr_rows = []
+    start_codon_row = None
+
+    with open_gtf(fpath) as fh:
+        for line in fh:
+            if line.startswith("#"):
+                continue
+            fields = line.rstrip("\n").split("\t")
+            if len(fields) != 9:
+                continue
+            if fields[2] != "UTR" and fields[2] != "start_codon":
+                continue
+
+            tx_id = _parse_attribute(fields[8], "transcript_id")
+            if tx_id is None:
+                continue
+
+            if tx_id != current_tx_id:
+                if tx_id in completed:
+                    raise ValueError(f'The rows of transcript {tx_id} are not contiguous in {fpath}')
+                if current_tx_id is not None:
+                    completed.add(current_tx_id)
+                    tx = _complete_transcript(current_tx_id, seqname, utr_rows, start_codon_row, genome_build)
+                    if tx is not None:
+                        yield tx
+                current_tx_id = tx_id
+                seqname = fields[0]
+                utr_rows = []
+                start_codon_row = None
+
+            row = (int(fields[3]), int(fields[4]), fields[6])
+            if fields[2] == "UTR":
+                utr_rows.append(row)
+            elif start_codon_row is None:
+                start_codon_row = row
+
+    if current_tx_id is not None:
+        tx = _complete_transcript(current_tx_id, seqname, utr_rows, start_codon_row, genome_build)
+        if tx is not None:
+            yield tx
+
+
+def _parse_attribute(attribute: str, field: str) -> typing.Optional[str]:
+    found = _attribute_scanner((field,)).search(" " + attribute)
+    return found.group(2) if found else None
+
+
+def _complete_transcript(
+    tx_id: str,
+    seqname: str,
+    utr_rows: typing.Sequence[typing.Tuple[int, int, str]],
+    start_codon_row: typing.Optional[typing.Tuple[int, int, str]],
+    genome_build: GenomeBuild,
+) -> typing.Optional[Transcript]:
+    if not utr_rows:
+        return None
+
+    contig = genome_build.contig_by_name(seqname)
+    if contig is None:
+        # E.g. a scaffold or a patch that is not part of the genome build.
+        return None
+
+    if start_codon_row is None:
+        return None
+
+    return _build_transcript(tx_id, contig, utr_rows, start_codon_row)
+
+
+def _build_transcript(
+    tx_id: str,
+    contig: Contig,
+    utr_rows: typing.Iterable[typing.Tuple[int, int, str]],
+    start_codon_row: typing.Tuple[int, int, str],
+) -> typing.Optional[Transcript]:
+    """
+    Create a transcript from the 1-based `(start, end, strand)` rows of its UTRs and start codon.
+
+    Only the UTRs located upstream of the start codon make it into the 5'UTR.
+    Returns `None` if the transcript has no 5'UTR.
+    """
+    start_codon = _gtf_row_to_region(contig, *start_codon_row)
+
+    utr_5prime_list = []
+    for start, end, strand in utr_rows:
+        utr_region = _gtf_row_to_region(contig, start, end, strand)
+
+        if utr_region.distance_to(start_codon) >= 0:
+            utr_5prime_list.append(utr_region)
+
+    if utr_5prime_list:
+        return Transcript(tx_id=tx_id, five_utr=FiveUTR(regions=utr_5prime_list))
+    return None
+
+
+def _gtf_row_to_region(contig: Contig, start: int, end: int, strand: str) -> GenomicRegion:
+    """
+    Create a region from the 1-based closed coordinates of a GTF row, with a single bounds check
+    instead of the full validation of the `GenomicRegion` constructor.
+    """
+    start = int(start) - 1
+    end = int(end)
+    if not 0 <= start <= end <= len(contig):
+        raise ValueError(f'Invalid GTF coordinates {start + 1}-{end} for contig {contig.name} of length {len(contig)}')
+    return GenomicRegion._unchecked(contig, start, end, Strand.POSITIVE).with_strand(parse_strand(strand))
+
+
 def parse_strand(val: str) -> Strand:
     if val == "+":
         return Strand.POSITIVE
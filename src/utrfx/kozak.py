@@ -0,0 +1,135 @@
+import typing
+
+import numpy as np
+import pandas as pd
+
+from .sequence import NUCLEOTIDES, N_CODES, codon_code, codon_codes, encode_sequences
+
+KOZAK_OFFSETS = np.arange(-6, 5)
+"""
+The offsets of the Kozak context positions -6 to -1 and +1 to +5 relative to the first base of the start codon.
+"""
+
+
+def _consensus_pwm(consensus: str, weights: typing.Sequence[float]) -> np.ndarray:
+    """
+    Create a log-odds matrix where the nucleotides of the `consensus` at each position share the probability
+    `weights[i]`, the other nucleotides share the rest, and `N` positions are neutral.
+    """
+    iupac = {"A": "A", "C": "C", "G": "G", "T": "T", "R": "AG", "Y": "CT", "N": "ACGT"}
+    pwm = np.zeros((len(consensus), len(NUCLEOTIDES)), dtype=np.float64)
+    for i, (symbol, weight) in enumerate(zip(consensus, weights)):
+        matching = iupac[symbol]
+        if len(matching) == len(NUCLEOTIDES):
+            continue
+        for j, nucleotide in enumerate(NUCLEOTIDES):
+            if nucleotide in matching:
+                p = weight / len(matching)
+            else:
+                p = (1 - weight) / (len(NUCLEOTIDES) - len(matching))
+            pwm[i, j] = np.log2(p / 0.25)
+    return pwm
+
+
+DEFAULT_KOZAK_PWM = _consensus_pwm(
+    "GCCRCCNNNGN",
+    (0.4, 0.4, 0.4, 0.9, 0.4, 0.4, 0, 0, 0, 0.7, 0),
+)
+"""
+The default position-weight matrix of :func:`score_kozak` with an `(11, 4)` shape: a row per position
+of :data:`KOZAK_OFFSETS` and a column per nucleotide of :data:`utrfx.sequence.NUCLEOTIDES`.
+
+The matrix is a heuristic derived from the consensus `gccRccATGG`: the log2 odds of the consensus nucleotides
+against a uniform background, with the -3 and +4 positions weighted more than the rest.
+The start codon itself does not contribute to the score.
+Use a matrix fit to your data for quantitative work.
+"""
+
+
+def score_kozak(
+    sequences: typing.Sequence[str],
+    seq_indices: np.ndarray,
+    positions: np.ndarray,
+    pwm: typing.Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Score the Kozak context of start codons with a position-weight matrix.
+
+    The score is the sum of the matrix weights of the nucleotides at the :data:`KOZAK_OFFSETS` around the start codon.
+    The positions outside of the sequence and the nucleotides other than `A`, `C`, `G`, or `T` add nothing.
+
+    :param sequences: the nucleotide sequences.
+    :param seq_indices: the index of the sequence of each start codon.
+    :param positions: the 0-based offset of each start codon in its sequence.
+    :param pwm: an `(11, 4)` matrix or `None` for :data:`DEFAULT_KOZAK_PWM`.
+    :returns: a `float64` array with the score of each start codon.
+    """
+    codes, seq_offsets = encode_sequences(sequences)
+    return _score_kozak_codes(codes, seq_offsets, np.asarray(seq_indices, dtype=np.int64),
+                              np.asarray(positions, dtype=np.int64), pwm)
+
+
+def _score_kozak_codes(
+    codes: np.ndarray,
+    seq_offsets: np.ndarray,
+    seq_indices: np.ndarray,
+    positions: np.ndarray,
+    pwm: typing.Optional[np.ndarray],
+) -> np.ndarray:
+    pwm = DEFAULT_KOZAK_PWM if pwm is None else np.asarray(pwm, dtype=np.float64)
+    if pwm.shape != (len(KOZAK_OFFSETS), len(NUCLEOTIDES)):
+        raise ValueError(f'`pwm` must have the shape {(len(KOZAK_OFFSETS), len(NUCLEOTIDES))} but was {pwm.shape}')
+    # A zero column for the other characters.
+    weights = np.zeros((len(KOZAK_OFFSETS), N_CODES), dtype=np.float64)
+    weights[:, :len(NUCLEOTIDES)] = pwm
+
+    # A row of the window positions per start codon, gathered at once.
+    local = positions[:, None] + KOZAK_OFFSETS[None, :]
+    lengths = (seq_offsets[seq_indices + 1] - seq_offsets[seq_indices])[:, None]
+    inside = (local >= 0) & (local < lengths)
+    window_codes = np.full(local.shape, len(NUCLEOTIDES), dtype=np.uint8)
+    window_codes[inside] = codes[(seq_offsets[seq_indices][:, None] + local)[inside]]
+    return weights[np.arange(len(KOZAK_OFFSETS))[None, :], window_codes].sum(axis=1)
+
+
+def score_start_codons(
+    transcripts: typing.Iterable[typing.Tuple[str, str, int]],
+    pwm: typing.Optional[np.ndarray] = None,
+) -> pd.DataFrame:
+    """
+    Score the Kozak context of every `ATG` in the 5'UTRs and of the CDS starts of many transcripts at once.
+
+    The context is taken from the transcript sequence, hence the context of an `ATG` near the end of the 5'UTR
+    extends into the CDS.
+
+    :param transcripts: triples of the transcript identifier, the transcript sequence,
+      and the 0-based offset of the CDS start codon, i.e. the length of the 5'UTR.
+    :param pwm: an `(11, 4)` matrix or `None` for :data:`DEFAULT_KOZAK_PWM`.
+    :returns: a data frame with the `tx_id`, `position`, `is_cds_start`, and `score` columns,
+      a row per start codon, in the order of the transcripts and the position.
+    """
+    transcripts = list(transcripts)
+    tx_ids = np.array([tx_id for tx_id, _, _ in transcripts], dtype=object)
+    cds_starts = np.array([cds_start for _, _, cds_start in transcripts], dtype=np.int64)
+    codes, seq_offsets = encode_sequences([seq for _, seq, _ in transcripts])
+    if np.any(cds_starts < 0) or np.any(cds_starts > np.diff(seq_offsets)):
+        raise ValueError('The CDS starts must be located within the transcript sequences')
+
+    atgs = np.flatnonzero(codon_codes(codes) == codon_code("ATG"))
+    atg_seqs = np.searchsorted(seq_offsets, atgs, side="right") - 1
+    atg_positions = atgs - seq_offsets[atg_seqs]
+    in_utr = (atg_positions < cds_starts[atg_seqs]) & (atgs + 3 <= seq_offsets[atg_seqs + 1])
+
+    seq_indices = np.concatenate([atg_seqs[in_utr], np.arange(len(transcripts), dtype=np.int64)])
+    positions = np.concatenate([atg_positions[in_utr], cds_starts])
+    is_cds_start = np.concatenate([np.zeros(np.count_nonzero(in_utr), dtype=bool),
+                                   np.ones(len(transcripts), dtype=bool)])
+    order = np.lexsort((positions, seq_indices))
+    seq_indices, positions, is_cds_start = seq_indices[order], positions[order], is_cds_start[order]
+
+    return pd.DataFrame({
+        "tx_id": tx_ids[seq_indices],
+        "position": positions,
+        "is_cds_start": is_cds_start,
+        "score": _score_kozak_codes(codes, seq_offsets, seq_indices, positions, pwm),
+    })
@@ -1,6 +1,8 @@
 import typing
-    
-from .genome import GenomicRegion
+
+import numpy as np
+
+from .genome import Contig, GenomeBuild, GenomicRegion, GenomicRegionArray, Strand
 
 class Region:
     """
@@ -66,6 +68,8 @@ class FiveUTR:
     `FiveUTR` is a container for 5'UTR Genomic Regions.
     """
 
+    __slots__ = ("_regions",)
+
     def __init__(
         self,
         regions: typing.Collection[GenomicRegion],
@@ -84,7 +88,9 @@ class Transcript:
     """
     `Transcript` represents the 5'UTR Genomic Region(s) of a transcript.
     """
-    
+
+    __slots__ = ("_tx_id", "_five_utr")
+
     def __init__(
         self, 
         tx_id: str, 
@@ -97,5 +103,227 @@ class Transcript:
     def tx_id(self) -> str:
         return self._tx_id
 
+    @property
+    def five_utr(self) -> FiveUTR:
+        return self._five_utr
+
+    def __repr__(self):
+        return f"Transcript(tx_id={self._tx_id}, five_utr={repr(self._five_utr)})"
+
+
+class TranscriptTable(typing.Sized):
+    """
+    `TranscriptTable` is a columnar container for the 5'UTR Genomic Regions of many transcripts.
+
+    The regions of all transcripts are stored in NumPy arrays (contig codes, starts, ends, and strands),
+    and the regions of the `i`-th transcript are located at `offsets[i]:offsets[i + 1]`.
+    A contig code is the index of the contig in :attr:`contigs`.
+    :class:`Transcript` and :class:`GenomicRegion` views are created on demand.
+
+    Use :meth:`from_transcripts` to create a table, e.g. straight from
+    :func:`utrfx.gtf_io.iter_gtf_transcripts` to never hold all transcripts as objects.
+    """
+
+    def __init__(
+        self,
+        contigs: typing.Sequence[Contig],
+        tx_ids: np.ndarray,
+        offsets: np.ndarray,
+        contig_codes: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        strands: np.ndarray,
+    ):
+        self._contigs = tuple(contigs)
+        self._tx_ids = np.asarray(tx_ids, dtype=np.str_)
+        self._offsets = np.asarray(offsets, dtype=np.int64)
+        self._contig_codes = np.asarray(contig_codes, dtype=np.int32)
+        self._starts = np.asarray(starts, dtype=np.int64)
+        self._ends = np.asarray(ends, dtype=np.int64)
+        self._strands = np.asarray(strands, dtype=np.int8)
+
+        if len(self._offsets) != len(self._tx_ids) + 1:
+            raise ValueError(f'Expected {len(self._tx_ids) + 1} offsets but got {len(self._offsets)}')
+        n_regions = int(self._offsets[-1])
+        for name, array in (("contig_codes", self._contig_codes), ("starts", self._starts),
+                            ("ends", self._ends), ("strands", self._strands)):
+            if len(array) != n_regions:
+                raise ValueError(f'Expected {n_regions} `{name}` but got {len(array)}')
+        # Validate once here, so that the region views can skip the checks.
+        GenomicRegionArray(self._contigs, self._contig_codes, self._starts, self._ends, self._strands)
+
+    @staticmethod
+    def from_transcripts(
+        transcripts: typing.Iterable[Transcript],
+        genome_build: GenomeBuild,
+    ) -> "TranscriptTable":
+        """
+        Create a table from the `transcripts` located on the contigs of the `genome_build`.
+
+        :param transcripts: an iterable of transcripts, consumed one transcript at a time.
+        :param genome_build: the genome build with the contigs of the transcripts.
+        """
+        contig_codes = {contig: code for code, contig in enumerate(genome_build.contigs)}
+        tx_ids = []
+        offsets = [0]
+        codes = []
+        starts = []
+        ends = []
+        strands = []
+
+        for tx in transcripts:
+            tx_ids.append(tx.tx_id)
+            for region in tx.five_utr.regions():
+                codes.append(contig_codes[region.contig])
+                starts.append(region.start)
+                ends.append(region.end)
+                strands.append(1 if region.strand.is_positive() else -1)
+            offsets.append(len(starts))
+
+        return TranscriptTable(
+            contigs=genome_build.contigs,
+            tx_ids=np.array(tx_ids, dtype=np.str_),
+            offsets=np.array(offsets, dtype=np.int64),
+            contig_codes=np.array(codes, dtype=np.int32),
+            starts=np.array(starts, dtype=np.int64),
+            ends=np.array(ends, dtype=np.int64),
+            strands=np.array(strands, dtype=np.int8),
+        )
+
+    def save(self, fh: typing.BinaryIO, genome_build: GenomeBuild):
+        """
+        Write the table into `fh` as an uncompressed `.npz` archive.
+
+        The contigs are stored as codes, so the table must be loaded with the same `genome_build`.
+        """
+        if self._contigs != tuple(genome_build.contigs):
+            raise ValueError(f'The table contigs do not belong to {genome_build.identifier}')
+        np.savez(
+            fh,
+            genome_build=np.array(genome_build.identifier),
+            tx_ids=self._tx_ids,
+            offsets=self._offsets,
+            contig_codes=self._contig_codes,
+            starts=self._starts,
+            ends=self._ends,
+            strands=self._strands,
+        )
+
+    @staticmethod
+    def load(fh: typing.Union[str, typing.BinaryIO], genome_build: GenomeBuild) -> "TranscriptTable":
+        """
+        Read a table written by :meth:`save`.
+
+        :raises ValueError: if the table was saved with another genome build.
+        """
+        with np.load(fh, allow_pickle=False) as data:
+            identifier = str(data["genome_build"])
+            if identifier != genome_build.identifier:
+                raise ValueError(f'The table was saved for {identifier} but {genome_build.identifier} was given')
+            return TranscriptTable(
+                contigs=genome_build.contigs,
+                tx_ids=data["tx_ids"],
+                offsets=data["offsets"],
+                contig_codes=data["contig_codes"],
+                starts=data["starts"],
+                ends=data["ends"],
+                strands=data["strands"],
+            )
+
+    @property
+    def contigs(self) -> typing.Sequence[Contig]:
+        return self._contigs
+
+    @property
+    def tx_ids(self) -> np.ndarray:
+        return self._tx_ids
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """
+        Get the `(n_transcripts + 1)` offsets of the transcript regions.
+        """
+        return self._offsets
+
+    @property
+    def contig_codes(self) -> np.ndarray:
+        return self._contig_codes
+
+    @property
+    def starts(self) -> np.ndarray:
+        """
+        Get the 0-based (excluded) region starts on the region strands.
+        """
+        return self._starts
+
+    @property
+    def ends(self) -> np.ndarray:
+        """
+        Get the 0-based (included) region ends on the region strands.
+        """
+        return self._ends
+
+    @property
+    def strands(self) -> np.ndarray:
+        """
+        Get the region strands, `1` for the positive and `-1` for the negative strand.
+        """
+        return self._strands
+
+    def region_count(self) -> int:
+        return len(self._starts)
+
+    def region_array(self) -> GenomicRegionArray:
+        """
+        Get the regions of all transcripts as a :class:`GenomicRegionArray` that shares the arrays of the table.
+        """
+        return GenomicRegionArray(self._contigs, self._contig_codes, self._starts, self._ends, self._strands)
+
+    def region(self, index: int) -> GenomicRegion:
+        """
+        Get the `index`-th region of the table as a :class:`GenomicRegion`.
+        """
+        return GenomicRegion._unchecked(
+            contig=self._contigs[self._contig_codes[index]],
+            start=int(self._starts[index]),
+            end=int(self._ends[index]),
+            strand=Strand.POSITIVE if self._strands[index] == 1 else Strand.NEGATIVE,
+        )
+
+    def regions(self, index: int) -> typing.List[GenomicRegion]:
+        """
+        Get the 5'UTR regions of the `index`-th transcript.
+        """
+        return [self.region(i) for i in range(self._offsets[index], self._offsets[index + 1])]
+
+    def transcript(self, index: int) -> Transcript:
+        """
+        Get the `index`-th transcript as a :class:`Transcript`.
+        """
+        return Transcript(tx_id=str(self._tx_ids[index]), five_utr=FiveUTR(regions=self.regions(index)))
+
+    def __getitem__(self, index: int) -> Transcript:
+        if not -len(self) <= index < len(self):
+            raise IndexError(f'Transcript index {index} is out of range for {len(self)} transcripts')
+        return self.transcript(index % len(self))
+
+    def __iter__(self) -> typing.Iterator[Transcript]:
+        # Convert the columns into lists once, instead of indexing NumPy arrays per region.
+        offsets = self._offsets.tolist()
+        contigs = [self._contigs[code] for code in self._contig_codes.tolist()]
+        starts = self._starts.tolist()
+        ends = self._ends.tolist()
+        strands = [Strand.POSITIVE if strand == 1 else Strand.NEGATIVE for strand in self._strands.tolist()]
+
+        for i, tx_id in enumerate(self._tx_ids.tolist()):
+            regions = [
+                GenomicRegion._unchecked(contig=contigs[j], start=starts[j], end=ends[j], strand=strands[j])
+                for j in range(offsets[i], offsets[i + 1])
+            ]
+            yield Transcript(tx_id=tx_id, five_utr=FiveUTR(regions=regions))
+
+    def __len__(self) -> int:
+        return len(self._tx_ids)
+
     def __repr__(self):
-        return f"Transcript(tx_id={self._tx_id}, five_utr={repr(self._five_utr)})"
\ No newline at end of file
+        return f"TranscriptTable(n_transcripts={len(self)}, n_regions={self.region_count()})"
\ No newline at end of file
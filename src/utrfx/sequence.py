@@ -0,0 +1,165 @@
+import typing
+
+import numpy as np
+
+NUCLEOTIDES = "ACGT"
+"""
+The nucleotides in the order of their codes. Any other character is encoded as `len(NUCLEOTIDES)`.
+"""
+
+N_CODES = len(NUCLEOTIDES) + 1
+
+_ENCODING = np.full(256, len(NUCLEOTIDES), dtype=np.uint8)
+for _code, _nucleotide in enumerate(NUCLEOTIDES):
+    _ENCODING[ord(_nucleotide)] = _code
+
+
+_IS_GC_CODE = np.zeros(N_CODES, dtype=bool)
+_IS_GC_CODE[[NUCLEOTIDES.index("G"), NUCLEOTIDES.index("C")]] = True
+_GC_FLAGS = _IS_GC_CODE[_ENCODING].astype(np.uint8).tobytes()
+
+
+def encode_sequences(sequences: typing.Sequence[str]) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode the nucleotide `sequences` into one `uint8` array of nucleotide codes.
+
+    The sequences are case-sensitive: only the upper-case `A`, `C`, `G`, and `T` get their own codes.
+
+    :param sequences: the nucleotide sequences.
+    :returns: a tuple with the codes of the concatenated sequences and `(len(sequences) + 1)` offsets
+      such that the `i`-th sequence is located at `offsets[i]:offsets[i + 1]`.
+    """
+    lengths = np.fromiter((len(seq) for seq in sequences), dtype=np.int64, count=len(sequences))
+    offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    data = "".join(sequences).encode("ascii")
+    codes = _ENCODING[np.frombuffer(data, dtype=np.uint8)]
+    return codes, offsets
+
+
+def codon_code(codon: str) -> int:
+    """
+    Get the code of a codon, as computed by :func:`codon_codes`.
+    """
+    if len(codon) != 3:
+        raise ValueError(f'A codon must have 3 nucleotides but got {codon!r}')
+    first, second, third = (int(_ENCODING[ord(nucleotide)]) for nucleotide in codon)
+    return (first * N_CODES + second) * N_CODES + third
+
+
+def codon_codes(codes: np.ndarray) -> np.ndarray:
+    """
+    Get the code of the codon starting at each position of the nucleotide `codes`.
+
+    The last two positions do not start a codon, hence the result has `len(codes) - 2` items.
+    The codons that contain a character other than `A`, `C`, `G`, or `T` never match a code of a valid codon.
+    """
+    if len(codes) < 3:
+        return np.zeros(0, dtype=np.int16)
+    codes = codes.astype(np.int16)
+    return (codes[:-2] * N_CODES + codes[1:-1]) * N_CODES + codes[2:]
+
+
+def codon_mask(codons: typing.Iterable[str]) -> np.ndarray:
+    """
+    Get a lookup table over the codes of :func:`codon_codes` that is `True` at the codes of the `codons`.
+    """
+    mask = np.zeros(N_CODES ** 3, dtype=bool)
+    mask[[codon_code(codon) for codon in codons]] = True
+    return mask
+
+
+class GCIndex(typing.Sized):
+    """
+    `GCIndex` answers the GC content of any window of a nucleotide sequence in constant time.
+
+    The index stores the number of `G` and `C` nucleotides before each position of the sequence.
+    The windows are 0-based half-open ranges `[start, end)`, and the GC content is a percentage.
+
+    Use :meth:`from_codes` to index the sequences encoded by :func:`encode_sequences` at once,
+    with the windows given as offsets into the concatenated sequences.
+
+    :param sequence: the nucleotide sequence.
+    """
+
+    def __init__(self, sequence: str):
+        # Translating the bytes to 0/1 flags is cheaper than a NumPy lookup for the typical short UTR.
+        is_gc = np.frombuffer(sequence.encode("ascii").translate(_GC_FLAGS), dtype=np.uint8)
+        self._gc_before = GCIndex._prefix_sum(is_gc)
+
+    @staticmethod
+    def from_codes(codes: np.ndarray) -> "GCIndex":
+        """
+        Create the index from the nucleotide `codes` of :func:`encode_sequences`.
+        """
+        index = GCIndex.__new__(GCIndex)
+        index._gc_before = GCIndex._prefix_sum(_IS_GC_CODE[codes])
+        return index
+
+    @staticmethod
+    def _prefix_sum(is_gc: np.ndarray) -> np.ndarray:
+        gc_before = np.zeros(len(is_gc) + 1, dtype=np.int64)
+        np.cumsum(is_gc, out=gc_before[1:])
+        return gc_before
+
+    def gc_count(self, start: int, end: int) -> int:
+        """
+        Get the number of `G` and `C` nucleotides in the window `[start, end)`.
+        """
+        if not 0 <= start <= end < len(self._gc_before):
+            raise ValueError(f'The window [{start}, {end}) must be located within [0, {len(self)}]')
+        return int(self._gc_before[end]) - int(self._gc_before[start])
+
+    def gc(self, start: int, end: int) -> float:
+        """
+        Get the GC content of the window `[start, end)`.
+
+        :raises ValueError: if the window is empty or out of the sequence bounds.
+        """
+        if start == end:
+            raise ValueError(f'Cannot compute the GC content of an empty window at {start}')
+        return self.gc_count(start, end) / (end - start) * 100
+
+    def gc_counts(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Get the number of `G` and `C` nucleotides in the windows `[starts[i], ends[i])`.
+
+        :returns: an `int64` array.
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        if len(starts) and (starts.min() < 0 or ends.max() > len(self) or (ends - starts).min() < 0):
+            raise ValueError(f'The windows must be located within [0, {len(self)}]')
+        return self._gc_before[ends] - self._gc_before[starts]
+
+    def gc_batch(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """
+        Get the GC content of the windows `[starts[i], ends[i])`. The content of an empty window is `NaN`.
+
+        :returns: a `float64` array.
+        """
+        counts = self.gc_counts(starts, ends)
+        lengths = np.asarray(ends, dtype=np.int64) - np.asarray(starts, dtype=np.int64)
+        empty = lengths == 0
+        if empty.any():
+            lengths = np.where(empty, 1, lengths)
+            return np.where(empty, np.nan, counts / lengths * 100)
+        return counts / lengths * 100
+
+    def sliding_gc(self, window: int, step: int = 1) -> np.ndarray:
+        """
+        Get the GC content of the windows of `window` nucleotides starting every `step` nucleotides.
+
+        :returns: a `float64` array, empty if the sequence is shorter than the `window`.
+        """
+        if window < 1 or step < 1:
+            raise ValueError(f'`window` and `step` must be positive but were {window}, {step}')
+        starts = np.arange(0, len(self) - window + 1, step, dtype=np.int64)
+        return self.gc_batch(starts, starts + window)
+
+    def __len__(self) -> int:
+        return len(self._gc_before) - 1
+
+    def __repr__(self):
+        return f'GCIndex(length={len(self)})'
@@ -1,30 +1,599 @@
+import enum
+import functools
+import itertools
+import re
 import typing
 
-from Bio import SeqIO
+import numpy as np
+import pandas as pd
+
+from .fasta_io import read_fasta
+from .kozak import score_kozak
+from .sequence import NUCLEOTIDES, N_CODES, GCIndex, codon_mask, codon_codes, encode_sequences
+
+UORF_DTYPE = np.dtype([
+    ("start", np.int64),
+    ("stop", np.int64),
+    ("frame", np.int8),
+    ("length", np.int64),
+    ("start_codon", "S3"),
+])
+"""
+The dtype of the uORF records:
+
+* `start` - the offset of the start codon in the 5'UTR sequence.
+* `stop` - the offset right after the stop codon.
+* `frame` - the reading frame, `start % 3`.
+* `length` - the uORF length, including the stop codon.
+* `start_codon` - the start codon, e.g. `b"ATG"`.
+"""
+
+
+class ORFType(enum.IntEnum):
+    """
+    `ORFType` is the class of an ORF that starts in the 5'UTR, relative to the CDS.
+    """
+
+    UORF = 0
+    """
+    The ORF ends in the 5'UTR, before the CDS start.
+    """
+
+    OORF = 1
+    """
+    The ORF overlaps the CDS start in a different reading frame than the CDS.
+    """
+
+    N_TERMINAL_EXTENSION = 2
+    """
+    The ORF is in frame with the CDS and has no stop codon before the CDS start, hence it extends the CDS.
+    """
+
+
+ORF_DTYPE = np.dtype([
+    ("start", np.int64),
+    ("stop", np.int64),
+    ("frame", np.int8),
+    ("length", np.int64),
+    ("start_codon", "S3"),
+    ("orf_type", np.int8),
+])
+"""
+The dtype of the records of the ORFs that start in the 5'UTR:
+
+* `start` - the offset of the start codon in the transcript sequence.
+* `stop` - the offset right after the stop codon, or `-1` if there is no stop codon until the end of the transcript.
+* `frame` - the reading frame, `start % 3`.
+* `length` - the ORF length, including the stop codon, or `-1` without a stop codon.
+* `start_codon` - the start codon, e.g. `b"ATG"`.
+* `orf_type` - the :class:`ORFType` value.
+"""
+
+STOP_CODONS = ("TAA", "TAG", "TGA")
+
+DEFAULT_START_CODONS = ("ATG",)
+"""
+The start codons of the uORFs unless configured otherwise.
+"""
+
+NEAR_COGNATE_START_CODONS = ("CTG", "GTG", "TTG", "AAG", "AGG", "ACG", "ATA", "ATC", "ATT")
+"""
+The codons that differ from `ATG` at a single position and are not stop codons.
+Use e.g. `DEFAULT_START_CODONS + NEAR_COGNATE_START_CODONS` to find the uORFs starting at near-cognate codons too.
+"""
+
+_IS_STOP_CODON = codon_mask(STOP_CODONS)
+# The codon of each code of `codon_codes`, e.g. to report the start codon of a uORF.
+_CODONS = np.array(["".join(codon) for codon in itertools.product(NUCLEOTIDES + "N", repeat=3)], dtype="S3")
+
+
+def _check_start_codons(start_codons: typing.Iterable[str]) -> typing.Tuple[str, ...]:
+    # The processors and the scanners are created many times with the same start codons.
+    return _validate_start_codons(tuple(start_codons))
+
+
+@functools.lru_cache(maxsize=None)
+def _validate_start_codons(start_codons: typing.Tuple[str, ...]) -> typing.Tuple[str, ...]:
+    start_codons = tuple(dict.fromkeys(start_codons))
+    if not start_codons:
+        raise ValueError('At least one start codon is required')
+    for codon in start_codons:
+        if len(codon) != 3 or any(nucleotide not in NUCLEOTIDES for nucleotide in codon):
+            raise ValueError(f'A start codon must have 3 of the {NUCLEOTIDES} nucleotides but got {codon!r}')
+        if codon in STOP_CODONS:
+            raise ValueError(f'Stop codon {codon} cannot be a start codon')
+    return start_codons
+
+
+@functools.lru_cache(maxsize=None)
+def _codon_pattern(start_codons: typing.Tuple[str, ...]) -> re.Pattern:
+    # The lookahead matches the overlapping codons, the stop codons are the first group and the start codons the second.
+    return re.compile(f'(?=({"|".join(STOP_CODONS)})|({"|".join(start_codons)}))')
+
+
+def find_uorfs(
+    sequence: str,
+    start_codons: typing.Iterable[str] = DEFAULT_START_CODONS,
+) -> typing.List[typing.Tuple[int, int]]:
+    """
+    Find the uORFs of a 5'UTR sequence.
+
+    A uORF starts at a start codon and ends with the first in-frame stop codon (`TAA`, `TAG`, or `TGA`).
+    Every start codon with an in-frame stop codon starts a uORF, hence the uORFs can overlap or be nested.
+
+    The start codons and the stop codons of all reading frames are collected in a single pass,
+    and each start codon is then paired with the next stop codon of its frame.
+
+    :param sequence: the 5'UTR nucleotide sequence.
+    :param start_codons: the start codons, e.g. with :data:`NEAR_COGNATE_START_CODONS`.
+    :returns: the start and the end (after the stop codon) offsets of the uORFs, in the order of the start.
+    """
+    pattern = _codon_pattern(_check_start_codons(start_codons))
+    stops = ([], [], [])
+    starts = []
+    for match in pattern.finditer(sequence):
+        pos = match.start()
+        if match.lastindex == 1:
+            stops[pos % 3].append(pos)
+        else:
+            starts.append(pos)
+
+    next_stop = [0, 0, 0]
+    uorfs = []
+    for start in starts:
+        frame = start % 3
+        frame_stops = stops[frame]
+        i = next_stop[frame]
+        while i < len(frame_stops) and frame_stops[i] < start:
+            i += 1
+        next_stop[frame] = i
+        if i < len(frame_stops):
+            uorfs.append((start, frame_stops[i] + 3))
+
+    return uorfs
+
+
+def uorf_records(sequence: str, offsets: typing.Sequence[typing.Tuple[int, int]]) -> np.ndarray:
+    """
+    Create the uORF records of the uORFs at `offsets` in the 5'UTR `sequence`.
+
+    :param sequence: the 5'UTR nucleotide sequence.
+    :param offsets: the start and the end offsets of the uORFs, e.g. from :func:`find_uorfs`.
+    :returns: an array of :data:`UORF_DTYPE` records.
+    """
+    records = np.empty(len(offsets), dtype=UORF_DTYPE)
+    if len(offsets):
+        bounds = np.array(offsets, dtype=np.int64)
+        records["start"] = bounds[:, 0]
+        records["stop"] = bounds[:, 1]
+        records["frame"] = bounds[:, 0] % 3
+        records["length"] = bounds[:, 1] - bounds[:, 0]
+        records["start_codon"] = [sequence[start:start + 3] for start, _ in offsets]
+    return records
+
+
+def find_uorfs_batch(
+    sequences: typing.Sequence[str],
+    start_codons: typing.Iterable[str] = DEFAULT_START_CODONS,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the uORFs of many 5'UTR sequences at once, with the semantics of :func:`find_uorfs`.
+
+    The sequences are encoded into one array and the start and stop codons are found
+    by a single lookup of the codon codes in a table of the codon classes.
+    Each start codon is then paired with the first stop codon of the same sequence and reading frame
+    by a binary search over the stop codons sorted by the sequence, the frame, and the position.
+
+    :param sequences: the 5'UTR nucleotide sequences.
+    :param start_codons: the start codons, e.g. with :data:`NEAR_COGNATE_START_CODONS`.
+    :returns: a tuple with `(len(sequences) + 1)` offsets and an array of :data:`UORF_DTYPE` records,
+      such that the uORFs of the `i`-th sequence are `records[offsets[i]:offsets[i + 1]]`.
+    """
+    codes, seq_offsets = encode_sequences(sequences)
+    return _find_uorfs_in_codes(codes, seq_offsets, _check_start_codons(start_codons))
+
+
+def _codon_classes(start_codons: typing.Tuple[str, ...]) -> np.ndarray:
+    """
+    Get a lookup table over the codon codes with `1` at the start codons, `2` at the stop codons, and `0` elsewhere.
+    """
+    classes = np.zeros(N_CODES ** 3, dtype=np.int8)
+    classes[codon_mask(start_codons)] = 1
+    classes[_IS_STOP_CODON] = 2
+    return classes
+
+
+def _find_uorfs_in_codes(
+    codes: np.ndarray,
+    seq_offsets: np.ndarray,
+    start_codons: typing.Tuple[str, ...],
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    n_seqs = len(seq_offsets) - 1
+    starts, start_seqs, ends, start_codes = _pair_codons(codes, seq_offsets, start_codons)
+
+    found = ends >= 0
+    starts = starts[found]
+    start_seqs = start_seqs[found]
+    ends = ends[found]
+
+    records = np.empty(len(starts), dtype=UORF_DTYPE)
+    records["start"] = starts - seq_offsets[start_seqs]
+    records["stop"] = ends - seq_offsets[start_seqs]
+    records["frame"] = records["start"] % 3
+    records["length"] = ends - starts
+    records["start_codon"] = _CODONS[start_codes[found]]
+
+    offsets = np.zeros(n_seqs + 1, dtype=np.int64)
+    np.cumsum(np.bincount(start_seqs, minlength=n_seqs), out=offsets[1:])
+    return offsets, records
+
+
+def _pair_codons(
+    codes: np.ndarray,
+    seq_offsets: np.ndarray,
+    start_codons: typing.Tuple[str, ...],
+) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find the start codons and pair each with the first stop codon of the same sequence and reading frame.
+
+    :returns: a tuple with the offsets and the sequence indices of the start codons in the order of the offset,
+      the offsets right after the paired stop codons or `-1` if there is none, and the codes of the start codons.
+    """
+    total = len(codes)
+
+    codons = codon_codes(codes)
+    classes = _codon_classes(start_codons)[codons]
+    starts, start_seqs = _complete_codons(np.flatnonzero(classes == 1), seq_offsets)
+    stops, stop_seqs = _complete_codons(np.flatnonzero(classes == 2), seq_offsets)
+
+    # Sort the stops by the sequence and the frame, and then by the position.
+    stop_groups = stop_seqs * 3 + (stops - seq_offsets[stop_seqs]) % 3
+    stop_keys = np.sort(stop_groups * (total + 1) + stops)
+    start_groups = start_seqs * 3 + (starts - seq_offsets[start_seqs]) % 3
+    idx = np.searchsorted(stop_keys, start_groups * (total + 1) + starts, side="left")
+
+    found = idx < len(stop_keys)
+    found[found] = stop_keys[idx[found]] // (total + 1) == start_groups[found]
+
+    ends = np.full(len(starts), -1, dtype=np.int64)
+    ends[found] = stop_keys[idx[found]] % (total + 1) + 3
+    return starts, start_seqs, ends, codons[starts]
+
+
+def find_orfs_batch(
+    tx_sequences: typing.Sequence[str],
+    cds_starts: typing.Sequence[int],
+    start_codons: typing.Iterable[str] = DEFAULT_START_CODONS,
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Find and classify the ORFs that start in the 5'UTRs of many transcripts at once.
+
+    Unlike :func:`find_uorfs_batch`, the ORFs are scanned in the transcript sequences, hence a start codon
+    is paired with its first in-frame stop codon even if the stop codon is located past the CDS start.
+    Each ORF is then classified by the offsets of its start, its stop, and the CDS start, see :class:`ORFType`.
+    The ORFs of the :attr:`ORFType.UORF` type are the uORFs of :func:`find_uorfs_batch` on the 5'UTRs.
+
+    An ORF in frame with the CDS either stops before the CDS start or continues into the CDS,
+    hence there are no in-frame oORFs, only the N-terminal extensions.
+
+    :param tx_sequences: the transcript sequences, each starting with the 5'UTR.
+    :param cds_starts: the 0-based offset of the CDS start codon in each transcript, i.e. the length of the 5'UTR.
+    :param start_codons: the start codons, see :func:`find_uorfs`.
+    :returns: a tuple with `(len(tx_sequences) + 1)` offsets and an array of :data:`ORF_DTYPE` records,
+      such that the ORFs of the `i`-th transcript are `records[offsets[i]:offsets[i + 1]]`, in the order of the start.
+    :raises ValueError: if a CDS start is not located within its transcript sequence.
+    """
+    codes, seq_offsets = encode_sequences(tx_sequences)
+    cds_starts = np.asarray(cds_starts, dtype=np.int64)
+    if len(cds_starts) != len(tx_sequences):
+        raise ValueError(f'Got {len(cds_starts)} CDS starts for {len(tx_sequences)} transcripts')
+    if np.any(cds_starts < 0) or np.any(cds_starts > np.diff(seq_offsets)):
+        raise ValueError('The CDS starts must be located within the transcript sequences')
+
+    starts, start_seqs, ends, start_codes = _pair_codons(codes, seq_offsets, _check_start_codons(start_codons))
+    upstream = starts - seq_offsets[start_seqs] < cds_starts[start_seqs]
+    starts = starts[upstream]
+    start_seqs = start_seqs[upstream]
+    ends = ends[upstream]
+    start_codes = start_codes[upstream]
+    seq_starts = seq_offsets[start_seqs]
+
+    has_stop = ends >= 0
+    local_starts = starts - seq_starts
+    local_ends = np.where(has_stop, ends - seq_starts, -1)
+    orf_cds_starts = cds_starts[start_seqs]
+    in_cds_frame = (orf_cds_starts - local_starts) % 3 == 0
+
+    records = np.empty(len(starts), dtype=ORF_DTYPE)
+    records["start"] = local_starts
+    records["stop"] = local_ends
+    records["frame"] = local_starts % 3
+    records["length"] = np.where(has_stop, ends - starts, -1)
+    records["start_codon"] = _CODONS[start_codes]
+    records["orf_type"] = np.where(
+        has_stop & (local_ends <= orf_cds_starts), ORFType.UORF,
+        np.where(in_cds_frame, ORFType.N_TERMINAL_EXTENSION, ORFType.OORF),
+    )
+
+    n_seqs = len(tx_sequences)
+    offsets = np.zeros(n_seqs + 1, dtype=np.int64)
+    np.cumsum(np.bincount(start_seqs, minlength=n_seqs), out=offsets[1:])
+    return offsets, records
+
+
+UORF_FEATURES = ("length", "gc_content", "intercistronic_distance", "gc_content_10nt_after")
+"""
+The features of :func:`compute_uorf_features` at the `uorf` level:
+
+* `length` - the uORF length, see :meth:`UORFsProcessor.uorfs_lengths`.
+* `gc_content` - the GC content of the uORF, see :meth:`UORFsProcessor.gc_content`.
+* `intercistronic_distance` - see :meth:`UORFsProcessor.intercistonic_distance`.
+* `gc_content_10nt_after` - see :meth:`UORFsProcessor.gc_content_10nt_after_uorf`.
+"""
+
+TRANSCRIPT_FEATURES = ("five_utr_length", "number_of_uorfs", "five_utr_gc_content")
+"""
+The features of :func:`compute_uorf_features` at the `transcript` level:
+
+* `five_utr_length` - the 5'UTR length, see :meth:`UORFsProcessor.five_utr_lenght`.
+* `number_of_uorfs` - see :meth:`UORFsProcessor.number_of_uorfs`.
+* `five_utr_gc_content` - the GC content of the 5'UTR.
+"""
+
+
+def compute_uorf_features(
+    sequences: typing.Union[typing.Mapping[str, str], typing.Iterable[typing.Tuple[str, str]]],
+    features: typing.Optional[typing.Iterable[str]] = None,
+    level: str = "uorf",
+    start_codons: typing.Iterable[str] = DEFAULT_START_CODONS,
+) -> pd.DataFrame:
+    """
+    Compute the features of the uORFs or of the 5'UTRs of many transcripts at once.
+
+    The uORFs are found by :func:`find_uorfs_batch`, and the features are computed with array operations
+    over all transcripts, with the same values as the corresponding :class:`UORFsProcessor` methods.
+
+    At the `uorf` level, the data frame has a row per uORF, in the order of the transcripts and the uORF start,
+    and the `tx_id`, `start`, `stop`, `frame`, and `start_codon` columns followed by the features.
+    At the `transcript` level, the data frame has a row per transcript, and the `tx_id` column followed by the features.
+
+    :param sequences: a mapping or pairs of transcript identifiers and 5'UTR sequences.
+    :param features: the names of the features from :data:`UORF_FEATURES` or :data:`TRANSCRIPT_FEATURES`,
+      depending on the `level`, or `None` for all features of the level.
+    :param level: `uorf` or `transcript`.
+    :param start_codons: the start codons of the uORFs, see :func:`find_uorfs`.
+    """
+    if level == "uorf":
+        available = UORF_FEATURES
+    elif level == "transcript":
+        available = TRANSCRIPT_FEATURES
+    else:
+        raise ValueError(f'`level` must be `uorf` or `transcript` but was {level!r}')
+    features = available if features is None else tuple(features)
+    unknown = [feature for feature in features if feature not in available]
+    if unknown:
+        raise ValueError(f'Unknown {level} features {unknown}, use any of {list(available)}')
+    start_codons = _check_start_codons(start_codons)
+
+    items = list(sequences.items()) if isinstance(sequences, typing.Mapping) else list(sequences)
+    tx_ids = np.array([tx_id for tx_id, _ in items], dtype=object)
+    codes, seq_offsets = encode_sequences([seq for _, seq in items])
+    seq_lengths = np.diff(seq_offsets)
+
+    gc_index = GCIndex.from_codes(codes)
+
+    if level == "transcript":
+        columns = {"tx_id": tx_ids}
+        for feature in features:
+            if feature == "five_utr_length":
+                columns[feature] = seq_lengths
+            elif feature == "number_of_uorfs":
+                offsets, _ = _find_uorfs_in_codes(codes, seq_offsets, start_codons)
+                columns[feature] = np.diff(offsets)
+            elif feature == "five_utr_gc_content":
+                columns[feature] = gc_index.gc_batch(seq_offsets[:-1], seq_offsets[1:])
+        return pd.DataFrame(columns)
+
+    offsets, records = _find_uorfs_in_codes(codes, seq_offsets, start_codons)
+    uorf_seqs = np.repeat(np.arange(len(items)), np.diff(offsets))
+    seq_starts = seq_offsets[uorf_seqs]
+    starts = seq_starts + records["start"]
+    stops = seq_starts + records["stop"]
+
+    columns = {
+        "tx_id": tx_ids[uorf_seqs],
+        "start": records["start"],
+        "stop": records["stop"],
+        "frame": records["frame"],
+        "start_codon": records["start_codon"].astype(str),
+    }
+    for feature in features:
+        if feature == "length":
+            columns[feature] = records["length"]
+        elif feature == "gc_content":
+            columns[feature] = gc_index.gc_batch(starts, stops)
+        elif feature == "intercistronic_distance":
+            columns[feature] = seq_lengths[uorf_seqs] - records["stop"]
+        elif feature == "gc_content_10nt_after":
+            window_ends = np.minimum(stops + 10, seq_offsets[uorf_seqs + 1])
+            columns[feature] = gc_index.gc_counts(stops, window_ends) / 10 * 100
+    return pd.DataFrame(columns)
+
+
+def _complete_codons(positions: np.ndarray, seq_offsets: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Drop the codons that span the boundary of two sequences,
+    and get the positions and the sequence indices of the remaining codons.
+    """
+    seq_ids = np.searchsorted(seq_offsets, positions, side="right") - 1
+    complete = positions + 3 <= seq_offsets[seq_ids + 1]
+    return positions[complete], seq_ids[complete]
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def iter_uorfs_processors(
+    fpath: str,
+    start_codons: typing.Iterable[str] = DEFAULT_START_CODONS,
+) -> typing.Iterator["UORFsProcessor"]:
+    """
+    Read a FASTA file with the cDNA sequences of many transcripts and their parts, e.g. an Ensembl export,
+    and yield a :class:`UORFsProcessor` for each transcript, in file order.
+
+    The records of a transcript start with its cDNA record (`cdna` in the header)
+    and extend to the next cDNA record. The 5'UTR record (`utr5` in the header) must be named
+    by the transcript identifier or the transcript name, the second field of the cDNA header.
+    The transcripts without a 5'UTR record are skipped.
+
+    The file is read in a single pass and only the records of the current transcript are kept in memory.
+
+    :param fpath: FASTA file path.
+    :param start_codons: the start codons of the uORFs, see :func:`find_uorfs`.
+    """
+    start_codons = _check_start_codons(start_codons)
+    tx_names = ()
+    tx_seq = None
+    five_utr_seq = None
+
+    for header, sequence in read_fasta(fpath):
+        if "cdna" in header:
+            if tx_seq is not None and five_utr_seq:
+                yield UORFsProcessor.from_sequences(tx_names[0], tx_seq, five_utr_seq, start_codons)
+            tx_names = tuple(header.split()[:2])
+            tx_seq = sequence
+            five_utr_seq = None
+        elif (tx_seq is not None and five_utr_seq is None
+              and "utr5" in header and header.split(maxsplit=1)[0] in tx_names):
+            five_utr_seq = sequence
+
+    if tx_seq is not None and five_utr_seq:
+        yield UORFsProcessor.from_sequences(tx_names[0], tx_seq, five_utr_seq, start_codons)
+
 
 class UORFsProcessor:
     """
     `UORFsProcessor` takes a FASTA file with the cDNA sequences of a transcript and its parts to extract different
     features of the 5'UTR region and its existing uORFs (if any).
 
+    Use :func:`iter_uorfs_processors` to process a FASTA file with many transcripts.
+
+    The FASTA file is parsed and the features are computed when first needed, and then cached.
+    The methods and properties return copies of the cached lists, and read-only record arrays.
+
     :param fpath: FASTA file path.
-    :param seq_records: list of every record of the class 'Bio.SeqRecord.SeqRecord' in the file.
-    :param tx_record: record (class 'Bio.SeqRecord.SeqRecord') of the transcript.
+    :param start_codons: the start codons of the uORFs, see :func:`find_uorfs`.
+    :param seq_records: list of every record in the file as a tuple of the header and the sequence.
+    :param tx_record: record of the transcript as a tuple of the header and the sequence.
     :param tx_seq: string of the complete transcript nucleotide sequence.
     :param tx_id: GENCODE transcript identifier.
     :param five_utr_seq: string of the 5'UTR nucleotide sequence.
     :param uorfs: list of uORFs (if any).
     :param uorfs_with_20nt_more: list of uORFs (if any) with the corresponding 20 nucleotides downstream (if possible).
     """
-    def __init__(self, fpath: str):
+    def __init__(self, fpath: str, start_codons: typing.Iterable[str] = DEFAULT_START_CODONS):
         self._fpath = fpath
-        self._seq_records = self._parse_fasta()
-        self._tx_record = self._get_tx_record()
-        self._tx_seq = str(self._tx_record.seq).strip()
-        self._tx_id = self._tx_record.id
-        self._five_utr_seq = self._get_five_utr_sequence()
-        self._uorfs = self._uorf_extractor()
-        self._uorfs_with_20nt_more = self._uorfs_plus_20nt_extractor()
+        self._start_codons = _check_start_codons(start_codons)
+
+    @staticmethod
+    def from_sequences(
+        tx_id: str,
+        tx_seq: str,
+        five_utr_seq: str,
+        start_codons: typing.Iterable[str] = DEFAULT_START_CODONS,
+    ) -> "UORFsProcessor":
+        """
+        Create the processor from the sequences of a transcript instead of a FASTA file.
+
+        :param tx_id: the transcript identifier.
+        :param tx_seq: the transcript cDNA sequence.
+        :param five_utr_seq: the 5'UTR sequence.
+        :param start_codons: the start codons of the uORFs, see :func:`find_uorfs`.
+        """
+        if not five_utr_seq:
+            raise ValueError("No 5'UTR region in the FASTA file.")
+        processor = UORFsProcessor.__new__(UORFsProcessor)
+        processor._fpath = None
+        processor._start_codons = _check_start_codons(start_codons)
+        processor._seq_records = None
+        processor._tx_record = None
+        processor._tx_id = tx_id
+        processor._tx_seq = tx_seq
+        processor._five_utr_seq = five_utr_seq
+        return processor
+
+    @functools.cached_property
+    def _seq_records(self) -> typing.List[typing.Tuple[str, str]]:
+        return self._parse_fasta()
+
+    @functools.cached_property
+    def _tx_record(self) -> typing.Tuple[str, str]:
+        return self._get_tx_record()
+
+    @functools.cached_property
+    def _tx_id(self) -> str:
+        return self._tx_record[0].split(maxsplit=1)[0]
+
+    @functools.cached_property
+    def _tx_seq(self) -> str:
+        return self._tx_record[1]
+
+    @functools.cached_property
+    def _five_utr_seq(self) -> str:
+        return self._get_five_utr_sequence()
+
+    @functools.cached_property
+    def _uorf_records(self) -> np.ndarray:
+        return _read_only(uorf_records(self._five_utr_seq, find_uorfs(self._five_utr_seq, self._start_codons)))
+
+    @functools.cached_property
+    def _orf_records(self) -> np.ndarray:
+        _, records = find_orfs_batch([self._tx_seq], [len(self._five_utr_seq)], self._start_codons)
+        return _read_only(records)
+
+    @functools.cached_property
+    def _gc_index(self) -> GCIndex:
+        return GCIndex(self._five_utr_seq)
+
+    @functools.cached_property
+    def _uorfs(self) -> typing.Tuple[str, ...]:
+        return tuple(self._uorf_extractor())
+
+    @functools.cached_property
+    def _uorfs_with_20nt_more(self) -> typing.Tuple[str, ...]:
+        return tuple(self._uorfs_plus_20nt_extractor())
+
+    @functools.cached_property
+    def _uorfs_lengths(self) -> typing.Tuple[int, ...]:
+        return tuple(self._uorf_records["length"].tolist())
+
+    @functools.cached_property
+    def _gc_content(self) -> typing.Tuple[float, ...]:
+        gc_index = self.gc_index
+        return tuple(gc_index.gc(start, stop) for start, stop in self.uorf_offsets)
+
+    @functools.cached_property
+    def _intercistonic_distance(self) -> typing.Tuple[int, ...]:
+        return tuple((len(self._five_utr_seq) - self._uorf_records["stop"]).tolist())
+
+    @functools.cached_property
+    def _gc_content_10nt_after_uorf(self) -> typing.Tuple[float, ...]:
+        gc_index = self.gc_index
+        end = len(self._five_utr_seq)
+        # The content is relative to 10 nucleotides even if the 5'UTR ends sooner.
+        return tuple(gc_index.gc_count(stop, min(stop + 10, end)) / 10 * 100 for _, stop in self.uorf_offsets)
+
+    @functools.cached_property
+    def _kozak_scores(self) -> typing.Tuple[float, ...]:
+        starts = self._uorf_records["start"]
+        return tuple(score_kozak([self._tx_seq], np.zeros(len(starts), dtype=np.int64), starts).tolist())
+
+    @functools.cached_property
+    def _cds_kozak_score(self) -> float:
+        return float(score_kozak([self._tx_seq], np.zeros(1, dtype=np.int64),
+                                 np.array([len(self._five_utr_seq)]))[0])
 
     @property
     def tx_id(self) -> str:
@@ -40,24 +609,55 @@ class UORFsProcessor:
     
     @property
     def uorfs(self) -> typing.List[str]:
-        return self._uorfs
+        return list(self._uorfs)
     
+    @property
+    def uorf_offsets(self) -> typing.List[typing.Tuple[int, int]]:
+        """
+        Get the start and the end (after the stop codon) offsets of the uORFs in the 5'UTR sequence.
+        """
+        return list(zip(self._uorf_records["start"].tolist(), self._uorf_records["stop"].tolist()))
+
+    @property
+    def uorf_records(self) -> np.ndarray:
+        """
+        Get the uORFs as an array of :data:`UORF_DTYPE` records, in the order of the start.
+        """
+        return self._uorf_records
+
+    @property
+    def orf_records(self) -> np.ndarray:
+        """
+        Get the ORFs that start in the 5'UTR, scanned into the transcript sequence past the CDS start,
+        as an array of :data:`ORF_DTYPE` records classified by :class:`ORFType`, in the order of the start.
+
+        The transcript sequence must start with the 5'UTR, hence the CDS starts at the end of the 5'UTR.
+        """
+        return self._orf_records
+
+    @property
+    def gc_index(self) -> GCIndex:
+        """
+        Get the index for the GC content of any window of the 5'UTR sequence.
+        """
+        return self._gc_index
+
     @property
     def uorfs_with_20nt_more(self) -> typing.List[str]:
-        return self._uorfs_with_20nt_more
+        return list(self._uorfs_with_20nt_more)
 
     def five_utr_lenght(self) -> int:
         return len(self._five_utr_seq)
     
-    def _parse_fasta(self) -> typing.List:
-        seq_records = list(SeqIO.parse(self._fpath, "fasta"))
+    def _parse_fasta(self) -> typing.List[typing.Tuple[str, str]]:
+        seq_records = list(read_fasta(self._fpath))
         if not seq_records:
             raise ValueError("Empty FASTA file or no records.")
         return seq_records
 
-    def _get_tx_record(self):
+    def _get_tx_record(self) -> typing.Tuple[str, str]:
         for seq_record in self._seq_records:
-            if "cdna" in seq_record.description:
+            if "cdna" in seq_record[0]:
                 tx_cdna = seq_record    
                 if not tx_cdna:
                     raise ValueError("No transcript cDNA in the FASTA file.")
@@ -65,8 +665,9 @@ class UORFsProcessor:
 
     def _get_five_utr_sequence(self) -> str:
         for seq_record in self._seq_records:
-            if "utr5" in seq_record.description:
-                five_utr_seq = str(seq_record.seq).strip()   
+            header, sequence = seq_record
+            if "utr5" in header:
+                five_utr_seq = sequence
                 assert isinstance(five_utr_seq, str)
                 if not five_utr_seq:
                     raise ValueError("No 5'UTR region in the FASTA file.")
@@ -76,108 +677,52 @@ class UORFsProcessor:
         """
         Take the nucleotide sequence of a transcript 5'UTR region to extract its uORFs sequences (if any).
         """
-        five_sequence = self._five_utr_seq
-        uorfs = []
-            
-        while "ATG" in five_sequence:  
-            codon_list = []  
-
-            start_index = five_sequence.find("ATG")
-            assert start_index != -1, "No ATG in the 5'UTR sequence."
-
-            found_stop = False 
-                
-            for i in range(start_index, len(five_sequence) - len(five_sequence) % 3, 3):
-                codon = five_sequence[i:i + 3]
-                assert len(codon) == 3, "Codons must be 3nt long."
-
-                codon_list.append(codon)
-
-                if codon in ["TAA", "TAG", "TGA"]:
-                    found_stop = True
-                    break
-
-            if found_stop:
-                uorfs.append("".join(codon_list))
-
-            five_sequence = five_sequence[start_index + 3:]
-            # It resumes the search a codon after the start codon of the current uORF, but should I resume it after the stop
-            # codon or I don´t look for overlapping uORFs?
-            
-        return uorfs
+        return [self._five_utr_seq[start:stop] for start, stop in self.uorf_offsets]
     
     def _uorfs_plus_20nt_extractor(self) -> typing.List[str]:
         """
-        Search the uORFs in their 5'UTR region to extract the uORFs with the 20 nucleotides (if possible) after the
-        corresponding stop codon for indel analysis.
+        Extract the uORFs with the 20 nucleotides (if possible) after the corresponding stop codon for indel analysis.
         """
-        uorfs_plus_20nt = []
-
-        for uorf in self._uorfs:
-            start_index = self._five_utr_seq.find(uorf)
-            _20_nts_after_uorf = self._five_utr_seq[start_index + len(uorf): start_index + len(uorf) + 20] 
-            
-            uorf_plus_20nt = uorf + _20_nts_after_uorf
-            uorfs_plus_20nt.append(uorf_plus_20nt)
-            assert uorf in uorf_plus_20nt, "uORF lost."
-
-        return uorfs_plus_20nt
+        return [self._five_utr_seq[start:stop + 20] for start, stop in self.uorf_offsets]
 
     def number_of_uorfs(self) -> int:
-        return len(self._uorfs)
+        return len(self._uorf_records)
     
     def uorfs_lengths(self) -> typing.List[int]:
-        return [len(uorf) for uorf in self._uorfs]
+        return list(self._uorfs_lengths)
     
     def gc_content(self) -> typing.List[float]:
         """
         Get the GC content of each uORF.
         """
-        gc_content_per_uorf = []
-
-        for uorf in self._uorfs:
-            total = len(uorf)
-            g = uorf.count("G")
-            c = uorf.count("C")
-            
-            gc_content = ((g+c) / total) * 100
-            gc_content_per_uorf.append(gc_content)
-
-        return gc_content_per_uorf
+        return list(self._gc_content)
     
     def intercistonic_distance(self) -> typing.List[int]:
         """
         Calculate the intercistonic distance (distance between the uORF stop codon and the mORF start codon).
         """
-        distances = []
-
-        for uorf in self._uorfs:
-            start_index = self._five_utr_seq.find(uorf) + len(uorf)
-            distance = len(self._five_utr_seq) - start_index
-            
-            distances.append(distance)
-        return distances
+        return list(self._intercistonic_distance)
     
     def gc_content_10nt_after_uorf(self) -> typing.List[float]:
         """
         Get the GC content of the 10 nucleotides after the uORF stop codon.
         """
-        _10nt_after_uorf = []
-        gc_content_10nt_after_uorf = []
+        return list(self._gc_content_10nt_after_uorf)
 
-        for uorf in self._uorfs:
-            start_index = self._five_utr_seq.find(uorf)
-            nts_after_uorf = self._five_utr_seq[start_index + len(uorf): start_index + len(uorf) + 10] 
-            
-            _10nt_after_uorf.append(nts_after_uorf)
-        
-        for nts in _10nt_after_uorf:
-            g = nts.count("G")
-            c = nts.count("C")
-            gc_content = ((g+c)/10) * 100
-
-            gc_content_10nt_after_uorf.append(gc_content)
-        return gc_content_10nt_after_uorf
+    def kozak_scores(self) -> typing.List[float]:
+        """
+        Get the Kozak context score of each uORF start codon with :data:`utrfx.kozak.DEFAULT_KOZAK_PWM`.
+
+        The context is taken from the transcript sequence, which starts with the 5'UTR,
+        hence the context of a uORF near the end of the 5'UTR extends into the CDS.
+        """
+        return list(self._kozak_scores)
+
+    def cds_kozak_score(self) -> float:
+        """
+        Get the Kozak context score of the CDS start codon with :data:`utrfx.kozak.DEFAULT_KOZAK_PWM`.
+        """
+        return self._cds_kozak_score
 
     def __repr__(self) -> str:
         return f"UORFsProcessor(tx_id= {self.tx_id}, uORFs= {self.uorfs})"
\ No newline at end of file
@@ -0,0 +1,267 @@
+import collections
+import concurrent.futures
+import itertools
+import logging
+import typing
+
+import pandas as pd
+
+from .uorf import DEFAULT_START_CODONS, compute_uorf_features
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkFailure(typing.NamedTuple):
+    """
+    Transcripts of a chunk whose features could not be computed.
+    """
+
+    chunk: int
+    """
+    The index of the chunk in the input.
+    """
+
+    tx_ids: typing.Tuple[str, ...]
+    """
+    The identifiers of the failed transcripts.
+    """
+
+    error: str
+    """
+    The description of the error.
+    """
+
+
+def _compute_chunk(
+    items: typing.Sequence[typing.Tuple[str, str]],
+    features: typing.Optional[typing.Sequence[str]],
+    level: str,
+    start_codons: typing.Sequence[str],
+) -> pd.DataFrame:
+    return compute_uorf_features(items, features=features, level=level, start_codons=start_codons)
+
+
+def _succeeded(future: concurrent.futures.Future) -> bool:
+    return future.done() and not future.cancelled() and future.exception() is None
+
+
+def _concat(frames: typing.Sequence[pd.DataFrame]) -> typing.Optional[pd.DataFrame]:
+    if not frames:
+        return None
+    return pd.concat(frames, ignore_index=True)
+
+
+class UORFFeatureEngine:
+    """
+    `UORFFeatureEngine` computes the features of :func:`utrfx.uorf.compute_uorf_features`
+    for a stream of transcripts in chunks, optionally in a pool of processes.
+
+    The chunks are yielded in the input order. If a chunk raises, its transcripts are retried one by one,
+    in the pool if there is one, and only the transcripts that fail again are recorded in :attr:`failures`
+    and left out. If a worker process dies, the pool is restarted, the chunk is retried alone to tell
+    whether it killed the worker, and the pending chunks are resubmitted. If the chunk kills the worker again,
+    its transcripts are retried one by one as well. The number of left out transcripts is logged as a warning.
+
+    :param features: the names of the features or `None` for all features of the `level`.
+    :param level: `uorf` or `transcript`.
+    :param workers: the number of processes. With `1`, the chunks are computed in the current process.
+    :param chunk_size: the number of transcripts per chunk.
+    :param start_codons: the start codons of the uORFs, see :func:`utrfx.uorf.find_uorfs`.
+    """
+
+    def __init__(
+        self,
+        features: typing.Optional[typing.Iterable[str]] = None,
+        level: str = "uorf",
+        workers: int = 1,
+        chunk_size: int = 10_000,
+        start_codons: typing.Iterable[str] = DEFAULT_START_CODONS,
+    ):
+        if workers < 1:
+            raise ValueError(f'`workers` must be positive but was {workers}')
+        if chunk_size < 1:
+            raise ValueError(f'`chunk_size` must be positive but was {chunk_size}')
+        self._features = None if features is None else tuple(features)
+        self._level = level
+        self._workers = workers
+        self._chunk_size = chunk_size
+        self._start_codons = tuple(start_codons)
+        self._failures = []
+
+        # Check the features, the level, and the start codons before starting any work.
+        compute_uorf_features((), features=self._features, level=self._level, start_codons=self._start_codons)
+
+    @property
+    def failures(self) -> typing.Sequence[ChunkFailure]:
+        """
+        Get the transcripts that failed in the last run.
+        """
+        return self._failures
+
+    def compute(
+        self,
+        sequences: typing.Union[typing.Mapping[str, str], typing.Iterable[typing.Tuple[str, str]]],
+    ) -> pd.DataFrame:
+        """
+        Compute the features of all transcripts and concatenate the chunks into one data frame.
+
+        :param sequences: a mapping or pairs of transcript identifiers and 5'UTR sequences.
+        """
+        frames = list(self.iter_chunks(sequences))
+        if not frames:
+            return compute_uorf_features((), features=self._features, level=self._level,
+                                         start_codons=self._start_codons)
+        return pd.concat(frames, ignore_index=True)
+
+    def iter_chunks(
+        self,
+        sequences: typing.Union[typing.Mapping[str, str], typing.Iterable[typing.Tuple[str, str]]],
+    ) -> typing.Iterator[pd.DataFrame]:
+        """
+        Compute the features chunk by chunk and yield a data frame per chunk, in the input order.
+
+        The `sequences` are consumed lazily, hence they can be a generator over a large file.
+
+        :param sequences: a mapping or pairs of transcript identifiers and 5'UTR sequences.
+        """
+        self._failures = []
+        items = iter(sequences.items() if isinstance(sequences, typing.Mapping) else sequences)
+        chunks = enumerate(iter(lambda: tuple(itertools.islice(items, self._chunk_size)), ()))
+
+        if self._workers == 1:
+            for i, chunk in chunks:
+                try:
+                    result = _compute_chunk(chunk, self._features, self._level, self._start_codons)
+                except Exception:
+                    result = self._compute_one_by_one(i, chunk)
+                if result is not None:
+                    yield result
+        else:
+            yield from self._iter_chunks_in_pool(chunks)
+
+        n_failed = sum(len(failure.tx_ids) for failure in self._failures)
+        if n_failed:
+            logger.warning('Left out %d transcripts whose uORF features could not be computed', n_failed)
+
+    def _iter_chunks_in_pool(
+        self,
+        chunks: typing.Iterator[typing.Tuple[int, typing.Sequence[typing.Tuple[str, str]]]],
+    ) -> typing.Iterator[pd.DataFrame]:
+        pending = collections.deque()
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=self._workers)
+        try:
+            while True:
+                # Keep a bounded number of chunks in flight to bound the memory of the main process.
+                while len(pending) < 2 * self._workers:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    pending.append((*chunk, self._submit(executor, chunk[1])))
+                if not pending:
+                    return
+
+                i, chunk, future = pending.popleft()
+                current = executor
+                try:
+                    result = future.result()
+                except concurrent.futures.BrokenExecutor:
+                    executor = self._restart(executor)
+                    # Retry the chunk alone, as the worker may have been killed by another chunk.
+                    result, executor = self._retry_alone(executor, i, chunk)
+                except Exception:
+                    result, executor = self._isolate(executor, i, chunk)
+
+                if executor is not current:
+                    # The futures of the broken pool are lost, except for the ones that completed.
+                    pending = collections.deque(
+                        (j, c, f if _succeeded(f) else self._submit(executor, c)) for j, c, f in pending
+                    )
+                if result is not None:
+                    yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _compute_one_by_one(
+        self,
+        i: int,
+        chunk: typing.Sequence[typing.Tuple[str, str]],
+    ) -> typing.Optional[pd.DataFrame]:
+        # Isolate the transcripts that made the chunk raise, and keep the features of the others.
+        frames = []
+        for item in chunk:
+            try:
+                frames.append(_compute_chunk((item,), self._features, self._level, self._start_codons))
+            except Exception as e:
+                self._record_failure(i, (item,), e)
+        return _concat(frames)
+
+    def _retry_alone(
+        self,
+        executor: concurrent.futures.Executor,
+        i: int,
+        chunk: typing.Sequence[typing.Tuple[str, str]],
+    ) -> typing.Tuple[typing.Optional[pd.DataFrame], concurrent.futures.Executor]:
+        try:
+            return self._submit(executor, chunk).result(), executor
+        except concurrent.futures.BrokenExecutor:
+            executor = self._restart(executor)
+        except Exception:
+            pass
+        return self._isolate(executor, i, chunk)
+
+    def _isolate(
+        self,
+        executor: concurrent.futures.Executor,
+        i: int,
+        chunk: typing.Sequence[typing.Tuple[str, str]],
+    ) -> typing.Tuple[typing.Optional[pd.DataFrame], concurrent.futures.Executor]:
+        # Isolate the transcripts that made the chunk fail in the pool, and keep the features of the others.
+        # Returns the features of the other transcripts and the executor, which is replaced if a worker dies.
+        frames = [None] * len(chunk)
+        futures = [self._submit(executor, (item,)) for item in chunk]
+        lost = []
+        for j, future in enumerate(futures):
+            try:
+                frames[j] = future.result()
+            except concurrent.futures.BrokenExecutor:
+                lost.append(j)
+            except Exception as e:
+                self._record_failure(i, (chunk[j],), e)
+
+        if lost:
+            # Any transcript in flight may have killed the worker, retry them one at a time to find the culprits.
+            executor = self._restart(executor)
+            for j in lost:
+                try:
+                    frames[j] = self._submit(executor, (chunk[j],)).result()
+                except concurrent.futures.BrokenExecutor as e:
+                    self._record_failure(i, (chunk[j],), e)
+                    executor = self._restart(executor)
+                except Exception as e:
+                    self._record_failure(i, (chunk[j],), e)
+
+        return _concat([frame for frame in frames if frame is not None]), executor
+
+    def _restart(self, executor: concurrent.futures.Executor) -> concurrent.futures.Executor:
+        executor.shutdown(wait=True, cancel_futures=True)
+        return concurrent.futures.ProcessPoolExecutor(max_workers=self._workers)
+
+    def _submit(
+        self,
+        executor: concurrent.futures.Executor,
+        chunk: typing.Sequence[typing.Tuple[str, str]],
+    ) -> concurrent.futures.Future:
+        try:
+            return executor.submit(_compute_chunk, chunk, self._features, self._level, self._start_codons)
+        except concurrent.futures.BrokenExecutor as e:
+            # The pool broke before the submission, the chunk is resubmitted when its turn comes.
+            future = concurrent.futures.Future()
+            future.set_exception(e)
+            return future
+
+    def _record_failure(self, i: int, chunk: typing.Sequence[typing.Tuple[str, str]], e: BaseException):
+        self._failures.append(ChunkFailure(i, tuple(tx_id for tx_id, _ in chunk), f'{type(e).__name__}: {e}'))
+
+    def __repr__(self):
+        return (f'UORFFeatureEngine(features={self._features}, level={self._level}, '
+                f'workers={self._workers}, chunk_size={self._chunk_size}, start_codons={self._start_codons})')
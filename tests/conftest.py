@@ -15,6 +15,10 @@ def fpath_data_dir(fpath_test_dir: str) -> str:
 def fpath_example_gtf(fpath_data_dir: str) -> str:
     return os.path.join(fpath_data_dir,  "Homo.sapiens.GRCh38_sample.gtf")
 
+@pytest.fixture(scope="session")
+def fpath_small_gtf(fpath_data_dir: str) -> str:
+    return os.path.join(fpath_data_dir, "small.gtf")
+
 @pytest.fixture(scope="session")
 def genome_build() -> GenomeBuild:
     return GRCh38
@@ -0,0 +1,53 @@
+import gzip
+import os
+
+import pytest
+
+from utrfx.fasta_io import read_fasta, read_fasta_bytes
+
+
+@pytest.fixture(scope="session")
+def fpath_fasta() -> str:
+    return os.path.join(os.path.dirname(__file__), "data", "Homo_sapiens_ENST00000381418_9_sequence_sample.fa")
+
+
+class TestReadFasta:
+
+    def test_read_fasta(self, fpath_fasta: str):
+        records = list(read_fasta(fpath_fasta))
+
+        assert len(records) == 43
+        assert records[0][0] == "ENST00000381418.9 HR-202 cdna:protein_coding"
+        assert records[-1][0].startswith("8 dna:chromosome chromosome:GRCh38:8:22114419:22131010:-1")
+
+        utr5 = [sequence for header, sequence in records if header == "HR-202 utr5:protein_coding"]
+        assert len(utr5) == 1
+        assert len(utr5[0]) == 623
+        assert utr5[0].isalpha()
+
+    @pytest.mark.parametrize("content, expected", [
+        ("", []),
+        ("no records\n", []),
+        (">a\nAC\nGT\n>b desc\n\n>c\nTT", [("a", "ACGT"), ("b desc", ""), ("c", "TT")]),
+        ("junk\n>a\r\nAC \r\nGT\r\n", [("a", "ACGT")]),
+        (">a", [("a", "")]),
+    ])
+    def test_read_fasta_layouts(self, tmp_path, content: str, expected):
+        fpath = tmp_path / "seqs.fa"
+        fpath.write_bytes(content.encode())
+
+        assert list(read_fasta(str(fpath))) == expected
+
+    def test_read_gzipped_fasta(self, fpath_fasta: str, tmp_path):
+        fpath = str(tmp_path / "sample.fa.gz")
+        with open(fpath_fasta, "rb") as src, gzip.open(fpath, "wb") as dst:
+            dst.write(src.read())
+
+        assert list(read_fasta(fpath)) == list(read_fasta(fpath_fasta))
+
+    def test_read_fasta_bytes(self, fpath_fasta: str):
+        header, sequence = next(read_fasta_bytes(fpath_fasta))
+
+        assert header == b"ENST00000381418.9 HR-202 cdna:protein_coding"
+        assert isinstance(sequence, bytes)
+        assert b"\n" not in sequence
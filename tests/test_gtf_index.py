@@ -0,0 +1,117 @@
+import os
+
+import pytest
+
+from utrfx.genome import GenomeBuild, GenomicRegion, Strand
+from utrfx.gtf_index import GtfIndex
+from utrfx.gtf_io import read_gtf_into_txs
+
+
+@pytest.fixture
+def fpath_sorted_gtf(fpath_small_gtf: str, tmp_path) -> str:
+    with open(fpath_small_gtf) as fh:
+        lines = [line for line in fh if not line.startswith("#")]
+    lines.sort(key=lambda line: (line.split("\t")[0], int(line.split("\t")[3])))
+
+    fpath = str(tmp_path / "sorted.gtf")
+    with open(fpath, "w") as fh:
+        fh.write("##description: sorted\n")
+        fh.writelines(lines)
+    return fpath
+
+
+class TestGtfIndex:
+
+    def test_build(self, fpath_sorted_gtf: str):
+        index = GtfIndex.build(fpath_sorted_gtf)
+
+        assert index.seqnames == ("chr1", "chr22", "chrFake")
+        assert index.is_current(fpath_sorted_gtf)
+
+    def test_fetch(self, fpath_sorted_gtf: str):
+        index = GtfIndex.build(fpath_sorted_gtf)
+
+        with open(fpath_sorted_gtf, "rb") as fh:
+            lines = list(index.fetch(fh, "chr22", 1099, 1100))
+            assert {line.split(b"\t")[2] for line in lines} == {b"gene", b"transcript", b"exon", b"UTR"}
+            assert all(b"ENSG00000000001.1" in line for line in lines)
+
+            assert list(index.fetch(fh, "chr22", 4000, 5000)) == []
+            assert list(index.fetch(fh, "chrUnknown", 0, 100)) == []
+
+    def test_save_and_load(self, fpath_sorted_gtf: str, tmp_path):
+        index = GtfIndex.build(fpath_sorted_gtf)
+        fpath = str(tmp_path / "index.npz")
+        index.save(fpath)
+
+        loaded = GtfIndex.load(fpath)
+
+        assert loaded.seqnames == index.seqnames
+        assert loaded.query("chr22", 1000, 1100) == index.query("chr22", 1000, 1100)
+
+    def test_unsorted_file(self, fpath_small_gtf: str, tmp_path):
+        fpath = str(tmp_path / "unsorted.gtf")
+        with open(fpath_small_gtf) as src, open(fpath, "w") as dst:
+            dst.writelines(reversed(src.readlines()))
+
+        with pytest.raises(ValueError):
+            GtfIndex.build(fpath)
+
+    def test_compressed_file(self):
+        with pytest.raises(ValueError):
+            GtfIndex.build("annotation.gtf.gz")
+
+
+class TestReadGtfRegions:
+
+    def test_read_gtf_into_txs_with_regions(self, fpath_sorted_gtf: str, genome_build: GenomeBuild):
+        chr22 = genome_build.contig_by_name("chr22")
+        # Overlaps the 3'UTR of the negative strand transcript, queried on the negative strand.
+        region = GenomicRegion(chr22, 5000, 5010, Strand.POSITIVE).with_strand(Strand.NEGATIVE)
+
+        transcripts = read_gtf_into_txs(fpath_sorted_gtf, genome_build, regions=[region])
+
+        assert [tx.tx_id for tx in transcripts] == ["ENST00000000002.1"]
+        expected = {tx.tx_id: tx for tx in read_gtf_into_txs(fpath_sorted_gtf, genome_build)}
+        assert transcripts[0].five_utr.regions() == list(expected["ENST00000000002.1"].five_utr.regions())
+        assert os.path.isfile(GtfIndex.index_path(fpath_sorted_gtf))
+
+    def test_several_regions(self, fpath_sorted_gtf: str, genome_build: GenomeBuild):
+        chr1 = genome_build.contig_by_name("chr1")
+        chr22 = genome_build.contig_by_name("chr22")
+        regions = [
+            GenomicRegion(chr22, 1000, 1001, Strand.POSITIVE),
+            GenomicRegion(chr22, 2900, 2950, Strand.POSITIVE),
+            GenomicRegion(chr1, 11000, 11001, Strand.POSITIVE),
+            GenomicRegion(chr1, 50000, 50001, Strand.POSITIVE),
+        ]
+
+        transcripts = read_gtf_into_txs(fpath_sorted_gtf, genome_build, regions=regions)
+
+        assert [tx.tx_id for tx in transcripts] == ["ENST00000000001.1", "ENST00000000005.1"]
+
+    def test_invalid_arguments(self, fpath_sorted_gtf: str, genome_build: GenomeBuild, tmp_path):
+        regions = [GenomicRegion(genome_build.contig_by_name("chr22"), 1000, 1001, Strand.POSITIVE)]
+
+        with pytest.raises(ValueError):
+            read_gtf_into_txs(fpath_sorted_gtf, genome_build, regions=regions, cache_dir=str(tmp_path))
+        with pytest.raises(ValueError):
+            read_gtf_into_txs(fpath_sorted_gtf, genome_build, regions=regions, workers=2)
+
+    def test_no_overlap(self, fpath_sorted_gtf: str, genome_build: GenomeBuild):
+        chr22 = genome_build.contig_by_name("chr22")
+
+        assert read_gtf_into_txs(fpath_sorted_gtf, genome_build, regions=[GenomicRegion(chr22, 0, 10, Strand.POSITIVE)]) == []
+
+    @pytest.mark.parametrize("content", [b"", b"not a zip file"])
+    def test_corrupted_index(self, fpath_sorted_gtf: str, genome_build: GenomeBuild, content: bytes):
+        chr22 = genome_build.contig_by_name("chr22")
+        region = GenomicRegion(chr22, 1000, 1001, Strand.POSITIVE)
+        read_gtf_into_txs(fpath_sorted_gtf, genome_build, regions=[region])
+        with open(GtfIndex.index_path(fpath_sorted_gtf), "wb") as fh:
+            fh.write(content)
+
+        transcripts = read_gtf_into_txs(fpath_sorted_gtf, genome_build, regions=[region])
+
+        assert [tx.tx_id for tx in transcripts] == ["ENST00000000001.1"]
+        assert GtfIndex.load(GtfIndex.index_path(fpath_sorted_gtf)).is_current(fpath_sorted_gtf)
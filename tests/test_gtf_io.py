@@ -1,7 +1,12 @@
+import gzip
+import os
+import shutil
+
 import pytest
 
 from utrfx.genome import GenomeBuild, GenomicRegion, Contig, Strand
-from utrfx.gtf_io import read_gtf_into_txs
+from utrfx import gtf_io
+from utrfx.gtf_io import read_gtf, read_gtf_into_txs, read_gtf_into_table, iter_gtf_transcripts, open_gtf, parse_gtf_attributes
 
 class TestGtfIo:
 
@@ -38,4 +43,249 @@ class TestGtfIo:
         assert our_another_favorite_tx is not None
         assert len(our_another_favorite_tx._five_utr._regions) == 2
         assert our_another_favorite_tx._five_utr._regions[0] == first_region_another_tx
-        assert our_another_favorite_tx._five_utr._regions[1] == second_region_another_tx
\ No newline at end of file
+        assert our_another_favorite_tx._five_utr._regions[1] == second_region_another_tx
+
+class TestIterGtfTranscripts:
+
+    def test_iter_gtf_transcripts(
+        self,
+        fpath_small_gtf: str,
+        genome_build: GenomeBuild,
+        capsys,
+    ):
+        transcripts = list(iter_gtf_transcripts(fpath_small_gtf, genome_build))
+
+        # File order, transcripts without a start codon or on unknown contigs are skipped.
+        assert [tx.tx_id for tx in transcripts] == ["ENST00000000001.1", "ENST00000000002.1", "ENST00000000005.1"]
+        assert capsys.readouterr().out == ""
+
+        chr22 = genome_build.contig_by_name("chr22")
+        assert transcripts[0]._five_utr._regions == [
+            GenomicRegion(contig=chr22, start=1000, end=1100, strand=Strand.POSITIVE),
+            GenomicRegion(contig=chr22, start=2000, end=2050, strand=Strand.POSITIVE),
+        ]
+        assert transcripts[1]._five_utr._regions == [
+            GenomicRegion(contig=chr22, start=7000, end=8000, strand=Strand.POSITIVE).with_strand(Strand.NEGATIVE),
+        ]
+
+    def test_interleaved_transcripts(
+        self,
+        fpath_small_gtf: str,
+        genome_build: GenomeBuild,
+        tmp_path,
+    ):
+        with open(fpath_small_gtf) as fh:
+            lines = fh.readlines()
+        # Move the last 5'UTR of the first transcript after the rows of the second one.
+        utr = next(i for i, line in enumerate(lines) if "\tUTR\t2001\t" in line)
+        lines.append(lines.pop(utr))
+        fpath = str(tmp_path / "interleaved.gtf")
+        with open(fpath, "w") as fh:
+            fh.writelines(lines)
+
+        with pytest.raises(ValueError, match="ENST00000000001.1"):
+            list(iter_gtf_transcripts(fpath, genome_build))
+
+    def test_agrees_with_read_gtf_into_txs(
+        self,
+        fpath_small_gtf: str,
+        genome_build: GenomeBuild,
+        capsys,
+    ):
+        expected = read_gtf_into_txs(fpath_small_gtf, genome_build)
+        actual = sorted(iter_gtf_transcripts(fpath_small_gtf, genome_build), key=lambda tx: tx.tx_id)
+
+        # Both readers skip the transcript on the unknown contig silently.
+        assert capsys.readouterr().out == ""
+
+        assert [tx.tx_id for tx in actual] == [tx.tx_id for tx in expected]
+        for a, e in zip(actual, expected):
+            assert list(a._five_utr._regions) == list(e._five_utr._regions)
+
+
+class TestParseGtfAttributes:
+
+    def test_parse_gtf_attributes(self):
+        attributes = [
+            'gene_id "G1"; transcript_id "T1"; gene_name "A"; level 2; tag "basic"; tag "CCDS";',
+            'gene_id "G1"; gene_name "A"; level 2;',
+        ]
+
+        df = parse_gtf_attributes(attributes, ["gene_id", "transcript_id", "level", "tag"])
+
+        assert list(df.columns) == ["gene_id", "transcript_id", "level", "tag"]
+        assert df["gene_id"].tolist() == ["G1", "G1"]
+        assert df["transcript_id"].tolist() == ["T1", None]
+        assert df["level"].tolist() == ["2", "2"]
+        assert df["tag"].tolist() == ["basic,CCDS", None]
+
+    def test_read_gtf(self, fpath_small_gtf: str):
+        fields = ["gene_id", "gene_name", "transcript_type", "transcript_support_level", "tag"]
+
+        df = read_gtf(fpath_small_gtf, attributes=fields)
+
+        assert list(df.columns) == ["seqname", "feature", "start", "end", "strand", *fields]
+        transcripts = df[df["feature"] == "transcript"]
+        assert transcripts["gene_name"].tolist() == ["GENEA", "GENEA", "GENEB", "GENED", "GENEE"]
+        assert transcripts["transcript_support_level"].tolist() == ["1", "NA", "2", "1", "1"]
+        assert transcripts["tag"].iloc[0] == "basic,Ensembl_canonical"
+
+
+class TestGtfCache:
+
+    def test_cache_roundtrip(
+        self,
+        fpath_small_gtf: str,
+        genome_build: GenomeBuild,
+        tmp_path,
+    ):
+        cache_dir = str(tmp_path / "cache")
+        expected = read_gtf_into_txs(fpath_small_gtf, genome_build)
+
+        cold = read_gtf_into_txs(fpath_small_gtf, genome_build, cache_dir=cache_dir)
+        assert len(os.listdir(cache_dir)) == 1
+        warm = read_gtf_into_txs(fpath_small_gtf, genome_build, cache_dir=cache_dir)
+
+        for txs in (cold, warm):
+            assert [tx.tx_id for tx in txs] == [tx.tx_id for tx in expected]
+            for a, e in zip(txs, expected):
+                assert a.five_utr.regions() == list(e.five_utr.regions())
+
+    def test_cache_is_invalidated(
+        self,
+        fpath_small_gtf: str,
+        genome_build: GenomeBuild,
+        tmp_path,
+    ):
+        cache_dir = str(tmp_path / "cache")
+        fpath = str(tmp_path / "annotation.gtf")
+        shutil.copyfile(fpath_small_gtf, fpath)
+
+        assert len(read_gtf_into_table(fpath, genome_build, cache_dir=cache_dir)) == 3
+        (entry,) = os.listdir(cache_dir)
+
+        # Drop the last transcript.
+        with open(fpath) as fh:
+            lines = [line for line in fh if "ENST00000000005.1" not in line]
+        with open(fpath, "w") as fh:
+            fh.writelines(lines)
+
+        assert len(read_gtf_into_table(fpath, genome_build, cache_dir=cache_dir)) == 2
+        assert os.listdir(cache_dir) != [entry]
+        assert len(os.listdir(cache_dir)) == 1
+
+    def test_stale_entry_removed_by_another_process(
+        self,
+        fpath_small_gtf: str,
+        genome_build: GenomeBuild,
+        tmp_path,
+        monkeypatch,
+    ):
+        cache_dir = str(tmp_path / "cache")
+        os.makedirs(cache_dir)
+        path_key, _ = gtf_io._cache_keys(fpath_small_gtf, genome_build)
+        listdir = os.listdir
+
+        def listdir_with_vanished_entry(path):
+            # A stale entry that a concurrent rebuild removes between the listing and the removal.
+            entries = listdir(path)
+            return entries + [f"{path_key}-0000000000000000.npz"] if path == cache_dir else entries
+
+        monkeypatch.setattr(os, "listdir", listdir_with_vanished_entry)
+
+        assert len(read_gtf_into_table(fpath_small_gtf, genome_build, cache_dir=cache_dir)) == 3
+        assert len(listdir(cache_dir)) == 1
+
+    @pytest.mark.parametrize("content", [b"", b"not a zip file"])
+    def test_corrupted_cache_entry(
+        self,
+        fpath_small_gtf: str,
+        genome_build: GenomeBuild,
+        tmp_path,
+        content: bytes,
+    ):
+        cache_dir = str(tmp_path / "cache")
+        assert len(read_gtf_into_table(fpath_small_gtf, genome_build, cache_dir=cache_dir)) == 3
+        (entry,) = os.listdir(cache_dir)
+        with open(os.path.join(cache_dir, entry), "wb") as fh:
+            fh.write(content)
+
+        assert len(read_gtf_into_table(fpath_small_gtf, genome_build, cache_dir=cache_dir)) == 3
+        assert os.listdir(cache_dir) == [entry]
+        assert os.path.getsize(os.path.join(cache_dir, entry)) > len(content)
+
+
+class TestCompressedGtf:
+
+    @pytest.fixture
+    def fpath_gzipped_gtf(self, fpath_small_gtf: str, tmp_path) -> str:
+        fpath = str(tmp_path / "small.gtf.gz")
+        with open(fpath_small_gtf, "rb") as src, gzip.open(fpath, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        return fpath
+
+    @pytest.fixture
+    def fpath_multi_member_gtf(self, fpath_small_gtf: str, tmp_path) -> str:
+        # BGZF files are a series of gzip members.
+        fpath = str(tmp_path / "small.gtf.bgz")
+        with open(fpath_small_gtf, "rb") as fh:
+            lines = fh.readlines()
+        with open(fpath, "wb") as fh:
+            for i in range(0, len(lines), 7):
+                fh.write(gzip.compress(b"".join(lines[i:i + 7])))
+        return fpath
+
+    @pytest.mark.parametrize("fixture", ["fpath_gzipped_gtf", "fpath_multi_member_gtf"])
+    def test_read_compressed(
+        self,
+        fixture: str,
+        fpath_small_gtf: str,
+        genome_build: GenomeBuild,
+        request,
+    ):
+        fpath = request.getfixturevalue(fixture)
+        expected = read_gtf_into_txs(fpath_small_gtf, genome_build)
+
+        actual = read_gtf_into_txs(fpath, genome_build)
+        streamed = sorted(iter_gtf_transcripts(fpath, genome_build), key=lambda tx: tx.tx_id)
+
+        for txs in (actual, streamed):
+            assert [tx.tx_id for tx in txs] == [tx.tx_id for tx in expected]
+            for a, e in zip(txs, expected):
+                assert a.five_utr.regions() == list(e.five_utr.regions())
+
+    def test_open_gtf_rejects_other_files(self):
+        with pytest.raises(AssertionError):
+            open_gtf("annotation.gff3.gz")
+
+
+class TestParallelGtf:
+
+    @pytest.mark.parametrize("suffix", [".gtf", ".gtf.gz"])
+    def test_workers(
+        self,
+        suffix: str,
+        fpath_small_gtf: str,
+        genome_build: GenomeBuild,
+        tmp_path,
+        monkeypatch,
+    ):
+        fpath = str(tmp_path / ("small" + suffix))
+        with open(fpath_small_gtf, "rb") as src, (gzip.open if suffix.endswith(".gz") else open)(fpath, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        # Split the small file into several chunks.
+        monkeypatch.setattr(gtf_io, "_PARALLEL_CHUNK_SIZE", 1_000)
+
+        expected_df = read_gtf(fpath_small_gtf, attributes=["transcript_id", "tag"])
+        actual_df = read_gtf(fpath, attributes=["transcript_id", "tag"], workers=2)
+        assert actual_df.equals(expected_df)
+
+        expected = read_gtf_into_txs(fpath_small_gtf, genome_build)
+        actual = read_gtf_into_txs(fpath, genome_build, workers=2)
+        assert [tx.tx_id for tx in actual] == [tx.tx_id for tx in expected]
+        for a, e in zip(actual, expected):
+            assert a.five_utr.regions() == list(e.five_utr.regions())
+
+    def test_invalid_workers(self, fpath_small_gtf: str):
+        with pytest.raises(ValueError):
+            read_gtf(fpath_small_gtf, workers=0)
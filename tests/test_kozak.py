@@ -0,0 +1,81 @@
+import random
+
+import numpy as np
+import pytest
+
+from utrfx.kozak import DEFAULT_KOZAK_PWM, KOZAK_OFFSETS, score_kozak, score_start_codons
+from utrfx.sequence import NUCLEOTIDES
+from utrfx.uorf import UORFsProcessor
+
+
+def naive_score(sequence: str, position: int, pwm: np.ndarray) -> float:
+    score = 0.
+    for row, offset in enumerate(KOZAK_OFFSETS):
+        i = position + offset
+        if 0 <= i < len(sequence) and sequence[i] in NUCLEOTIDES:
+            score += pwm[row, NUCLEOTIDES.index(sequence[i])]
+    return score
+
+
+class TestScoreKozak:
+
+    def test_consensus_scores_highest(self):
+        sequences = ["GCCACCATGG", "GCCGCCATGG", "TTTTTTATGT", "GCCTCCATGT"]
+        sequences = [seq + "CC" for seq in sequences]
+
+        scores = score_kozak(sequences, np.arange(4), np.full(4, 6))
+
+        assert scores[0] == pytest.approx(scores[1])
+        assert scores[0] > scores[3] > scores[2]
+        assert scores[0] == pytest.approx(DEFAULT_KOZAK_PWM.max(axis=1).sum(), abs=1.)
+
+    def test_matches_naive_scoring(self):
+        rng = random.Random(13)
+        sequences = ["".join(rng.choice("ACGTN") for _ in range(rng.randint(1, 40))) for _ in range(50)]
+        pwm = np.array([[rng.uniform(-2, 2) for _ in NUCLEOTIDES] for _ in KOZAK_OFFSETS])
+        seq_indices = np.array([i for i, seq in enumerate(sequences) for _ in range(3)])
+        positions = np.array([rng.randrange(len(sequences[i])) for i in seq_indices])
+
+        scores = score_kozak(sequences, seq_indices, positions, pwm=pwm)
+
+        expected = [naive_score(sequences[i], pos, pwm) for i, pos in zip(seq_indices, positions)]
+        assert scores.tolist() == pytest.approx(expected)
+
+    def test_invalid_pwm(self):
+        with pytest.raises(ValueError):
+            score_kozak(["ATG"], np.array([0]), np.array([0]), pwm=np.zeros((10, 4)))
+
+
+class TestScoreStartCodons:
+
+    def test_score_start_codons(self):
+        transcripts = [
+            ("TX1", "CCATGACCGCCACCATGGCC", 14),
+            ("TX2", "ATGCCC", 0),
+            ("TX3", "GGATGATGCCATGAAA", 10),
+        ]
+
+        df = score_start_codons(transcripts)
+
+        assert list(df.columns) == ["tx_id", "position", "is_cds_start", "score"]
+        assert df["tx_id"].tolist() == ["TX1", "TX1", "TX2", "TX3", "TX3", "TX3"]
+        assert df["position"].tolist() == [2, 14, 0, 2, 5, 10]
+        assert df["is_cds_start"].tolist() == [False, True, True, False, False, True]
+        expected = [naive_score(seq, pos, DEFAULT_KOZAK_PWM)
+                    for (_, seq, _), pos in zip([transcripts[0]] * 2 + [transcripts[1]] + [transcripts[2]] * 3,
+                                                df["position"])]
+        assert df["score"].tolist() == pytest.approx(expected)
+
+    def test_invalid_cds_start(self):
+        with pytest.raises(ValueError):
+            score_start_codons([("TX1", "ATG", 4)])
+
+
+def test_uorfs_processor_kozak_scores():
+    five_utr = "GCCACCATGTAACCATGTGATT"
+    tx_seq = five_utr + "ATGGCCTAA"
+    processor = UORFsProcessor.from_sequences("TX1", tx_seq, five_utr)
+
+    assert processor.kozak_scores() == pytest.approx([naive_score(tx_seq, 6, DEFAULT_KOZAK_PWM),
+                                                      naive_score(tx_seq, 14, DEFAULT_KOZAK_PWM)])
+    assert processor.cds_kozak_score() == pytest.approx(naive_score(tx_seq, len(five_utr), DEFAULT_KOZAK_PWM))
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from utrfx.genome import GenomeBuild, Strand
+from utrfx.gtf_io import iter_gtf_transcripts, read_gtf_into_txs
+from utrfx.model import TranscriptTable
+
+
+@pytest.fixture(scope="module")
+def transcripts(fpath_small_gtf: str, genome_build: GenomeBuild):
+    return read_gtf_into_txs(fpath_small_gtf, genome_build)
+
+@pytest.fixture(scope="module")
+def table(transcripts, genome_build: GenomeBuild) -> TranscriptTable:
+    return TranscriptTable.from_transcripts(transcripts, genome_build)
+
+
+class TestTranscriptTable:
+
+    def test_columns(self, table: TranscriptTable, genome_build: GenomeBuild):
+        assert len(table) == 3
+        assert table.region_count() == 4
+        assert table.tx_ids.tolist() == ["ENST00000000001.1", "ENST00000000002.1", "ENST00000000005.1"]
+        assert table.offsets.tolist() == [0, 2, 3, 4]
+        assert table.starts.tolist()[:2] == [1000, 2000]
+        assert table.ends.tolist()[:2] == [1100, 2050]
+        assert table.strands.tolist() == [1, 1, -1, 1]
+
+        chr22 = genome_build.contigs.index(genome_build.contig_by_name("chr22"))
+        assert np.all(table.contig_codes[:3] == chr22)
+
+    def test_views(self, table: TranscriptTable, transcripts):
+        for i, tx in enumerate(transcripts):
+            view = table[i]
+            assert view.tx_id == tx.tx_id
+            assert view.five_utr.regions() == list(tx.five_utr.regions())
+
+        assert table[-1].tx_id == "ENST00000000005.1"
+        assert table.region(2).strand == Strand.NEGATIVE
+        assert [tx.tx_id for tx in table] == [tx.tx_id for tx in transcripts]
+
+        with pytest.raises(IndexError):
+            table[3]
+
+    def test_region_array(self, table: TranscriptTable):
+        array = table.region_array()
+
+        assert len(array) == table.region_count()
+        assert list(array) == [table.region(i) for i in range(table.region_count())]
+
+    def test_from_iterator(self, fpath_small_gtf: str, genome_build: GenomeBuild):
+        table = TranscriptTable.from_transcripts(iter_gtf_transcripts(fpath_small_gtf, genome_build), genome_build)
+
+        assert len(table) == 3
+
+    def test_invalid_offsets(self, genome_build: GenomeBuild):
+        with pytest.raises(ValueError):
+            TranscriptTable(genome_build.contigs, ["A"], [0], [], [], [], [])
@@ -0,0 +1,88 @@
+import random
+
+import numpy as np
+import pytest
+
+from utrfx.sequence import GCIndex, codon_code, codon_codes, encode_sequences
+
+
+def test_encode_sequences():
+    codes, offsets = encode_sequences(["ACGT", "", "TNa"])
+
+    assert codes.tolist() == [0, 1, 2, 3, 3, 4, 4]
+    assert offsets.tolist() == [0, 4, 4, 7]
+
+
+def test_encode_no_sequences():
+    codes, offsets = encode_sequences([])
+
+    assert len(codes) == 0
+    assert offsets.tolist() == [0]
+
+
+def test_codon_codes():
+    codes, _ = encode_sequences(["ATGTAAN"])
+
+    assert codon_codes(codes).tolist() == [codon_code(codon) for codon in ("ATG", "TGT", "GTA", "TAA", "AAN")]
+    assert len(set(codon_code(a + b + c) for a in "ACGT" for b in "ACGT" for c in "ACGT")) == 64
+    assert len(codon_codes(np.zeros(2, dtype=np.uint8))) == 0
+
+
+def test_codon_code_of_invalid_codon():
+    with pytest.raises(ValueError):
+        codon_code("AT")
+
+
+class TestGCIndex:
+
+    @pytest.fixture
+    def sequence(self) -> str:
+        rng = random.Random(5)
+        return "".join(rng.choice("ACGTN") for _ in range(200))
+
+    def test_gc(self, sequence: str):
+        index = GCIndex(sequence)
+
+        assert len(index) == len(sequence)
+        for start, end in ((0, 1), (0, 200), (17, 93), (199, 200)):
+            window = sequence[start:end]
+            assert index.gc_count(start, end) == window.count("G") + window.count("C")
+            assert index.gc(start, end) == ((window.count("G") + window.count("C")) / len(window)) * 100
+
+    def test_gc_batch(self, sequence: str):
+        index = GCIndex(sequence)
+        starts = np.array([0, 5, 10, 50])
+        ends = np.array([10, 5, 110, 200])
+
+        actual = index.gc_batch(starts, ends)
+
+        assert index.gc_counts(starts, ends).tolist() == [index.gc_count(s, e) for s, e in zip(starts, ends)]
+        assert actual[[0, 2, 3]].tolist() == [index.gc(s, e) for s, e in zip(starts[[0, 2, 3]], ends[[0, 2, 3]])]
+        assert np.isnan(actual[1])
+
+    def test_sliding_gc(self, sequence: str):
+        index = GCIndex(sequence)
+
+        actual = index.sliding_gc(20, step=7)
+
+        assert len(actual) == len(range(0, 181, 7))
+        assert actual[3] == index.gc(21, 41)
+        assert len(GCIndex("ACG").sliding_gc(5)) == 0
+
+    def test_from_codes(self):
+        codes, offsets = encode_sequences(["GGCC", "ATAT", "GATC"])
+        index = GCIndex.from_codes(codes)
+
+        assert index.gc_batch(offsets[:-1], offsets[1:]).tolist() == [100.0, 0.0, 50.0]
+
+    def test_invalid_windows(self, sequence: str):
+        index = GCIndex(sequence)
+
+        with pytest.raises(ValueError):
+            index.gc(10, 10)
+        with pytest.raises(ValueError):
+            index.gc_count(10, 201)
+        with pytest.raises(ValueError):
+            index.gc_counts(np.array([5]), np.array([4]))
+        with pytest.raises(ValueError):
+            index.sliding_gc(0)
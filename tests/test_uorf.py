@@ -1,8 +1,14 @@
 import pytest
+import random
 import typing
 import os
 
-from utrfx.uorf import UORFsProcessor
+import numpy as np
+
+from utrfx.uorf import (
+    DEFAULT_START_CODONS, NEAR_COGNATE_START_CODONS, ORFType, UORFsProcessor, compute_uorf_features, find_orfs_batch,
+    find_uorfs, find_uorfs_batch, iter_uorfs_processors,
+)
 
 @pytest.fixture(scope="session")
 def fpath_test_dir() -> str:
@@ -66,3 +72,340 @@ def test_gc_content_10nt_after_uorf(example_uorfs: "UORFsProcessor"):
 
     assert example_uorfs.gc_content_10nt_after_uorf() == [90.0, 90.0, 70.0]
 
+
+class TestIterUORFsProcessors:
+
+    @pytest.fixture
+    def fpath_multi_fasta(self, fpath_fasta: str, tmp_path) -> str:
+        with open(fpath_fasta) as fh:
+            sample = fh.read()
+        non_coding = ">ENST00000000099.1 FAKE-201 cdna:lncRNA\nATGAAATAGCCC\n"
+        renamed = sample.replace("ENST00000381418.9", "ENST00000381418.10").replace("HR-202", "HR-203")
+
+        fpath = tmp_path / "multi.fa"
+        fpath.write_text(sample + non_coding + renamed)
+        return str(fpath)
+
+    def test_iter_uorfs_processors(self, fpath_multi_fasta: str, example_uorfs: UORFsProcessor):
+        processors = list(iter_uorfs_processors(fpath_multi_fasta))
+
+        assert [p.tx_id for p in processors] == ["ENST00000381418.9", "ENST00000381418.10"]
+        for processor in processors:
+            assert processor.tx_sequence == example_uorfs.tx_sequence
+            assert processor.five_utr_sequence == example_uorfs.five_utr_sequence
+            assert processor.uorfs == example_uorfs.uorfs
+            assert processor.gc_content_10nt_after_uorf() == [90.0, 90.0, 70.0]
+
+    def test_iter_uorfs_processors_is_lazy(self, fpath_multi_fasta: str):
+        processors = iter_uorfs_processors(fpath_multi_fasta)
+
+        assert next(processors).tx_id == "ENST00000381418.9"
+
+    def test_from_sequences(self):
+        processor = UORFsProcessor.from_sequences("TX1", "CCATGTTTTAGCCATGCCC", "CCATGTTTTAGCC")
+
+        assert processor.uorfs == ["ATGTTTTAG"]
+        assert processor.intercistonic_distance() == [2]
+
+
+def naive_uorfs(
+    sequence: str,
+    start_codons: typing.Sequence[str] = ("ATG",),
+) -> typing.List[typing.Tuple[int, int]]:
+    uorfs = []
+    for start in range(len(sequence) - 2):
+        if sequence[start:start + 3] not in start_codons:
+            continue
+        for i in range(start, len(sequence) - 2, 3):
+            if sequence[i:i + 3] in ("TAA", "TAG", "TGA"):
+                uorfs.append((start, i + 3))
+                break
+    return uorfs
+
+
+class TestFindUORFs:
+
+    def test_find_uorfs(self):
+        assert find_uorfs("") == []
+        assert find_uorfs("ATGTAA") == [(0, 6)]
+        assert find_uorfs("ATGATGTAG") == [(0, 9), (3, 9)]
+        assert find_uorfs("CATGCCCTAATGA") == [(1, 10)]
+        assert find_uorfs("ATGCC") == []
+
+    def test_find_uorfs_matches_naive_scan(self):
+        rng = random.Random(42)
+        for _ in range(200):
+            sequence = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 300)))
+            assert find_uorfs(sequence) == naive_uorfs(sequence)
+
+    def test_near_cognate_start_codons(self):
+        start_codons = DEFAULT_START_CODONS + NEAR_COGNATE_START_CODONS
+
+        assert find_uorfs("CTGTAAATGTAG", start_codons=["CTG"]) == [(0, 6)]
+        assert find_uorfs("CTGTAAATGTAG", start_codons=start_codons) == [(0, 6), (6, 12)]
+        # The start codon `ATT` overlaps the stop codon `TAG`.
+        assert find_uorfs("ATTAGTTAA", start_codons=start_codons) == [(0, 9)]
+
+        rng = random.Random(11)
+        for _ in range(200):
+            sequence = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 300)))
+            assert find_uorfs(sequence, start_codons=start_codons) == naive_uorfs(sequence, start_codons)
+
+    def test_invalid_start_codons(self):
+        for start_codons in ([], ["AT"], ["ATN"], ["TAA"], "ATG"):
+            with pytest.raises(ValueError):
+                find_uorfs("ATGTAA", start_codons=start_codons)
+
+    def test_uorf_offsets(self, example_uorfs: UORFsProcessor):
+        assert [end - start for start, end in example_uorfs.uorf_offsets] == [51, 105, 66]
+        assert [example_uorfs.five_utr_sequence[start:end] for start, end in example_uorfs.uorf_offsets] == example_uorfs.uorfs
+
+
+class TestUORFRecords:
+
+    def test_uorf_records(self, example_uorfs: UORFsProcessor):
+        records = example_uorfs.uorf_records
+
+        assert records["length"].tolist() == [51, 105, 66]
+        assert records["start_codon"].tolist() == [b"ATG", b"ATG", b"ATG"]
+        assert records["frame"].tolist() == [start % 3 for start in records["start"].tolist()]
+        assert (records["stop"] - records["start"]).tolist() == records["length"].tolist()
+
+    def test_repeated_uorf_sequences(self):
+        # The nested "ATGTAA" also occurs at the start of the 5'UTR.
+        processor = UORFsProcessor.from_sequences("TX1", "ATGTAACCATGATGTAACCATGCCC", "ATGTAACCATGATGTAACC")
+
+        assert processor.uorf_offsets == [(0, 6), (8, 17), (11, 17)]
+        assert processor.intercistonic_distance() == [13, 2, 2]
+        assert processor.uorfs_with_20nt_more == ["ATGTAACCATGATGTAACC", "ATGATGTAACC", "ATGTAACC"]
+        assert processor.gc_content_10nt_after_uorf() == [40.0, 20.0, 20.0]
+
+    def test_no_uorfs(self):
+        processor = UORFsProcessor.from_sequences("TX1", "CCCCATGCCC", "CCCC")
+
+        assert len(processor.uorf_records) == 0
+        assert processor.uorfs_lengths() == []
+        assert processor.intercistonic_distance() == []
+
+
+class TestFindUORFsBatch:
+
+    def test_find_uorfs_batch_matches_find_uorfs(self):
+        rng = random.Random(7)
+        sequences = ["", "AT", "ATGTAA", "ATGNTAA", "NNATGTAGN"]
+        sequences += ["".join(rng.choice("ACGTN" if i % 5 == 0 else "ACGT") for _ in range(rng.randint(0, 200)))
+                      for i in range(300)]
+
+        offsets, records = find_uorfs_batch(sequences)
+
+        assert len(offsets) == len(sequences) + 1
+        for i, sequence in enumerate(sequences):
+            batch = records[offsets[i]:offsets[i + 1]]
+            assert list(zip(batch["start"].tolist(), batch["stop"].tolist())) == find_uorfs(sequence)
+            assert batch["length"].tolist() == [stop - start for start, stop in find_uorfs(sequence)]
+
+    def test_find_uorfs_batch_example(self, example_uorfs: UORFsProcessor):
+        offsets, records = find_uorfs_batch([example_uorfs.five_utr_sequence, example_uorfs.five_utr_sequence])
+
+        assert offsets.tolist() == [0, 3, 6]
+        assert np.array_equal(records[:3], example_uorfs.uorf_records)
+        assert np.array_equal(records[3:], example_uorfs.uorf_records)
+
+    def test_find_uorfs_batch_near_cognate_start_codons(self):
+        rng = random.Random(3)
+        start_codons = DEFAULT_START_CODONS + NEAR_COGNATE_START_CODONS
+        sequences = ["".join(rng.choice("ACGTN") for _ in range(rng.randint(0, 200))) for _ in range(200)]
+
+        offsets, records = find_uorfs_batch(sequences, start_codons=start_codons)
+
+        for i, sequence in enumerate(sequences):
+            batch = records[offsets[i]:offsets[i + 1]]
+            uorfs = find_uorfs(sequence, start_codons=start_codons)
+            assert list(zip(batch["start"].tolist(), batch["stop"].tolist())) == uorfs
+            assert batch["start_codon"].tolist() == [sequence[start:start + 3].encode() for start, _ in uorfs]
+
+    def test_processor_start_codons(self):
+        processor = UORFsProcessor.from_sequences("TX1", "GTGCCCTGAATGTAACCC", "GTGCCCTGAATGTAA",
+                                                  start_codons=("ATG", "GTG"))
+
+        assert processor.uorf_offsets == [(0, 9), (9, 15)]
+        assert processor.uorf_records["start_codon"].tolist() == [b"GTG", b"ATG"]
+
+    def test_find_uorfs_batch_empty(self):
+        offsets, records = find_uorfs_batch([])
+
+        assert offsets.tolist() == [0]
+        assert len(records) == 0
+
+
+def naive_orfs(tx_seq: str, cds_start: int) -> typing.List[typing.Tuple[int, int, ORFType]]:
+    orfs = []
+    for start in range(cds_start):
+        if tx_seq[start:start + 3] != "ATG":
+            continue
+        stop = -1
+        for i in range(start, len(tx_seq) - 2, 3):
+            if tx_seq[i:i + 3] in ("TAA", "TAG", "TGA"):
+                stop = i + 3
+                break
+        if stop != -1 and stop <= cds_start:
+            orf_type = ORFType.UORF
+        elif (cds_start - start) % 3 == 0:
+            orf_type = ORFType.N_TERMINAL_EXTENSION
+        else:
+            orf_type = ORFType.OORF
+        orfs.append((start, stop, orf_type))
+    return orfs
+
+
+class TestFindORFsBatch:
+
+    def test_find_orfs_batch(self):
+        five_utr = "ATGTAACATGCCATGCCC"
+        tx_seq = five_utr + "ATGCTAAGGTGA"
+
+        offsets, records = find_orfs_batch([tx_seq], [len(five_utr)])
+
+        assert offsets.tolist() == [0, 3]
+        assert records["start"].tolist() == [0, 7, 12]
+        assert records["stop"].tolist() == [6, 25, 30]
+        assert records["length"].tolist() == [6, 18, 18]
+        assert records["orf_type"].tolist() == [ORFType.UORF, ORFType.OORF, ORFType.N_TERMINAL_EXTENSION]
+        assert records["start_codon"].tolist() == [b"ATG"] * 3
+
+    def test_matches_naive_classification(self):
+        rng = random.Random(5)
+        tx_seqs, cds_starts = [], []
+        for _ in range(200):
+            tx_seqs.append("".join(rng.choice("ACGT") for _ in range(rng.randint(0, 300))))
+            cds_starts.append(rng.randint(0, len(tx_seqs[-1])))
+
+        offsets, records = find_orfs_batch(tx_seqs, cds_starts)
+
+        for i, (tx_seq, cds_start) in enumerate(zip(tx_seqs, cds_starts)):
+            batch = records[offsets[i]:offsets[i + 1]]
+            orfs = list(zip(batch["start"].tolist(), batch["stop"].tolist(), batch["orf_type"].tolist()))
+            assert orfs == naive_orfs(tx_seq, cds_start)
+            uorfs = batch[batch["orf_type"] == ORFType.UORF]
+            assert list(zip(uorfs["start"].tolist(), uorfs["stop"].tolist())) == find_uorfs(tx_seq[:cds_start])
+
+    def test_without_stop_codon(self):
+        offsets, records = find_orfs_batch(["CATGCCATGCC"], [6])
+
+        assert records["stop"].tolist() == [-1]
+        assert records["length"].tolist() == [-1]
+        assert records["orf_type"].tolist() == [ORFType.OORF]
+
+    def test_invalid_cds_starts(self):
+        with pytest.raises(ValueError):
+            find_orfs_batch(["ATGTAA"], [7])
+        with pytest.raises(ValueError):
+            find_orfs_batch(["ATGTAA"], [0, 1])
+
+    def test_processor_orf_records(self, example_uorfs: UORFsProcessor):
+        records = example_uorfs.orf_records
+        uorfs = records[records["orf_type"] == ORFType.UORF]
+
+        assert list(zip(uorfs["start"].tolist(), uorfs["stop"].tolist())) == example_uorfs.uorf_offsets
+        assert len(records) > len(uorfs)
+
+
+class TestLazyUORFsProcessor:
+
+    def test_construction_does_not_read_the_file(self):
+        processor = UORFsProcessor(fpath="does-not-exist.fa")
+
+        with pytest.raises(FileNotFoundError):
+            processor.number_of_uorfs()
+
+    def test_features_are_computed_on_demand(self, fpath_fasta: str):
+        processor = UORFsProcessor(fpath=fpath_fasta)
+
+        assert processor.number_of_uorfs() == 3
+        assert "_uorfs" not in processor.__dict__
+        assert "_uorfs_with_20nt_more" not in processor.__dict__
+
+    def test_features_are_cached(self, fpath_fasta: str):
+        processor = UORFsProcessor(fpath=fpath_fasta)
+
+        gc_content = processor.gc_content()
+        assert "_gc_content" in processor.__dict__
+        assert processor.gc_content() == gc_content
+
+    def test_cached_features_are_not_shared(self, fpath_fasta: str):
+        processor = UORFsProcessor(fpath=fpath_fasta)
+        uorfs = processor.uorfs
+        distances = processor.intercistonic_distance()
+
+        processor.uorfs.clear()
+        processor.intercistonic_distance().append(-1)
+
+        assert processor.uorfs == uorfs
+        assert processor.intercistonic_distance() == distances
+        with pytest.raises(ValueError):
+            processor.uorf_records["start"] = 0
+
+
+class TestComputeUORFFeatures:
+
+    @pytest.fixture
+    def sequences(self, example_uorfs: UORFsProcessor) -> typing.Mapping[str, str]:
+        rng = random.Random(11)
+        sequences = {example_uorfs.tx_id: example_uorfs.five_utr_sequence, "EMPTY": ""}
+        for i in range(50):
+            sequences[f"TX{i}"] = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 300)))
+        return sequences
+
+    def test_uorf_level(self, sequences: typing.Mapping[str, str]):
+        df = compute_uorf_features(sequences)
+
+        assert list(df.columns) == ["tx_id", "start", "stop", "frame", "start_codon", "length", "gc_content",
+                                    "intercistronic_distance", "gc_content_10nt_after"]
+        for tx_id, five_utr_seq in sequences.items():
+            if not five_utr_seq:
+                continue
+            processor = UORFsProcessor.from_sequences(tx_id, five_utr_seq, five_utr_seq)
+            rows = df[df["tx_id"] == tx_id]
+            assert list(zip(rows["start"], rows["stop"])) == processor.uorf_offsets
+            assert rows["start_codon"].tolist() == ["ATG"] * len(rows)
+            assert rows["length"].tolist() == processor.uorfs_lengths()
+            assert rows["gc_content"].tolist() == processor.gc_content()
+            assert rows["intercistronic_distance"].tolist() == processor.intercistonic_distance()
+            assert rows["gc_content_10nt_after"].tolist() == processor.gc_content_10nt_after_uorf()
+
+    def test_uorf_level_dtypes(self, sequences: typing.Mapping[str, str]):
+        df = compute_uorf_features(sequences, features=["length", "gc_content"])
+
+        assert list(df.columns) == ["tx_id", "start", "stop", "frame", "start_codon", "length", "gc_content"]
+        assert df["start"].dtype == np.int64
+        assert df["frame"].dtype == np.int8
+        assert df["length"].dtype == np.int64
+        assert df["gc_content"].dtype == np.float64
+
+    def test_transcript_level(self, sequences: typing.Mapping[str, str], example_uorfs: UORFsProcessor):
+        df = compute_uorf_features(sequences.items(), level="transcript")
+
+        assert list(df.columns) == ["tx_id", "five_utr_length", "number_of_uorfs", "five_utr_gc_content"]
+        assert df["tx_id"].tolist() == list(sequences)
+        assert df["five_utr_length"].tolist() == [len(seq) for seq in sequences.values()]
+        assert df["number_of_uorfs"].tolist() == [len(find_uorfs(seq)) for seq in sequences.values()]
+        assert df.loc[0, "number_of_uorfs"] == example_uorfs.number_of_uorfs()
+        assert np.isnan(df.loc[1, "five_utr_gc_content"])
+
+    def test_start_codons(self, sequences: typing.Mapping[str, str]):
+        start_codons = DEFAULT_START_CODONS + NEAR_COGNATE_START_CODONS
+        df = compute_uorf_features(sequences, features=["length"], start_codons=start_codons)
+
+        for tx_id, five_utr_seq in sequences.items():
+            rows = df[df["tx_id"] == tx_id]
+            uorfs = find_uorfs(five_utr_seq, start_codons=start_codons)
+            assert list(zip(rows["start"], rows["stop"])) == uorfs
+            assert rows["start_codon"].tolist() == [five_utr_seq[start:start + 3] for start, _ in uorfs]
+
+    def test_invalid_arguments(self, sequences: typing.Mapping[str, str]):
+        with pytest.raises(ValueError):
+            compute_uorf_features(sequences, level="exon")
+        with pytest.raises(ValueError):
+            compute_uorf_features(sequences, start_codons=["TGA"])
+        with pytest.raises(ValueError):
+            compute_uorf_features(sequences, features=["number_of_uorfs"], level="uorf")
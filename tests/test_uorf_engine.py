@@ -0,0 +1,107 @@
+import os
+import random
+
+import pandas as pd
+import pytest
+
+from utrfx import uorf_engine
+from utrfx.uorf import compute_uorf_features
+from utrfx.uorf_engine import UORFFeatureEngine
+
+
+PARENT_PID = os.getpid()
+
+
+def crash_on_marker(items, features, level, start_codons):
+    # Kill the worker process like a segfault or the OOM killer would.
+    if any(tx_id == "CRASH" for tx_id, _ in items):
+        os._exit(1)
+    return compute_uorf_features(items, features=features, level=level)
+
+
+def raise_on_marker_in_workers(items, features, level, start_codons):
+    if os.getpid() == PARENT_PID:
+        raise RuntimeError("Computed in the main process")
+    if any(tx_id == "BAD" for tx_id, _ in items):
+        raise ValueError("Bad transcript")
+    return compute_uorf_features(items, features=features, level=level)
+
+
+@pytest.fixture(scope="module")
+def sequences():
+    rng = random.Random(3)
+    return {f"TX{i}": "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 200))) for i in range(100)}
+
+
+class TestUORFFeatureEngine:
+
+    @pytest.mark.parametrize("workers, chunk_size", [(1, 7), (2, 7), (2, 1000)])
+    def test_compute(self, sequences, workers: int, chunk_size: int):
+        engine = UORFFeatureEngine(workers=workers, chunk_size=chunk_size)
+
+        actual = engine.compute(sequences)
+
+        pd.testing.assert_frame_equal(actual, compute_uorf_features(sequences))
+        assert engine.failures == []
+
+    def test_iter_chunks_keeps_the_input_order(self, sequences):
+        engine = UORFFeatureEngine(level="transcript", workers=2, chunk_size=10)
+
+        chunks = list(engine.iter_chunks(iter(sequences.items())))
+
+        assert len(chunks) == 10
+        assert pd.concat(chunks)["tx_id"].tolist() == list(sequences)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_failed_transcript_is_skipped(self, sequences, workers: int, caplog):
+        items = list(sequences.items())
+        items[25] = ("BAD", "ACGTéATG")
+        engine = UORFFeatureEngine(level="transcript", workers=workers, chunk_size=10)
+
+        actual = engine.compute(items)
+
+        # The chunk-mates of the bad transcript are kept.
+        good = items[:25] + items[26:]
+        pd.testing.assert_frame_equal(actual, compute_uorf_features(good, level="transcript"))
+        assert [(failure.chunk, failure.tx_ids) for failure in engine.failures] == [(2, ("BAD",))]
+        assert engine.failures[0].error.startswith("UnicodeEncodeError")
+        assert "Left out 1 transcripts" in caplog.text
+
+    def test_failed_chunk_is_retried_in_the_pool(self, sequences, monkeypatch):
+        monkeypatch.setattr(uorf_engine, "_compute_chunk", raise_on_marker_in_workers)
+        items = list(sequences.items())
+        items[25] = ("BAD", "ATGTAA")
+        engine = UORFFeatureEngine(level="transcript", workers=2, chunk_size=10)
+
+        actual = engine.compute(items)
+
+        assert actual["tx_id"].tolist() == [tx_id for tx_id, _ in items[:25] + items[26:]]
+        assert [(failure.chunk, failure.tx_ids) for failure in engine.failures] == [(2, ("BAD",))]
+        assert engine.failures[0].error == "ValueError: Bad transcript"
+
+    def test_crashed_worker_is_recovered(self, sequences, monkeypatch):
+        monkeypatch.setattr(uorf_engine, "_compute_chunk", crash_on_marker)
+        items = list(sequences.items())
+        items[45] = ("CRASH", "ATGTAA")
+        items[47] = ("CRASH", "ATGTAG")
+        engine = UORFFeatureEngine(level="transcript", workers=2, chunk_size=10)
+
+        actual = engine.compute(items)
+
+        # The chunk-mates of the transcripts that kill the worker are kept.
+        assert actual["tx_id"].tolist() == [tx_id for tx_id, _ in items if tx_id != "CRASH"]
+        assert [(failure.chunk, failure.tx_ids) for failure in engine.failures] == [(4, ("CRASH",)), (4, ("CRASH",))]
+        assert all(failure.error.startswith("BrokenProcessPool") for failure in engine.failures)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            UORFFeatureEngine(workers=0)
+        with pytest.raises(ValueError):
+            UORFFeatureEngine(chunk_size=0)
+        with pytest.raises(ValueError):
+            UORFFeatureEngine(level="exon")
+
+    def test_no_sequences(self):
+        engine = UORFFeatureEngine(workers=2)
+
+        assert len(engine.compute({})) == 0